@@ -1,21 +1,83 @@
 import os
-import json
+import re
+import hashlib
+import functools
+import mmap
+import mimetypes
+import time
+import orjson
+import queue
 import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from werkzeug.middleware.proxy_fix import ProxyFix
 from dotenv import load_dotenv
-from latest_extractor import LatestNewsExtractor, initialize_appwrite, upload_to_appwrite
+from latest_extractor import LatestNewsExtractor, initialize_appwrite, upload_bytes_to_appwrite
 from google.cloud import texttospeech
 from google.oauth2 import service_account
 import shutil
 import atexit
 
+try:
+    import fcntl
+except ImportError:
+    # No flock on Windows; extraction is then only guarded within one process
+    fcntl = None
+
 
 # Load environment variables
 load_dotenv()
 
+def orjson_default(obj):
+    """Encode the few types orjson does not handle natively"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that encodes with orjson, so jsonify() skips the stdlib encoder"""
+    option = orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=orjson_default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=orjson_default, option=self.option),
+            mimetype="application/json"
+        )
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compress JSON responses (brotli preferred, gzip fallback), including the streamed NDJSON
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'application/x-ndjson']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_BR_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_STREAMS'] = True
+Compress(app)
+
+# Static bytes can be handed to the front-end server: USE_XACCEL for nginx's internal
+# /_protected_images/ location, USE_X_SENDFILE for servers that honour X-Sendfile
+USE_XACCEL = os.getenv('USE_XACCEL', '').lower() in ('1', 'true', 'yes')
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
+# Behind such a proxy, trust its forwarded host/proto so image URLs point at the public origin
+if USE_XACCEL or app.config['USE_X_SENDFILE']:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
 
 # Configure logging
 import logging
@@ -46,6 +108,21 @@ else:
     logger.warning(f"Warning: TTS credentials file not found at {credentials_path}")
     credentials = None
 
+# Shared TTS client so the gRPC channel and auth are set up once per process
+_TTS_CLIENT = texttospeech.TextToSpeechClient(credentials=credentials) if credentials else None
+
+def warm_tts_client():
+    """Open the gRPC channel and fetch an auth token before the first real synthesis"""
+    try:
+        _TTS_CLIENT.list_voices(language_code='en-IN', timeout=5.0)
+        logger.info("TTS client warmed up")
+    except Exception as e:
+        logger.warning(f"TTS warm-up failed: {e}")
+
+# Warm up in the background so server start-up is not held up by the round trip
+if _TTS_CLIENT is not None:
+    threading.Thread(target=warm_tts_client, name="tts-warmup", daemon=True).start()
+
 def cleanup_creds():
     if os.path.exists(creds_path):
         try:
@@ -87,12 +164,389 @@ INDIAN_LANGUAGES = {
     'en': {'name': 'English_Indian', 'tts_code': 'en-IN'}
 }
 
-# Global cache for articles
-article_cache = {
-    "last_updated": None,
-    "articles": [],
-    "processing": False
+# Flat per-field views of INDIAN_LANGUAGES for the per-article/per-language hot loops
+_LANG_NAME = {code: info['name'] for code, info in INDIAN_LANGUAGES.items()}
+_LANG_TTS = {code: info['tts_code'] for code, info in INDIAN_LANGUAGES.items()}
+_SUPPORTED = frozenset(INDIAN_LANGUAGES)
+SUPPORTED_LANG_CODES = tuple(INDIAN_LANGUAGES)
+
+# Language summary served when no translations exist yet; built once and never mutated
+DEFAULT_LANGUAGES_DATA = {
+    code: {
+        "name": info["name"],
+        "tts_supported": bool(info.get("tts_code")),
+        "article_count": 0,
+        "article_ids": []
+    }
+    for code, info in INDIAN_LANGUAGES.items()
+}
+
+# TTS request messages are identical for every call in a language, so build them once.
+# Chirp3 HD / Kore voices are high quality; the generic params are the fallback.
+_VOICE_NAME = {code: f"{tts_code}-Chirp3-HD-Kore" for code, tts_code in _LANG_TTS.items()}
+_VOICE_PARAMS = {
+    code: texttospeech.VoiceSelectionParams(language_code=_LANG_TTS[code], name=name)
+    for code, name in _VOICE_NAME.items()
 }
+_GENERIC_VOICE_PARAMS = {
+    code: texttospeech.VoiceSelectionParams(language_code=tts_code)
+    for code, tts_code in _LANG_TTS.items()
+}
+_AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=texttospeech.AudioEncoding.MP3,
+    effects_profile_id=["high-quality-studio"]
+)
+
+# Global cache for articles: an immutable snapshot that writers replace wholesale.
+# Readers take `snap = article_snapshot` once and never see a half-updated cache.
+# `structured` lazily caches structure_one() output for this snapshot's articles.
+# `version` is local to this process (it keys in-process caches); `content_tag` hashes the
+# articles themselves, so every gunicorn worker derives the same ETags for the same content.
+ArticleSnapshot = namedtuple('ArticleSnapshot', ['articles', 'by_lang', 'by_id', 'last_updated', 'version', 'structured', 'content_tag'])
+article_snapshot = ArticleSnapshot(articles=(), by_lang={}, by_id={}, last_updated=None, version=0, structured={}, content_tag="0")
+_articles_lock = threading.RLock()
+
+def build_article_indexes(articles):
+    """Build the article ID lookup and per-language article tuples in one pass"""
+    by_id = {}
+    by_lang = {}
+    for article in articles:
+        article_id = article.get('article_id')
+        if article_id:
+            # Keep the first article for a repeated ID, matching the old linear search
+            by_id.setdefault(article_id, article)
+        for lang in article.get('translations', {}):
+            by_lang.setdefault(lang, []).append(article)
+    return by_id, {lang: tuple(lang_articles) for lang, lang_articles in by_lang.items()}
+
+def publish_articles(articles, last_updated):
+    """Index the articles and swap them in as the current snapshot"""
+    global article_snapshot
+    # Copy each article and its translations: the extraction keeps filling the caller's dicts
+    # in place, and readers iterate the snapshot's without any lock
+    articles = tuple(
+        {**article, 'translations': dict(article['translations'])} if 'translations' in article else dict(article)
+        for article in articles
+    )
+    by_id, by_lang = build_article_indexes(articles)
+    content_tag = hashlib.blake2b(
+        orjson.dumps([last_updated, articles], default=orjson_default, option=orjson.OPT_SORT_KEYS),
+        digest_size=8
+    ).hexdigest()
+    with _articles_lock:
+        # A new version also marks any rendered /news bodies as stale
+        article_snapshot = ArticleSnapshot(
+            articles=articles,
+            by_lang=by_lang,
+            by_id=by_id,
+            last_updated=last_updated,
+            version=article_snapshot.version + 1,
+            structured={},
+            content_tag=content_tag
+        )
+
+def bump_snapshot_version():
+    """Invalidate rendered /news bodies without changing the articles"""
+    global article_snapshot
+    with _articles_lock:
+        article_snapshot = article_snapshot._replace(version=article_snapshot.version + 1)
+
+# Encoded /news bodies keyed by (cache version, base URL, language, offset, limit, processing)
+RENDERED_CACHE_SIZE = 256
+_rendered = OrderedDict()
+_rendered_lock = threading.Lock()
+
+def get_rendered(key):
+    """Return a cached encoded response body, marking it recently used"""
+    with _rendered_lock:
+        body = _rendered.get(key)
+        if body is not None:
+            _rendered.move_to_end(key)
+        return body
+
+def put_rendered(key, body):
+    """Store an encoded response body, evicting the least recently used beyond the cap"""
+    with _rendered_lock:
+        _rendered[key] = body
+        _rendered.move_to_end(key)
+        while len(_rendered) > RENDERED_CACHE_SIZE:
+            _rendered.popitem(last=False)
+
+# latest_articles.json is loaded at startup and polled by a background thread for external updates
+LATEST_ARTICLES_FILE = os.path.join("output", "latest_articles.json")
+TRANSLATIONS_SUMMARY_FILE = os.path.join("output", "translations", "languages.json")
+ARTICLES_RECHECK_SECONDS = float(os.getenv('ARTICLES_RECHECK_SECONDS', 2))
+_articles_file_state = {"mtime": None}
+_articles_reload_lock = threading.Lock()
+
+# Only one extraction may run at a time across all gunicorn workers: the lock is an flock on
+# EXTRACT_LOCK_FILE; the thread lock and event guard it within this process
+EXTRACT_LOCK_FILE = os.path.join("output", ".extract.lock")
+_extract_lock = threading.Lock()
+_extract_lock_fd = None
+_extract_running = threading.Event()
+
+def acquire_extract_lock():
+    """Take the extraction lock without blocking; returns False when an extraction is already running anywhere"""
+    global _extract_lock_fd
+    if not _extract_lock.acquire(blocking=False):
+        return False
+    if fcntl is None:
+        _extract_running.set()
+        return True
+    # Any failure before the flock is held must give the thread lock back, or no later request could extract
+    try:
+        os.makedirs(os.path.dirname(EXTRACT_LOCK_FILE), exist_ok=True)
+        fd = os.open(EXTRACT_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    except BaseException:
+        _extract_lock.release()
+        raise
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        _extract_lock.release()
+        return False
+    _extract_lock_fd = fd
+    _extract_running.set()
+    return True
+
+def release_extract_lock():
+    """Release the extraction lock taken by acquire_extract_lock"""
+    global _extract_lock_fd
+    _extract_running.clear()
+    if _extract_lock_fd is not None:
+        fcntl.flock(_extract_lock_fd, fcntl.LOCK_UN)
+        os.close(_extract_lock_fd)
+        _extract_lock_fd = None
+    _extract_lock.release()
+
+def extraction_in_progress():
+    """Return True while an extraction runs in this or any other worker process"""
+    if _extract_running.is_set() or fcntl is None:
+        return _extract_running.is_set()
+    try:
+        fd = os.open(EXTRACT_LOCK_FILE, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        # A shared lock is refused only while another process holds the exclusive one
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except OSError:
+        return True
+    finally:
+        os.close(fd)
+    return False
+
+# Bounded concurrency for the network-bound translation and TTS calls
+TRANSLATION_CONCURRENCY = int(os.getenv('TRANSLATION_CONCURRENCY', 16))
+TTS_CONCURRENCY = int(os.getenv('TTS_CONCURRENCY', 8))
+_translation_pool = ThreadPoolExecutor(max_workers=TRANSLATION_CONCURRENCY, thread_name_prefix="translate")
+_tts_semaphore = threading.BoundedSemaphore(TTS_CONCURRENCY)
+_tts_chunk_pool = ThreadPoolExecutor(max_workers=TTS_CONCURRENCY, thread_name_prefix="tts")
+
+# Long summaries are voiced in sentence-aligned chunks (including the Devanagari danda)
+TTS_CHUNK_CHARS = 300
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?।])\s+')
+
+# Generated audio goes straight to Appwrite; set KEEP_LOCAL_AUDIO to also keep voice.mp3 on disk
+KEEP_LOCAL_AUDIO = os.getenv('KEEP_LOCAL_AUDIO', '').lower() in ('1', 'true', 'yes')
+
+# Persistent cache of synthesized speech so identical text is never voiced twice: one small
+# JSON file per key, laid out like translate.py's content-addressed audio cache
+TTS_CACHE_DIR = os.path.join("output", "cache", "tts")
+
+# Directories already created by this process, so repeat calls skip the makedirs stat walk
+_mkdir_done = set()
+
+def ensure_dir(path):
+    """Create a directory (and parents) once per process"""
+    if path in _mkdir_done:
+        return
+    os.makedirs(path, exist_ok=True)
+    _mkdir_done.add(path)
+
+def write_json_file(path, data, indent=True):
+    """Write data to a UTF-8 JSON file, replacing any previous version atomically"""
+    # The temp name is unique per process and thread, so concurrent writers never share one
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    os.replace(tmp_path, path)
+
+# Files at least this large are parsed from a memory map instead of a read() buffer
+JSON_MMAP_THRESHOLD = 50 * 1024 * 1024
+
+def read_json_file(path):
+    """Parse a JSON file with orjson, memory-mapping it when it is large"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        if size < JSON_MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+# Parsed JSON files keyed by path -> (mtime_ns, size, data); re-parsed only when the file changes.
+# Per-article manifests make the key space unbounded, so it is an LRU capped at JSON_CACHE_SIZE.
+JSON_CACHE_SIZE = int(os.getenv('JSON_CACHE_SIZE', '512'))
+_json_cache = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+def load_json_cached(path):
+    """Return the parsed contents of a JSON file, re-reading it only after it changes"""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _json_cache_lock:
+        hit = _json_cache.get(path)
+        if hit and hit[:2] == key:
+            _json_cache.move_to_end(path)
+            return hit[2]
+    data = read_json_file(path)
+    with _json_cache_lock:
+        _json_cache[path] = (*key, data)
+        _json_cache.move_to_end(path)
+        while len(_json_cache) > JSON_CACHE_SIZE:
+            _json_cache.popitem(last=False)
+    return data
+
+def reload_articles_if_stale():
+    """Load latest_articles.json into the cache when it is new or has changed on disk"""
+    # A running extraction publishes its own results into the cache
+    if _extract_running.is_set() and article_snapshot.articles:
+        return
+    
+    try:
+        mtime = os.stat(LATEST_ARTICLES_FILE).st_mtime
+    except FileNotFoundError:
+        return
+    if mtime == _articles_file_state["mtime"]:
+        return
+    
+    with _articles_reload_lock:
+        if mtime == _articles_file_state["mtime"]:
+            return
+        try:
+            articles = read_json_file(LATEST_ARTICLES_FILE)
+            if articles:
+                publish_articles(articles, datetime.fromtimestamp(mtime).isoformat())
+            _articles_file_state["mtime"] = mtime
+        except Exception as e:
+            logger.error(f"Error loading articles from file: {e}")
+
+def articles_watcher():
+    """Poll latest_articles.json and reload the cache when it changes"""
+    while True:
+        time.sleep(ARTICLES_RECHECK_SECONDS)
+        reload_articles_if_stale()
+
+def tts_cache_key(text, lang_code, voice_name):
+    """Build the cache key for a piece of text spoken with a given voice"""
+    return hashlib.sha256(f"{text}|{lang_code}|{voice_name}".encode('utf-8')).hexdigest()
+
+def tts_cache_entry_path(key):
+    """Return the path of the cache entry file for a key"""
+    return os.path.join(TTS_CACHE_DIR, key[:2], key[2:4], f"{key}.json")
+
+def load_tts_cache_entry(key):
+    """Read one TTS cache entry, or None if this text has not been voiced yet"""
+    path = tts_cache_entry_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        return read_json_file(path)
+    except Exception as e:
+        logger.error(f"Error loading TTS cache entry {key}: {e}")
+        return None
+
+def store_tts_cache_entry(key, file_path, file_url):
+    """Record generated audio in its own cache entry file, replaced atomically"""
+    path = tts_cache_entry_path(key)
+    try:
+        ensure_dir(os.path.dirname(path))
+        write_json_file(path, {"file_path": file_path, "appwrite_url": file_url}, indent=False)
+    except Exception as e:
+        logger.error(f"Error saving TTS cache entry {key}: {e}")
+
+def save_voice_metadata(article_lang_dir, article_id, lang_code, file_path, file_url):
+    """Save voice metadata next to the article translation"""
+    voice_metadata = {
+        "article_id": article_id,
+        "language": lang_code,
+        "language_name": _LANG_NAME[lang_code],
+        "file_path": file_path,
+        "appwrite_url": file_url,
+        "created_at": datetime.now().isoformat()
+    }
+    
+    write_json_file(os.path.join(article_lang_dir, "voice_metadata.json"), voice_metadata, indent=False)
+    update_voice_manifest(os.path.dirname(article_lang_dir), lang_code, voice_metadata)
+
+# Per-article voice_manifest.json holds every language's voice metadata in one file
+_voice_manifest_lock = threading.Lock()
+
+def update_voice_manifest(article_dir, lang_code, voice_metadata):
+    """Merge one language's voice metadata into the article's voice manifest"""
+    manifest_file = os.path.join(article_dir, "voice_manifest.json")
+    # Languages of the same article are voiced concurrently, so serialize the read-modify-write
+    with _voice_manifest_lock:
+        try:
+            manifest = read_json_file(manifest_file) or {}
+        except FileNotFoundError:
+            manifest = {}
+        except Exception as e:
+            logger.error(f"Error reading voice manifest {manifest_file}: {e}")
+            manifest = {}
+        manifest[lang_code] = voice_metadata
+        write_json_file(manifest_file, manifest, indent=False)
+
+def split_sentences(text, max_chars=TTS_CHUNK_CHARS):
+    """Split text on sentence boundaries into chunks of at most max_chars"""
+    chunks = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        if not sentence:
+            continue
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+def synthesize_chunk(text, lang_code):
+    """Synthesize one chunk of text and return the MP3 bytes"""
+    # Set up the input
+    synthesis_input = texttospeech.SynthesisInput(text=text)
+    
+    # Try with specific voice, with fallback options
+    try:
+        response = _TTS_CLIENT.synthesize_speech(
+            input=synthesis_input,
+            voice=_VOICE_PARAMS[lang_code],
+            audio_config=_AUDIO_CONFIG
+        )
+    except Exception as e:
+        logger.warning(f"Error with specific voice {_VOICE_NAME[lang_code]}, trying generic voice: {e}")
+        # Fallback to generic voice selection
+        response = _TTS_CLIENT.synthesize_speech(
+            input=synthesis_input,
+            voice=_GENERIC_VOICE_PARAMS[lang_code],
+            audio_config=_AUDIO_CONFIG
+        )
+    
+    return response.audio_content
+
+def write_audio_file(path, audio_content):
+    """Write audio bytes to disk with a single write call"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        os.write(fd, audio_content)
+    finally:
+        os.close(fd)
 
 def generate_voice_file(text, lang_code, article_id):
     """Generate a voice file for the text in specified language and return the file URL"""
@@ -101,82 +555,57 @@ def generate_voice_file(text, lang_code, article_id):
         return None
         
     try:
-        # Check if language is supported for TTS
-        if lang_code not in INDIAN_LANGUAGES:
-            logger.warning(f"Skipping voice generation: Language {lang_code} not supported")
-            return None
-            
-        # Get the TTS language code
-        tts_language_code = INDIAN_LANGUAGES[lang_code]['tts_code']
-        
-        # Create TTS client
-        client = texttospeech.TextToSpeechClient(credentials=credentials)
-        
         # Get the voice name - Chirp3 HD or Kore voices are high quality
-        voice_name = f"{tts_language_code}-Chirp3-HD-Kore"
+        voice_name = _VOICE_NAME[lang_code]
         
-        # Set up the input
-        synthesis_input = texttospeech.SynthesisInput(text=text)
-        
-        # Set up the voice
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=tts_language_code,
-            name=voice_name
-        )
+        # Create article language directory
+        article_lang_dir = os.path.join("output", "translations", "articles", article_id, lang_code)
+        ensure_dir(article_lang_dir)
         
-        # Set up the audio config
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            effects_profile_id=["high-quality-studio"]
-        )
+        # Reuse audio already generated for the same text and voice
+        cache_key = tts_cache_key(text, lang_code, voice_name)
+        cached = load_tts_cache_entry(cache_key)
+        if cached and cached.get('appwrite_url'):
+            logger.info(f"Using cached speech for article {article_id} in {lang_code}")
+            save_voice_metadata(article_lang_dir, article_id, lang_code, cached.get('file_path'), cached['appwrite_url'])
+            return cached['appwrite_url']
         
         logger.info(f"Generating speech for article {article_id} in {lang_code}")
         
-        # Try with specific voice, with fallback options
-        try:
-            response = client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
-        except Exception as e:
-            logger.warning(f"Error with specific voice {voice_name}, trying generic voice: {e}")
-            # Fallback to generic voice selection
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=tts_language_code
-            )
-            response = client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
-        
-        # Create article language directory
-        article_lang_dir = os.path.join("output", "translations", "articles", article_id, lang_code)
-        os.makedirs(article_lang_dir, exist_ok=True)
+        # Synthesize sentence chunks concurrently; MP3 frames from the same
+        # encoder settings can be concatenated directly
+        chunks = split_sentences(text)
+        if not chunks:
+            logger.warning(f"Skipping voice generation for article {article_id}: No text to speak")
+            return None
+        if len(chunks) == 1:
+            audio_content = synthesize_chunk(chunks[0], lang_code)
+        else:
+            logger.info(f"Splitting speech for article {article_id} into {len(chunks)} chunks")
+            audio_content = b"".join(_tts_chunk_pool.map(
+                lambda chunk: synthesize_chunk(chunk, lang_code), chunks
+            ))
         
-        # Create output path
-        output_file = os.path.join(article_lang_dir, "voice.mp3")
+        # Optionally keep a local copy, written while the upload is in flight
+        output_file = None
+        write_future = None
+        if KEEP_LOCAL_AUDIO:
+            output_file = os.path.join(article_lang_dir, "voice.mp3")
+            write_future = _tts_chunk_pool.submit(write_audio_file, output_file, audio_content)
         
-        # Write the audio content
-        with open(output_file, "wb") as out:
-            out.write(response.audio_content)
+        # Upload the audio bytes to Appwrite and get URL
+        file_url = upload_bytes_to_appwrite(
+            appwrite_storage, audio_content, f"{article_id}_{lang_code}.mp3", APPWRITE_AUDIO_BUCKET_ID
+        )
+        if write_future:
+            write_future.result()
         
-        # Upload to Appwrite and get URL
-        file_url = upload_to_appwrite(appwrite_storage, output_file, APPWRITE_AUDIO_BUCKET_ID)
+        # Only cache audio that made it to Appwrite
+        if file_url:
+            store_tts_cache_entry(cache_key, output_file, file_url)
         
         # Save voice metadata
-        voice_metadata = {
-            "article_id": article_id,
-            "language": lang_code,
-            "language_name": INDIAN_LANGUAGES[lang_code]['name'],
-            "file_path": output_file,
-            "appwrite_url": file_url,
-            "created_at": datetime.now().isoformat()
-        }
-        
-        with open(os.path.join(article_lang_dir, "voice_metadata.json"), "w", encoding="utf-8") as f:
-            json.dump(voice_metadata, f, indent=2, ensure_ascii=False)
+        save_voice_metadata(article_lang_dir, article_id, lang_code, output_file, file_url)
         
         return file_url
     
@@ -223,12 +652,42 @@ def process_article(article, target_languages):
     
     return article
 
+def translate_and_tts(article, lang_code):
+    """Translate an article into one language and generate TTS for the translated summary"""
+    article_id = article.get('article_id', '')
+    logger.info(f"Translating article {article_id} to {lang_code}")
+    
+    # Translate article
+    translated_article = translate_article(article, lang_code)
+    
+    # Generate voice file for translation
+    translated_summary = translated_article.get('summary', '')
+    voice_url = None
+    
+    if translated_summary:
+        with _tts_semaphore:
+            voice_url = generate_voice_file(translated_summary, lang_code, article_id)
+    
+    return {
+        'title': translated_article.get('headline', ''),
+        'summary': translated_summary,
+        'voice_url': voice_url,
+        'article_id': article_id,
+        'language': lang_code,
+        'language_name': _LANG_NAME[lang_code],
+        'translated_at': datetime.now().isoformat()
+    }
+
+def parse_languages(languages):
+    """Split a comma-separated language list into (supported, unknown) code lists"""
+    requested = [lang.strip() for lang in languages.split(',') if lang.strip()]
+    supported = [lang for lang in dict.fromkeys(requested) if lang in _SUPPORTED]
+    unknown = [lang for lang in requested if lang not in _SUPPORTED]
+    return supported, unknown
+
 def extract_and_process(languages=None):
     """Extract articles and process them asynchronously"""
     try:
-        # Set global flag to indicate processing
-        article_cache["processing"] = True
-        
         # Initialize extractor
         extractor = LatestNewsExtractor()
         
@@ -236,20 +695,22 @@ def extract_and_process(languages=None):
         extracted_articles = extractor.extract_latest_articles()
         
         # Ensure output directory exists
-        os.makedirs("output", exist_ok=True)
+        ensure_dir("output")
         
         # Save extracted articles to JSON file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = os.path.join("output", f"latest_articles_{timestamp}.json")
         output_file = os.path.join("output", "latest_articles.json")
         
-        # Save a timestamped backup
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(extracted_articles, f, indent=2, ensure_ascii=False)
-            
         # Save to the main file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(extracted_articles, f, indent=2, ensure_ascii=False)
+        write_json_file(output_file, extracted_articles)
+        
+        # Hard-link the timestamped backup to the same bytes; later writes to the
+        # main file replace it atomically, so the backup keeps this snapshot
+        try:
+            os.link(output_file, backup_file)
+        except OSError:
+            shutil.copyfile(output_file, backup_file)
             
         # Process articles and add to cache
         for article in extracted_articles:
@@ -265,26 +726,36 @@ def extract_and_process(languages=None):
             article['translations'] = {}
         
         # Update the global cache
-        article_cache["articles"] = extracted_articles
-        article_cache["last_updated"] = datetime.now().isoformat()
+        last_updated = datetime.now().isoformat()
+        publish_articles(extracted_articles, last_updated)
         
         # Create translations directory structure
-        os.makedirs("output/translations", exist_ok=True)
-        os.makedirs("output/translations/articles", exist_ok=True)
+        ensure_dir("output/translations")
+        ensure_dir("output/translations/articles")
         
         # Determine which languages to process
         if languages:
-            # Process specific languages if provided
-            language_list = [lang.strip() for lang in languages.split(',') if lang.strip()]
+            # Process specific languages if provided; callers guarantee they are supported
+            language_list, _ = parse_languages(languages)
         else:
             # Process all supported languages if none specified
-            language_list = list(INDIAN_LANGUAGES.keys())
+            language_list = list(SUPPORTED_LANG_CODES)
         
         # Keep track of translations to be saved
         saved_translations = {}
         
-        # Process each article completely (all translations) before moving to the next
-        for article in article_cache["articles"]:
+        # Queue translation + TTS for every article/language pair up front so the
+        # network calls overlap instead of running one after another
+        pending = {}
+        for index, article in enumerate(extracted_articles):
+            if not article.get('article_id', ''):
+                continue
+            for lang_code in language_list:
+                if lang_code not in article['translations']:
+                    pending[(index, lang_code)] = _translation_pool.submit(translate_and_tts, article, lang_code)
+        
+        # Collect the results article by article, in the original order
+        for index, article in enumerate(extracted_articles):
             article_id = article.get('article_id', '')
             if not article_id:
                 continue
@@ -293,78 +764,51 @@ def extract_and_process(languages=None):
             
             # Create article directory
             article_dir = os.path.join("output", "translations", "articles", article_id)
-            os.makedirs(article_dir, exist_ok=True)
+            ensure_dir(article_dir)
             
-            # Save article metadata
-            with open(os.path.join(article_dir, "article_metadata.json"), 'w', encoding='utf-8') as f:
-                article_metadata = {
-                    "article_id": article_id,
-                    "headline": article.get('headline', ''),
-                    "url": article.get('url', ''),
-                    "date": article.get('date', ''),
-                    "time": article.get('time', ''),
-                    "category": article.get('category', ''),
-                    "languages": []
-                }
-                json.dump(article_metadata, f, indent=2, ensure_ascii=False)
+            # Build article metadata; it is written once the languages are known
+            article_metadata = {
+                "article_id": article_id,
+                "headline": article.get('headline', ''),
+                "url": article.get('url', ''),
+                "date": article.get('date', ''),
+                "time": article.get('time', ''),
+                "category": article.get('category', ''),
+                "languages": []
+            }
             
-            # Process each language for this article
-            for lang_code in language_list:
-                if lang_code not in INDIAN_LANGUAGES:
-                    logger.warning(f"Skipping unsupported language: {lang_code}")
-                    continue
-                
-                # Skip if article already has this translation
-                if 'translations' in article and lang_code in article['translations']:
-                    logger.info(f"Article {article_id} already has {lang_code} translation")
-                    
-                    # Still update the article directory structure
-                    lang_dir = os.path.join(article_dir, lang_code)
-                    os.makedirs(lang_dir, exist_ok=True)
-                    
-                    # Save translation data
-                    trans_data = article['translations'][lang_code]
-                    with open(os.path.join(lang_dir, "translation.json"), 'w', encoding='utf-8') as f:
-                        json.dump(trans_data, f, indent=2, ensure_ascii=False)
+            # Split the languages into ones translated in an earlier pass and ones queued above
+            translations = article['translations']
+            done = [lang_code for lang_code in language_list if lang_code in translations]
+            todo = [lang_code for lang_code in language_list if lang_code not in translations]
+            
+            # Existing translations only need their file restored if it is missing
+            for lang_code in done:
+                logger.info(f"Article {article_id} already has {lang_code} translation")
+                lang_dir = os.path.join(article_dir, lang_code)
+                translation_file = os.path.join(lang_dir, "translation.json")
+                if not os.path.exists(translation_file):
+                    ensure_dir(lang_dir)
+                    write_json_file(translation_file, translations[lang_code])
                     
-                    # Update article metadata to include this language
-                    article_metadata["languages"].append(lang_code)
-                    continue
+                # Update article metadata to include this language
+                article_metadata["languages"].append(lang_code)
+            
+            # Process each remaining language for this article
+            for lang_code in todo:
+                # Create language directory
+                lang_dir = os.path.join(article_dir, lang_code)
+                ensure_dir(lang_dir)
                 
                 try:
-                    logger.info(f"Translating article {article_id} to {lang_code}")
-                    
-                    # Create language directory
-                    lang_dir = os.path.join(article_dir, lang_code)
-                    os.makedirs(lang_dir, exist_ok=True)
-                    
-                    # Translate article
-                    translated_article = translate_article(article, lang_code)
-                    
-                    # Generate voice file for translation
-                    translated_summary = translated_article.get('summary', '')
-                    voice_url = None
-                    
-                    if translated_summary:
-                        voice_url = generate_voice_file(translated_summary, lang_code, article_id)
-                    
-                    # Store translation data
-                    translation_data = {
-                        'title': translated_article.get('headline', ''),
-                        'summary': translated_summary,
-                        'voice_url': voice_url,
-                        'article_id': article_id,
-                        'language': lang_code,
-                        'language_name': INDIAN_LANGUAGES[lang_code]['name'],
-                        'translated_at': datetime.now().isoformat()
-                    }
+                    # Wait for the queued translation and TTS
+                    translation_data = pending[(index, lang_code)].result()
                     
                     # Save the translation data to the article
-                    article['translations'][lang_code] = translation_data
+                    translations[lang_code] = translation_data
                     
                     # Save translation to language directory
-                    with open(os.path.join(lang_dir, "translation.json"), 'w', encoding='utf-8') as f:
-                        json.dump(translation_data, f, indent=2, ensure_ascii=False)
+                    write_json_file(os.path.join(lang_dir, "translation.json"), translation_data)
                     
                     # Update article metadata to include this language
                     article_metadata["languages"].append(lang_code)
@@ -379,20 +823,19 @@ def extract_and_process(languages=None):
                 except Exception as e:
                     logger.error(f"Error translating article {article_id} to {lang_code}: {e}")
             
-            # Update article metadata file with all languages
-            with open(os.path.join(article_dir, "article_metadata.json"), 'w', encoding='utf-8') as f:
-                json.dump(article_metadata, f, indent=2, ensure_ascii=False)
+            # Save article metadata with all languages
+            write_json_file(os.path.join(article_dir, "article_metadata.json"), article_metadata)
         
-        # Save updated articles with translations
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(article_cache["articles"], f, indent=2, ensure_ascii=False)
+        # Save updated articles with translations; the cache already holds them, so the watcher can skip this version
+        write_json_file(output_file, extracted_articles)
+        _articles_file_state["mtime"] = os.stat(output_file).st_mtime
         
         # Create languages summary
         languages_summary = {}
         for lang_code, article_ids in saved_translations.items():
             languages_summary[lang_code] = {
-                'name': INDIAN_LANGUAGES[lang_code]['name'],
-                'tts_supported': INDIAN_LANGUAGES[lang_code]['tts_code'] is not None,
+                'name': _LANG_NAME[lang_code],
+                'tts_supported': _LANG_TTS[lang_code] is not None,
                 'article_count': len(article_ids),
                 'article_ids': article_ids
             }
@@ -401,25 +844,78 @@ def extract_and_process(languages=None):
         for lang_code in INDIAN_LANGUAGES:
             if lang_code not in languages_summary:
                 languages_summary[lang_code] = {
-                    'name': INDIAN_LANGUAGES[lang_code]['name'],
-                    'tts_supported': INDIAN_LANGUAGES[lang_code]['tts_code'] is not None,
+                    'name': _LANG_NAME[lang_code],
+                    'tts_supported': _LANG_TTS[lang_code] is not None,
                     'article_count': 0,
                     'article_ids': []
                 }
         
         # Save languages summary
-        translations_summary_file = os.path.join("output", "translations", "languages.json")
-        with open(translations_summary_file, 'w', encoding='utf-8') as f:
-            json.dump(languages_summary, f, indent=2, ensure_ascii=False)
+        translations_summary_file = TRANSLATIONS_SUMMARY_FILE
+        write_json_file(translations_summary_file, languages_summary)
+        
+        # Index the translations added above
+        publish_articles(extracted_articles, last_updated)
         
-        # Set flag to indicate processing is complete
-        article_cache["processing"] = False
+        # The translation directories changed, so drop the memoized summary
+        translations_summary_for.cache_clear()
         
         logger.info(f"Extraction and processing complete. {len(extracted_articles)} articles processed with {len(language_list)} languages.")
         
     except Exception as e:
         logger.error(f"Error in extraction process: {e}")
-        article_cache["processing"] = False
+
+def run_and_release(languages=None):
+    """Run an extraction and release the extraction lock when it finishes"""
+    try:
+        extract_and_process(languages)
+    finally:
+        release_extract_lock()
+
+# Extraction jobs are handed to one long-lived worker instead of a new thread per request
+_extract_jobs = queue.Queue()
+_extract_worker = None
+_extract_worker_lock = threading.Lock()
+
+def extraction_worker():
+    """Run queued extraction jobs one at a time"""
+    while True:
+        languages = _extract_jobs.get()
+        try:
+            run_and_release(languages)
+        finally:
+            _extract_jobs.task_done()
+
+def submit_extraction(languages=None):
+    """Queue an extraction job, starting the worker thread if needed.
+    
+    The caller must already hold the extraction lock; the worker releases it.
+    """
+    global _extract_worker
+    with _extract_worker_lock:
+        # Threads do not survive a fork, so check the worker on every submit
+        if _extract_worker is None or not _extract_worker.is_alive():
+            _extract_worker = threading.Thread(target=extraction_worker, name="extract-worker", daemon=True)
+            _extract_worker.start()
+    _extract_jobs.put(languages)
+
+_articles_watcher = None
+_articles_watcher_lock = threading.Lock()
+
+@app.before_request
+def ensure_articles_watcher():
+    """Start the article file watcher in this process if it is not running"""
+    global _articles_watcher
+    if _articles_watcher is not None and _articles_watcher.is_alive():
+        return
+    with _articles_watcher_lock:
+        # Threads do not survive a fork, so each worker process starts its own
+        if _articles_watcher is None or not _articles_watcher.is_alive():
+            _articles_watcher = threading.Thread(target=articles_watcher, name="articles-watcher", daemon=True)
+            _articles_watcher.start()
+
+# Load the latest articles once at startup instead of on the request path
+reload_articles_if_stale()
 
 @app.route("/")
 def index():
@@ -438,8 +934,18 @@ def extract_news():
     languages = request.args.get('languages')
     background = request.args.get('background', 'true').lower() == 'true'
     
-    # Check if already processing
-    if article_cache["processing"]:
+    # Reject unknown language codes up front instead of skipping them per article
+    if languages:
+        _, unknown = parse_languages(languages)
+        if unknown:
+            return jsonify({
+                "status": "error",
+                "message": f"Unsupported language codes: {', '.join(unknown)}",
+                "supported_languages": SUPPORTED_LANG_CODES
+            }), 400
+    
+    # Check if already processing (in any worker)
+    if not acquire_extract_lock():
         return jsonify({
             "status": "already_processing",
             "message": "News extraction is already in progress"
@@ -447,10 +953,8 @@ def extract_news():
     
     # Start extraction process
     if background:
-        # Run in background thread
-        thread = threading.Thread(target=extract_and_process, args=(languages,))
-        thread.daemon = True
-        thread.start()
+        # Hand off to the background extraction worker
+        submit_extraction(languages)
         
         return jsonify({
             "status": "processing",
@@ -459,14 +963,15 @@ def extract_news():
         })
     else:
         # Run synchronously
-        extract_and_process(languages)
+        run_and_release(languages)
         
+        snap = article_snapshot
         return jsonify({
             "status": "completed",
             "message": "News extraction completed",
             "languages": languages or "all",
-            "article_count": len(article_cache["articles"]),
-            "last_updated": article_cache["last_updated"]
+            "article_count": len(snap.articles),
+            "last_updated": snap.last_updated
         })
 
 def organize_translations_by_article_id():
@@ -492,27 +997,29 @@ def organize_translations_by_article_id():
             logger.warning(f"Articles directory not found at {articles_dir}")
             return translations_by_lang
         
-        # Iterate through all article directories
-        for article_id in os.listdir(articles_dir):
-            article_dir = os.path.join(articles_dir, article_id)
-            if not os.path.isdir(article_dir):
-                continue
-                
-            # Get languages for this article
-            for lang_code in os.listdir(article_dir):
-                lang_dir = os.path.join(article_dir, lang_code)
-                if not os.path.isdir(lang_dir) or lang_code not in translations_by_lang:
+        # Collect article IDs per language in sets, one scandir pass per directory
+        ids_by_lang = {lang_code: set() for lang_code in translations_by_lang}
+        with os.scandir(articles_dir) as article_entries:
+            for article_entry in article_entries:
+                if not article_entry.is_dir(follow_symlinks=False):
                     continue
-                
-                # Count this as a translation
-                if article_id not in translations_by_lang[lang_code]['article_ids']:
-                    translations_by_lang[lang_code]['article_ids'].append(article_id)
-                    translations_by_lang[lang_code]['article_count'] += 1
+                    
+                # Get languages for this article
+                with os.scandir(article_entry.path) as lang_entries:
+                    for lang_entry in lang_entries:
+                        if lang_entry.name in ids_by_lang and lang_entry.is_dir(follow_symlinks=False):
+                            ids_by_lang[lang_entry.name].add(article_entry.name)
+        
+        for lang_code, article_ids in ids_by_lang.items():
+            translations_by_lang[lang_code]['article_ids'] = sorted(article_ids)
+            translations_by_lang[lang_code]['article_count'] = len(article_ids)
         
         # Save languages summary
-        translations_summary_file = os.path.join("output", "translations", "languages.json")
-        with open(translations_summary_file, 'w', encoding='utf-8') as f:
-            json.dump(translations_by_lang, f, indent=2, ensure_ascii=False)
+        translations_summary_file = TRANSLATIONS_SUMMARY_FILE
+        write_json_file(translations_summary_file, translations_by_lang)
+        
+        # Rendered /news bodies embed this summary
+        bump_snapshot_version()
             
         logger.info(f"Generated translations summary. Summary saved to {translations_summary_file}")
         return translations_by_lang
@@ -521,152 +1028,234 @@ def organize_translations_by_article_id():
         logger.error(f"Error organizing translations: {e}")
         return {}
 
-def get_structured_articles(articles, language=None):
+@functools.lru_cache(maxsize=1)
+def translations_summary_for(last_updated):
+    """Memoized organize_translations_by_article_id() for one cache generation"""
+    return organize_translations_by_article_id()
+
+def load_json_cached_or_none(path):
+    """load_json_cached() that returns None when the file is missing or unreadable"""
+    try:
+        return load_json_cached(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error loading {path}: {e}")
+        return None
+
+def load_translations_summary(refresh=False):
+    """Return the languages summary, walking the translation tree only when languages.json is unavailable"""
+    translations_summary = None if refresh else load_json_cached_or_none(TRANSLATIONS_SUMMARY_FILE)
+    if translations_summary is None:
+        if refresh:
+            translations_summary_for.cache_clear()
+        translations_summary = translations_summary_for(article_snapshot.last_updated)
+    return translations_summary
+
+def build_translation_entry(lang, trans_data, article_id, author, category, source, tags):
+    """Create a full translation object with all necessary fields"""
+    return {
+        'article_id': article_id,
+        'author': author,
+        'category': category,
+        'headline': trans_data.get('title', ''),
+        'title': trans_data.get('title', ''),
+        'summary': trans_data.get('summary', ''),
+        'source': source,
+        'tags': tags,
+        'language': lang,
+        'language_name': _LANG_NAME.get(lang, ''),
+        'appwrite_audio_url': trans_data.get('voice_url'),
+        'tts_file_path': None
+    }
+
+def structure_one(article, language, image_prefix):
     """
-    Structure articles according to the requested format, with translations organized by language.
+    Structure a single article according to the requested format.
     
     Args:
-        articles: List of articles to structure
+        article: Article to structure
         language: Optional specific language to include
+        image_prefix: Base URL that image filenames are appended to
         
     Returns:
-        List of articles with structured translations
+        Article with structured translations
     """
-    structured_articles = []
-    base_url = request.url_root.rstrip('/')
+    # Fields shared by the article and every translation below
+    article_id = article.get('article_id', '')
+    article_url = article.get('url', '')
+    author = article.get('author', '')
+    category = article.get('category', '')
+    source = article.get('source', '')
+    tags = article.get('tags', [])
     
-    for article in articles:
-        # Basic article structure
-        structured_article = {
-            'article_id': article.get('article_id', ''),
-            'url': article.get('url', ''),
-            'headline': article.get('headline', ''),
-            'summary': article.get('summary', ''),
-            'content': article.get('content', ''),
-            'date': article.get('date', ''),
-            'time': article.get('time', ''),
-            'author': article.get('author', ''),
-            'source': article.get('source', ''),
-            'category': article.get('category', ''),
-            'tags': article.get('tags', []),
-            'language': 'en'  # Default language is English
-        }
+    # Basic article structure
+    structured_article = {
+        'article_id': article_id,
+        'url': article_url,
+        'headline': article.get('headline', ''),
+        'summary': article.get('summary', ''),
+        'content': article.get('content', ''),
+        'date': article.get('date', ''),
+        'time': article.get('time', ''),
+        'author': author,
+        'source': source,
+        'category': category,
+        'tags': tags,
+        'language': 'en'  # Default language is English
+    }
+    
+    # Add English voice URL if available
+    if 'en_voice_url' in article:
+        structured_article['appwrite_audio_url'] = article['en_voice_url']
+        structured_article['tts_file_path'] = article.get('voice_file', '')
+    elif 'voice_file_url' in article:
+        structured_article['appwrite_audio_url'] = article['voice_file_url']
+        structured_article['tts_file_path'] = article.get('voice_file', '')
+    else:
+        structured_article['appwrite_audio_url'] = None
+        structured_article['tts_file_path'] = ''
         
-        # Add English voice URL if available
-        if 'en_voice_url' in article:
-            structured_article['appwrite_audio_url'] = article['en_voice_url']
-            structured_article['tts_file_path'] = article.get('voice_file', '')
-        elif 'voice_file_url' in article:
-            structured_article['appwrite_audio_url'] = article['voice_file_url']
-            structured_article['tts_file_path'] = article.get('voice_file', '')
-        else:
-            structured_article['appwrite_audio_url'] = None
-            structured_article['tts_file_path'] = ''
-            
-        # Process main image
-        main_image_data = None
-        if 'main_image' in article and article['main_image']:
-            main_image = article['main_image']
-            # Check different possible formats of main_image
-            if isinstance(main_image, dict):
+    # Process main image
+    main_image_data = None
+    if 'main_image' in article and article['main_image']:
+        main_image = article['main_image']
+        # Check different possible formats of main_image
+        if isinstance(main_image, dict):
+            # If it's already a dictionary with metadata
+            img_copy = main_image.copy()
+            if 'filename' in img_copy:
+                img_copy['server_url'] = image_prefix + img_copy['filename']
+            structured_article['main_image'] = img_copy
+            main_image_data = img_copy
+        elif isinstance(main_image, str):
+            # If it's just a filename string
+            main_image_data = {
+                'url': article_url,
+                'local_path': f"output/images/{main_image}",
+                'filename': main_image,
+                'position': 0,
+                'server_url': image_prefix + main_image
+            }
+            structured_article['main_image'] = main_image_data
+    
+    # Process article images
+    structured_images = []
+    if 'images' in article and article['images']:
+        # Check and handle different formats of images array
+        for idx, img in enumerate(article['images']):
+            if isinstance(img, dict):
                 # If it's already a dictionary with metadata
-                img_copy = main_image.copy()
+                img_copy = img.copy()
                 if 'filename' in img_copy:
-                    img_copy['server_url'] = f"{base_url}/images/{img_copy['filename']}"
-                structured_article['main_image'] = img_copy
-                main_image_data = img_copy
-            elif isinstance(main_image, str):
+                    img_copy['server_url'] = image_prefix + img_copy['filename']
+                elif 'local_path' in img_copy:
+                    # Extract filename from path
+                    filename = os.path.basename(img_copy['local_path'])
+                    img_copy['filename'] = filename
+                    img_copy['server_url'] = image_prefix + filename
+                structured_images.append(img_copy)
+            elif isinstance(img, str):
                 # If it's just a filename string
-                main_image_data = {
-                    'url': article.get('url', ''),
-                    'local_path': f"output/images/{main_image}",
-                    'filename': main_image,
-                    'position': 0,
-                    'server_url': f"{base_url}/images/{main_image}"
-                }
-                structured_article['main_image'] = main_image_data
-        
-        # Process article images
-        structured_images = []
-        if 'images' in article and article['images']:
-            # Check and handle different formats of images array
-            for idx, img in enumerate(article['images']):
-                if isinstance(img, dict):
-                    # If it's already a dictionary with metadata
-                    img_copy = img.copy()
-                    if 'filename' in img_copy:
-                        img_copy['server_url'] = f"{base_url}/images/{img_copy['filename']}"
-                    elif 'local_path' in img_copy:
-                        # Extract filename from path
-                        filename = os.path.basename(img_copy['local_path'])
-                        img_copy['filename'] = filename
-                        img_copy['server_url'] = f"{base_url}/images/{filename}"
-                    structured_images.append(img_copy)
-                elif isinstance(img, str):
-                    # If it's just a filename string
-                    structured_images.append({
-                        'url': article.get('url', ''),
-                        'local_path': f"output/images/{img}",
-                        'filename': img,
-                        'position': idx,
-                        'server_url': f"{base_url}/images/{img}"
-                    })
-            
-            structured_article['images'] = structured_images
-            
-        # Process translations
-        structured_article['translations'] = {}
-        
-        if 'translations' in article:
-            # If specific language requested, only include that
-            if language and language != 'en':
-                if language in article['translations']:
-                    trans_data = article['translations'][language]
-                    # Create a full translation object with all necessary fields
-                    structured_article['translations'][language] = {
-                        'article_id': article.get('article_id', ''),
-                        'author': article.get('author', ''),
-                        'category': article.get('category', ''),
-                        'headline': trans_data.get('title', ''),
-                        'title': trans_data.get('title', ''),
-                        'summary': trans_data.get('summary', ''),
-                        'source': article.get('source', ''),
-                        'tags': article.get('tags', []),
-                        'language': language,
-                        'language_name': INDIAN_LANGUAGES.get(language, {}).get('name', ''),
-                        'appwrite_audio_url': trans_data.get('voice_url'),
-                        'tts_file_path': None
-                    }
-                    
-                    # Remove main_image from translation
-                    if main_image_data:
-                        structured_article['translations'][language].pop('main_image', None)
-            else:
-                # Include all translations
-                for lang, trans_data in article['translations'].items():
-                    # Create a full translation object with all necessary fields
-                    structured_article['translations'][lang] = {
-                        'article_id': article.get('article_id', ''),
-                        'author': article.get('author', ''),
-                        'category': article.get('category', ''),
-                        'headline': trans_data.get('title', ''),
-                        'title': trans_data.get('title', ''),
-                        'summary': trans_data.get('summary', ''),
-                        'source': article.get('source', ''),
-                        'tags': article.get('tags', []),
-                        'language': lang,
-                        'language_name': INDIAN_LANGUAGES.get(lang, {}).get('name', ''),
-                        'appwrite_audio_url': trans_data.get('voice_url'),
-                        'tts_file_path': None
-                    }
-                    
-                    # Remove main_image from translation
-                    if main_image_data:
-                        structured_article['translations'][lang].pop('main_image', None)
+                structured_images.append({
+                    'url': article_url,
+                    'local_path': f"output/images/{img}",
+                    'filename': img,
+                    'position': idx,
+                    'server_url': image_prefix + img
+                })
+        
+        structured_article['images'] = structured_images
         
-        structured_articles.append(structured_article)
+    # Process translations
+    structured_article['translations'] = {}
     
-    return structured_articles
+    if 'translations' in article:
+        translations = article['translations']
+        # If specific language requested, only include that
+        if language and language != 'en':
+            langs_to_emit = (language,)
+        else:
+            langs_to_emit = translations.keys()
+        for lang in langs_to_emit:
+            if lang not in translations:
+                continue
+            structured_article['translations'][lang] = build_translation_entry(
+                lang, translations[lang], article_id, author, category, source, tags
+            )
+    
+    return structured_article
+
+# Distinct image prefixes (i.e. host names) whose structured articles are cached per snapshot
+STRUCTURED_PREFIX_LIMIT = 4
+
+def structured_for(snap, article, language, image_prefix):
+    """Return structure_one() for an article of `snap`, building it at most once per snapshot"""
+    language = language if language and language != 'en' else None
+    by_prefix = snap.structured.get(image_prefix)
+    if by_prefix is None:
+        # Host headers are client-controlled, so only a few prefixes get a cache
+        if len(snap.structured) >= STRUCTURED_PREFIX_LIMIT:
+            return structure_one(article, language, image_prefix)
+        by_prefix = snap.structured.setdefault(image_prefix, {})
+    # The snapshot keeps every article alive, so id() is stable for its lifetime
+    key = (id(article), language)
+    structured = by_prefix.get(key)
+    if structured is None:
+        structured = structure_one(article, language, image_prefix)
+        by_prefix[key] = structured
+    return structured
+
+def get_structured_articles(articles, language=None, snap=None):
+    """
+    Structure articles according to the requested format, with translations organized by language.
+    
+    Args:
+        articles: List of articles to structure, all taken from `snap`
+        language: Optional specific language to include
+        snap: Article snapshot the articles belong to (default: the current one)
+        
+    Returns:
+        List of articles with structured translations
+    """
+    snap = snap or article_snapshot
+    image_prefix = request.url_root.rstrip('/') + '/images/'
+    return [structured_for(snap, article, language, image_prefix) for article in articles]
+
+# Page sizes for /news, capped so a single request cannot build an unbounded response
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Clients may reuse a response this long before revalidating it with If-None-Match
+ETAG_MAX_AGE = 30
+
+def not_modified(etag):
+    """Return a 304 response when the client already holds this ETag, otherwise None"""
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        response.cache_control.max_age = ETAG_MAX_AGE
+        return response
+    return None
+
+def with_etag(response, etag):
+    """Attach a weak ETag and a short max-age to a response"""
+    response.set_etag(etag, weak=True)
+    response.cache_control.max_age = ETAG_MAX_AGE
+    return response
+
+def file_mtime_ns(path):
+    """Modification time of a file in nanoseconds, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def ndjson_lines(snap, header, articles, language, image_prefix):
+    """Yield the /news header and then each structured article as one NDJSON line"""
+    yield orjson.dumps(header) + b"\n"
+    for article in articles:
+        yield orjson.dumps(structured_for(snap, article, language, image_prefix)) + b"\n"
 
 @app.route('/news', methods=['GET'])
 def get_news():
@@ -674,109 +1263,120 @@ def get_news():
     Get processed news articles
     Optional parameters:
     - language: Filter by language code (default: all)
-    - limit: Maximum number of articles to return (default: all)
+    - limit: Maximum number of articles to return (default: 20, max: 100)
     - offset: Start index for pagination (default: 0)
     - refresh: Whether to refresh language summary data (default: false)
+    - format: 'ndjson' to stream a header line followed by one article per line
     """
     # Get parameters
     language = request.args.get('language')
-    limit = request.args.get('limit')
-    offset = request.args.get('offset', 0, type=int)
     refresh = request.args.get('refresh', 'false').lower() == 'true'
+    try:
+        limit = min(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        offset = max(int(request.args.get('offset', 0)), 0)
+        if limit < 1:
+            raise ValueError("limit must be positive")
+    except ValueError:
+        return jsonify({
+            "status": "error",
+            "message": f"limit must be an integer between 1 and {MAX_PAGE_SIZE} and offset a non-negative integer"
+        }), 400
     
     # Check if articles are available
-    if not article_cache["articles"]:
-        try:
-            # Try to load from file
-            latest_file = "output/latest_articles.json"
-            if os.path.exists(latest_file):
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    article_cache["articles"] = json.load(f)
-                    article_cache["last_updated"] = datetime.fromtimestamp(
-                        os.path.getmtime(latest_file)
-                    ).isoformat()
-        except Exception as e:
-            logger.error(f"Error loading articles from file: {e}")
-    
-    # Check again after attempting to load
-    if not article_cache["articles"]:
-        # Create language data from supported languages
-        available_languages = {}
-        for lang_code, lang_info in INDIAN_LANGUAGES.items():
-            available_languages[lang_code] = {
-                "name": lang_info["name"],
-                "tts_supported": True if lang_info.get("tts_code") else False,
-                "article_count": 0,
-                "article_ids": []
-            }
-            
+    snap = article_snapshot
+    if not snap.articles:
+        # Language data from supported languages
+        available_languages = DEFAULT_LANGUAGES_DATA
+        
         return jsonify({
             "status": "no_data",
             "message": "No news available",
             "count": 0,
             "articles": [],
             "last_updated": None,
-            "processing": article_cache["processing"],
+            "processing": extraction_in_progress(),
             "available_languages": available_languages
         }), 200
     
-    # Filter by language if specified
-    articles = article_cache["articles"]
-    if language and language != 'en':
-        articles = [
-            article for article in articles 
-            if 'translations' in article and language in article['translations']
-        ]
+    # Answer revalidations and repeat requests without rebuilding the page
+    ndjson = request.args.get('format') == 'ndjson' or request.accept_mimetypes.best == 'application/x-ndjson'
+    processing = extraction_in_progress()
+    etag = (
+        f"{snap.content_tag}-{file_mtime_ns(TRANSLATIONS_SUMMARY_FILE)}-{language or '*'}-{offset}-{limit}"
+        f"-{int(processing)}-{'ndjson' if ndjson else 'json'}"
+    )
+    render_key = (snap.version, request.url_root, language, offset, limit, processing)
+    if not refresh:
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        if not ndjson:
+            body = get_rendered(render_key)
+            if body is not None:
+                return with_etag(app.response_class(body, mimetype='application/json'), etag)
     
-    # Apply pagination
-    if limit:
-        try:
-            limit = int(limit)
-            articles = articles[offset:offset+limit]
-        except ValueError:
-            pass
+    # Filter by language if specified, using the per-language index
+    if language and language != 'en':
+        articles = snap.by_lang.get(language, ())
     else:
-        articles = articles[offset:]
+        articles = snap.articles
     
-    # Structure the articles in the requested format
-    structured_articles = get_structured_articles(articles, language)
+    # Apply pagination
+    articles = articles[offset:offset+limit]
     
     # Update the article translations organization if requested
-    translations_summary = {}
-    if refresh:
-        translations_summary = organize_translations_by_article_id()
-    else:
-        # Try to load the summary from file
-        translations_summary_file = os.path.join("output", "translations", "languages.json")
-        if os.path.exists(translations_summary_file):
-            try:
-                with open(translations_summary_file, 'r', encoding='utf-8') as f:
-                    translations_summary = json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading languages summary: {e}")
-                translations_summary = organize_translations_by_article_id()
-        else:
-            translations_summary = organize_translations_by_article_id()
+    translations_summary = load_translations_summary(refresh)
     
-    return jsonify({
+    # Stream one JSON object per line when the client asks for NDJSON
+    if ndjson:
+        header = {
+            "status": "success",
+            "count": len(articles),
+            "last_updated": snap.last_updated,
+            "processing": processing,
+            "available_languages": translations_summary
+        }
+        image_prefix = request.url_root.rstrip('/') + '/images/'
+        response = Response(
+            stream_with_context(ndjson_lines(snap, header, articles, language, image_prefix)),
+            mimetype='application/x-ndjson'
+        )
+        return response if refresh else with_etag(response, etag)
+    
+    # Structure the articles in the requested format
+    structured_articles = get_structured_articles(articles, language, snap)
+    
+    response = jsonify({
         "status": "success",
         "count": len(structured_articles),
-        "last_updated": article_cache["last_updated"],
-        "processing": article_cache["processing"],
+        "last_updated": snap.last_updated,
+        "processing": processing,
         "articles": structured_articles,
         "available_languages": translations_summary
     })
+    # A refresh may have rebuilt the summary, so only cache and tag normal responses
+    if refresh:
+        return response
+    put_rendered(render_key, response.get_data())
+    return with_etag(response, etag)
 
 @app.route('/status', methods=['GET'])
 def get_status():
     """Get the current status of the API and extraction process"""
-    return jsonify({
+    snap = article_snapshot
+    processing = extraction_in_progress()
+    etag = f"{snap.content_tag}-{int(processing)}"
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    
+    return with_etag(jsonify({
         "status": "success",
-        "processing": article_cache["processing"],
-        "article_count": len(article_cache["articles"]),
-        "last_updated": article_cache["last_updated"],
-        "available_languages": list(INDIAN_LANGUAGES.keys())
-    })
+        "processing": processing,
+        "article_count": len(snap.articles),
+        "last_updated": snap.last_updated,
+        "available_languages": SUPPORTED_LANG_CODES
+    }), etag)
 
 @app.route('/test', methods=['GET'])
 def test():
@@ -789,33 +1389,72 @@ def test():
 @app.route('/languages', methods=['GET'])
 def get_languages():
     """Get available languages and their translation status"""
-    # Generate fresh language data
-    languages_data = organize_translations_by_article_id()
-    
-    # If no data is found, try to read from file
-    if not languages_data:
-        translations_summary_file = os.path.join("output", "translations", "languages.json")
-        if os.path.exists(translations_summary_file):
-            try:
-                with open(translations_summary_file, 'r', encoding='utf-8') as f:
-                    languages_data = json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading languages data: {e}")
-    
-    # If still no data, create default from supported languages
-    if not languages_data:
-        languages_data = {}
-        for lang_code, lang_info in INDIAN_LANGUAGES.items():
-            languages_data[lang_code] = {
-                "name": lang_info["name"],
-                "tts_supported": True if lang_info.get("tts_code") else False,
-                "article_count": 0
-            }
+    etag = f"{article_snapshot.content_tag}-{file_mtime_ns(TRANSLATIONS_SUMMARY_FILE)}"
+    response = not_modified(etag)
+    if response is not None:
+        return response
     
-    return jsonify({
+    # Prefer languages.json, then the memoized directory walk, then the supported-language defaults
+    languages_data = (
+        load_json_cached_or_none(TRANSLATIONS_SUMMARY_FILE)
+        or translations_summary_for(article_snapshot.last_updated)
+        or DEFAULT_LANGUAGES_DATA
+    )
+    
+    return with_etag(jsonify({
         "status": "success",
         "languages": languages_data
-    })
+    }), etag)
+
+# Small pool for overlapping blocking file reads on the request path
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="io")
+
+def load_voice_metadata(article_id, lang_dir, metadata_file):
+    """Read one language's voice_metadata.json, or None if it is missing or unreadable"""
+    try:
+        return lang_dir, read_json_file(metadata_file)
+    except FileNotFoundError:
+        return lang_dir, None
+    except Exception as e:
+        logger.error(f"Error loading metadata for article {article_id}, language {lang_dir}: {e}")
+        return lang_dir, None
+
+# Scan results keyed by article directory -> (directory mtime_ns, metadata). Any newly voiced
+# language writes voice_manifest.json into the directory, which bumps its mtime. One entry per
+# article would grow forever, so it is an LRU capped at VOICE_SCAN_CACHE_SIZE.
+VOICE_SCAN_CACHE_SIZE = int(os.getenv('VOICE_SCAN_CACHE_SIZE', '1024'))
+_voice_scan_cache = OrderedDict()
+_voice_scan_cache_lock = threading.Lock()
+
+def scan_voice_metadata(article_id, article_translations_dir):
+    """Collect voice_metadata.json from every language directory of an article"""
+    try:
+        dir_mtime = os.stat(article_translations_dir).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    with _voice_scan_cache_lock:
+        hit = _voice_scan_cache.get(article_translations_dir)
+        if hit and hit[0] == dir_mtime:
+            _voice_scan_cache.move_to_end(article_translations_dir)
+            return hit[1]
+    
+    # One scandir pass; the dirent type bit answers is_dir() without a stat
+    with os.scandir(article_translations_dir) as entries:
+        metadata_files = [
+            (entry.name, os.path.join(entry.path, "voice_metadata.json"))
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        ]
+    
+    # Read the files concurrently so their disk waits overlap
+    results = _io_pool.map(lambda item: load_voice_metadata(article_id, *item), metadata_files)
+    translations_metadata = {lang_dir: metadata for lang_dir, metadata in results if metadata is not None}
+    with _voice_scan_cache_lock:
+        _voice_scan_cache[article_translations_dir] = (dir_mtime, translations_metadata)
+        _voice_scan_cache.move_to_end(article_translations_dir)
+        while len(_voice_scan_cache) > VOICE_SCAN_CACHE_SIZE:
+            _voice_scan_cache.popitem(last=False)
+    return translations_metadata
 
 @app.route('/article/<article_id>', methods=['GET'])
 def get_article(article_id):
@@ -824,22 +1463,9 @@ def get_article(article_id):
     Args:
         article_id: The unique ID of the article to retrieve
     """
-    # Check if articles are available in cache
-    if not article_cache["articles"]:
-        try:
-            # Try to load from file
-            latest_file = "output/latest_articles.json"
-            if os.path.exists(latest_file):
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    article_cache["articles"] = json.load(f)
-                    article_cache["last_updated"] = datetime.fromtimestamp(
-                        os.path.getmtime(latest_file)
-                    ).isoformat()
-        except Exception as e:
-            logger.error(f"Error loading articles from file: {e}")
-    
     # Find the requested article
-    article = next((a for a in article_cache["articles"] if a.get('article_id') == article_id), None)
+    snap = article_snapshot
+    article = snap.by_id.get(article_id)
     
     if not article:
         return jsonify({
@@ -847,44 +1473,62 @@ def get_article(article_id):
             "message": f"Article with ID {article_id} not found"
         }), 404
     
+    # The response changes with the snapshot and with the article's voice manifest
+    article_translations_dir = os.path.join("output", "translations", "articles", article_id)
+    manifest_file = os.path.join(article_translations_dir, "voice_manifest.json")
+    etag = f"{snap.content_tag}-{file_mtime_ns(manifest_file)}"
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    
     # Structure the article data
-    structured_articles = get_structured_articles([article])
+    structured_articles = get_structured_articles([article], snap=snap)
     
     # Get translation metadata
-    article_translations_dir = os.path.join("output", "translations", "articles", article_id)
-    translations_metadata = {}
-    
-    if os.path.exists(article_translations_dir):
-        for lang_dir in os.listdir(article_translations_dir):
-            lang_path = os.path.join(article_translations_dir, lang_dir)
-            if os.path.isdir(lang_path):
-                metadata_file = os.path.join(lang_path, "voice_metadata.json")
-                if os.path.exists(metadata_file):
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            translations_metadata[lang_dir] = json.load(f)
-                    except Exception as e:
-                        logger.error(f"Error loading metadata for article {article_id}, language {lang_dir}: {e}")
+    try:
+        translations_metadata = load_json_cached(manifest_file)
+    except FileNotFoundError:
+        # Articles voiced before the manifest existed: read each language's metadata
+        translations_metadata = scan_voice_metadata(article_id, article_translations_dir)
+    except Exception as e:
+        logger.error(f"Error loading voice manifest for article {article_id}: {e}")
+        translations_metadata = scan_voice_metadata(article_id, article_translations_dir)
     
-    return jsonify({
+    return with_etag(jsonify({
         "status": "success",
         "article": structured_articles[0] if structured_articles else None,
         "translations_metadata": translations_metadata
-    })
+    }), etag)
+
+# Image filenames embed a hash of the source URL and are never rewritten, so they can be cached for good
+IMAGE_MAX_AGE = 31536000
 
 @app.route('/images/<filename>')
 def serve_image(filename):
     """Serve images from the output/images directory"""
-    return send_from_directory('output/images', filename)
+    if USE_XACCEL:
+        # Let the reverse proxy push the bytes; Flask only picks the file
+        if filename != os.path.basename(filename) or filename.startswith('.'):
+            return jsonify({"status": "not_found", "message": "Image not found"}), 404
+        response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response.headers['X-Accel-Redirect'] = f"/_protected_images/{filename}"
+    else:
+        response = send_from_directory('output/images', filename, max_age=IMAGE_MAX_AGE, conditional=True, etag=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = IMAGE_MAX_AGE
+    response.cache_control.immutable = True
+    return response
 
 if __name__ == '__main__':
     # Ensure output directories exist
-    os.makedirs("output", exist_ok=True)
-    os.makedirs("output/images", exist_ok=True)
-    os.makedirs("output/translations", exist_ok=True)
-    os.makedirs("output/translations/articles", exist_ok=True)
+    ensure_dir("output")
+    ensure_dir("output/images")
+    ensure_dir("output/translations")
+    ensure_dir("output/translations/articles")
     
     # Start the server
     # port = os.getenv('PORT', 5000)
     port = int(os.getenv('PORT', 5000))  # fallback to 5000 for local dev
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    # Development server only; production runs wsgi:application under gunicorn
+    debug = os.getenv('FLASK_DEBUG', '0') == '1'
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
\ No newline at end of file
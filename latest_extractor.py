@@ -1,20 +1,34 @@
 import asyncio
+import aiohttp
+import aiofiles
 import json
 import os
 import re
+import sys
+import random
 import glob
 import requests
+import threading
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
 from crawl4ai import AsyncWebCrawler, BrowserConfig
 import hashlib
+import functools
 import urllib.request
 import ssl
 from PIL import Image
 import io
 import shutil
 from google.cloud import texttospeech
+from google.api_core import exceptions as google_exceptions
 from google.oauth2 import service_account
 from dotenv import load_dotenv
 # Add Appwrite imports
@@ -25,17 +39,107 @@ from appwrite.id import ID
 from appwrite.permission import Permission
 from appwrite.role import Role
 
+# orjson is much faster for the large article/link files; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj):
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib fallback, which coerces int/float keys to strings
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def json_line(obj):
+    """Serialize obj as one compact JSON line (bytes, newline-terminated) for .jsonl files."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+def write_json_file(path, obj):
+    """Serialize obj with json_dumps and write it to a temp file that is renamed over path."""
+    data = memoryview(json_dumps(obj))
+    # Readers such as api.py poll these files, so they must never see a truncated or half-written one
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        # One write call covers the whole buffer except for rare partial writes
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+# lxml is a much faster BeautifulSoup backend than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# uvloop speeds up the asyncio loop used for crawling and fetching; it is not available on Windows
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+
+# Requests to thehindu.com run with verify=False; warn once here rather than on every request
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Load environment variables for API credentials
 load_dotenv()
 
+# Appwrite settings and REST auth headers, read once after .env is loaded
+APPWRITE_CFG = {
+    'endpoint': os.getenv('APPWRITE_ENDPOINT'),
+    'project': os.getenv('APPWRITE_PROJECT_ID'),
+    'key': os.getenv('APPWRITE_API_KEY'),
+    'bucket': os.getenv('APPWRITE_AUDIO_BUCKET_ID', 'tts_files'),
+}
+APPWRITE_HEADERS = {
+    'X-Appwrite-Project': APPWRITE_CFG['project'] or '',
+    'X-Appwrite-Key': APPWRITE_CFG['key'] or ''
+}
+
 # Set up TTS credentials
 credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "awesome-aspect-455006-b6-e45e9e01c19e.json")
-if os.path.exists(credentials_path):
-    credentials = service_account.Credentials.from_service_account_file(credentials_path)
-else:
-    print(f"Warning: TTS credentials file not found at {credentials_path}")
-    credentials = None
+
+@functools.lru_cache(maxsize=1)
+def get_credentials():
+    """Load the TTS service account credentials once, or None if the file is missing."""
+    if not os.path.exists(credentials_path):
+        print(f"Warning: TTS credentials file not found at {credentials_path}")
+        return None
+    with open(credentials_path, 'rb') as f:
+        info = json_loads(f.read())
+    return service_account.Credentials.from_service_account_info(info)
+
+credentials = get_credentials()
+
+# One TTS client (and gRPC channel) for the whole process, created on first use; it is thread-safe
+TTS_CONCURRENCY = int(os.getenv('TTS_CONCURRENCY', 8))
+_tts_client = None
+_tts_client_lock = threading.Lock()
+
+def get_tts_client():
+    """Return the shared TextToSpeechClient, or None without credentials."""
+    global _tts_client
+    if _tts_client is None and credentials:
+        with _tts_client_lock:
+            if _tts_client is None:
+                _tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+    return _tts_client
 
 # Map of Indian languages with their codes and TTS codes
 # Updated to match translate.py and include all supported languages
@@ -61,6 +165,30 @@ INDIAN_LANGUAGES = {
     'en': {'name': 'English_Indian', 'tts_code': 'en-IN'}
 }
 
+# Shared HTTP session for Appwrite uploads so TLS connections are reused across files
+_appwrite_session = None
+_appwrite_session_lock = threading.Lock()
+
+def get_appwrite_session():
+    """Return the pooled requests session used for Appwrite REST calls."""
+    global _appwrite_session
+    if _appwrite_session is None:
+        with _appwrite_session_lock:
+            if _appwrite_session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=None  # also retry POST; uploads use server-generated IDs
+                )
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(APPWRITE_HEADERS)
+                _appwrite_session = session
+    return _appwrite_session
+
 # Add Appwrite functions
 def initialize_appwrite():
     """Initialize and return Appwrite client and storage service."""
@@ -69,9 +197,9 @@ def initialize_appwrite():
         client = Client()
         
         # Set Appwrite endpoint and project
-        appwrite_endpoint = os.getenv('APPWRITE_ENDPOINT')
-        appwrite_project_id = os.getenv('APPWRITE_PROJECT_ID')
-        appwrite_api_key = os.getenv('APPWRITE_API_KEY')
+        appwrite_endpoint = APPWRITE_CFG['endpoint']
+        appwrite_project_id = APPWRITE_CFG['project']
+        appwrite_api_key = APPWRITE_CFG['key']
         
         # Check if credentials are available
         if not all([appwrite_endpoint, appwrite_project_id, appwrite_api_key]):
@@ -116,6 +244,68 @@ def create_bucket_if_not_exists(storage, bucket_id="tts_files", bucket_name="TTS
     
     return True
 
+# Content hash -> Appwrite URL, so unchanged files are never uploaded twice. Kept in SQLite so every
+# upload is committed as it happens and API workers and extractor runs share one index.
+APPWRITE_INDEX_FILE = os.path.join("output", "appwrite_index.sqlite3")
+LEGACY_APPWRITE_INDEX_FILE = os.path.join("output", "appwrite_index.json")
+_appwrite_index_lock = threading.Lock()
+_appwrite_index_conn = None
+
+def get_appwrite_index_connection():
+    """Open the Appwrite index once per process, importing the old JSON index on first use."""
+    global _appwrite_index_conn
+    if _appwrite_index_conn is None:
+        os.makedirs(os.path.dirname(APPWRITE_INDEX_FILE), exist_ok=True)
+        conn = sqlite3.connect(APPWRITE_INDEX_FILE, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS uploads (key TEXT PRIMARY KEY, url TEXT NOT NULL)")
+        if os.path.exists(LEGACY_APPWRITE_INDEX_FILE):
+            try:
+                with open(LEGACY_APPWRITE_INDEX_FILE, 'rb') as f:
+                    legacy = json_loads(f.read()) or {}
+                conn.executemany("INSERT OR IGNORE INTO uploads (key, url) VALUES (?, ?)", legacy.items())
+                conn.commit()
+                os.replace(LEGACY_APPWRITE_INDEX_FILE, LEGACY_APPWRITE_INDEX_FILE + ".imported")
+            except FileNotFoundError:
+                # Another process imported it first
+                pass
+            except Exception as e:
+                print(f"Error importing {LEGACY_APPWRITE_INDEX_FILE}: {e}")
+        conn.commit()
+        _appwrite_index_conn = conn
+    return _appwrite_index_conn
+
+def lookup_appwrite_upload(key):
+    """Return the Appwrite URL already serving this content, or None."""
+    try:
+        with _appwrite_index_lock:
+            row = get_appwrite_index_connection().execute("SELECT url FROM uploads WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        print(f"Error reading {APPWRITE_INDEX_FILE}: {e}")
+        return None
+    return row[0] if row else None
+
+def appwrite_index_key(bucket_id, data=None, file_path=None):
+    """Hash bytes or a file (streamed) into an Appwrite index key for a bucket."""
+    h = hashlib.blake2b()
+    if file_path is not None:
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    else:
+        h.update(data)
+    return f"{bucket_id}:{h.hexdigest()}"
+
+def record_appwrite_upload(key, file_url):
+    """Remember the URL an uploaded file's content is served from."""
+    try:
+        with _appwrite_index_lock:
+            conn = get_appwrite_index_connection()
+            conn.execute("INSERT OR REPLACE INTO uploads (key, url) VALUES (?, ?)", (key, file_url))
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"Error saving {APPWRITE_INDEX_FILE}: {e}")
+
 def upload_to_appwrite(storage, file_path, bucket_id="tts_files"):
     """Upload a file to Appwrite storage and return the file URL."""
     if not storage or not os.path.exists(file_path):
@@ -125,6 +315,14 @@ def upload_to_appwrite(storage, file_path, bucket_id="tts_files"):
         # Extract filename from path
         file_name = os.path.basename(file_path)
         print(file_path)
+        
+        # Skip the upload when identical content is already in the bucket
+        index_key = appwrite_index_key(bucket_id, file_path=file_path)
+        cached_url = lookup_appwrite_upload(index_key)
+        if cached_url:
+            print(f"File '{file_name}' already uploaded to Appwrite: {cached_url}")
+            return cached_url
+        
         # Upload the file
         result = storage.create_file(
             bucket_id=bucket_id,
@@ -135,19 +333,64 @@ def upload_to_appwrite(storage, file_path, bucket_id="tts_files"):
         
         # Get file URL
         file_id = result['$id']
-        appwrite_endpoint = os.getenv('APPWRITE_ENDPOINT')
-        appwrite_project_id = os.getenv('APPWRITE_PROJECT_ID')
+        appwrite_endpoint = APPWRITE_CFG['endpoint']
+        appwrite_project_id = APPWRITE_CFG['project']
         file_url = f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files/{file_id}/view?project={appwrite_project_id}"
         
         print(f"Uploaded file '{file_name}' to Appwrite. File ID: {file_id}")
+        record_appwrite_upload(index_key, file_url)
         return file_url
     
     except Exception as e:
         print(f"Error uploading file '{file_path}': {e}")
         return None
 
+def upload_bytes_to_appwrite(storage, data, file_name, bucket_id="tts_files"):
+    """Upload in-memory bytes to Appwrite storage and return the file URL.
+    
+    The upload goes over the pooled session from get_appwrite_session(); the Appwrite
+    SDK opens a new connection per call, so `storage` only signals that Appwrite is configured.
+    """
+    if not storage or not data:
+        return None
+        
+    try:
+        # Skip the upload when identical content is already in the bucket
+        index_key = appwrite_index_key(bucket_id, data=data)
+        cached_url = lookup_appwrite_upload(index_key)
+        if cached_url:
+            print(f"'{file_name}' already uploaded to Appwrite: {cached_url}")
+            return cached_url
+        
+        appwrite_endpoint = APPWRITE_CFG['endpoint']
+        appwrite_project_id = APPWRITE_CFG['project']
+        
+        # Upload the bytes without going through a local file
+        response = get_appwrite_session().post(
+            f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files",
+            data={
+                'fileId': ID.unique(),
+                'permissions[]': [Permission.read(Role.any())]  # Allow public read access
+            },
+            files={'file': (file_name, data, 'audio/mpeg')},
+            timeout=60
+        )
+        response.raise_for_status()
+        
+        # Get file URL
+        file_id = response.json()['$id']
+        file_url = f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files/{file_id}/view?project={appwrite_project_id}"
+        
+        print(f"Uploaded '{file_name}' ({len(data)} bytes) to Appwrite. File ID: {file_id}")
+        record_appwrite_upload(index_key, file_url)
+        return file_url
+    
+    except Exception as e:
+        print(f"Error uploading '{file_name}': {e}")
+        return None
+
 def get_previously_processed_urls():
-    """Get a set of all article URLs that have already been processed in previous runs."""
+    """Get a frozenset of all article URLs that have already been processed in previous runs."""
     processed_urls = set()
     
     # Check for the fixed JSON file with processed articles
@@ -155,14 +398,12 @@ def get_previously_processed_urls():
     
     if os.path.exists(articles_json_file):
         try:
-            with open(articles_json_file, 'r', encoding='utf-8') as f:
-                articles = json.load(f)
+            with open(articles_json_file, 'rb') as f:
+                articles = json_loads(f.read())
                 
-                # Extract URLs from each article
-                for article in articles:
-                    if 'url' in article:
-                        processed_urls.add(article['url'])
-                        
+            # Extract URLs from each article
+            processed_urls.update(article['url'] for article in articles if 'url' in article)
+            
             print(f"Found {len(processed_urls)} previously processed articles from {articles_json_file}")
         except Exception as e:
             print(f"Error reading {articles_json_file}: {e}")
@@ -172,18 +413,17 @@ def get_previously_processed_urls():
     
     if os.path.exists(links_json_file):
         try:
-            with open(links_json_file, 'r', encoding='utf-8') as f:
-                links_data = json.load(f)
+            with open(links_json_file, 'rb') as f:
+                links_data = json_loads(f.read())
                 
-                # Add all links to processed_urls
-                for link in links_data:
-                    processed_urls.add(link)
-                    
+            # Add all links to processed_urls
+            processed_urls.update(links_data)
+            
             print(f"Found {len(processed_urls)} total previously processed articles after checking {links_json_file}")
         except Exception as e:
             print(f"Error reading {links_json_file}: {e}")
     
-    return processed_urls
+    return frozenset(processed_urls)
 
 def load_article_links_json():
     """Load all article links from the JSON file."""
@@ -192,8 +432,8 @@ def load_article_links_json():
     
     if os.path.exists(links_json_file):
         try:
-            with open(links_json_file, 'r', encoding='utf-8') as f:
-                links = json.load(f)
+            with open(links_json_file, 'rb') as f:
+                links = json_loads(f.read())
         except Exception as e:
             print(f"Error reading {links_json_file}: {e}")
     
@@ -203,21 +443,140 @@ def save_article_links_json(all_links):
     """Save all article links to the JSON file."""
     links_json_file = os.path.join("output", "the_hindu_article_links.json")
     
-    with open(links_json_file, 'w', encoding='utf-8') as f:
-        json.dump(all_links, f, indent=2, ensure_ascii=False)
+    write_json_file(links_json_file, all_links)
         
     print(f"Saved all article links to {links_json_file}")
 
+# Precompiled patterns for link extraction, content cleaning and filenames
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_PLAIN_URL_RE = re.compile(r'https?://[^\s\)\]\"\']+')
+_A_TAG_RE = re.compile(r'<a[^>]+href=[\'"]([^\'"]+)[\'"][^>]*>')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_LOC_RE = re.compile(r'^[A-Z]{3,}[,:]')
+_DATE_RE = re.compile(r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}')
+_TIME_RE = re.compile(r'^\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)(?:\s*IST)?')
+_ATTR_RE = re.compile(r'^By\s+[A-Za-z.\s]+|^(?:Special Correspondent|Staff Reporter)')
+_BUREAU_RE = re.compile(r'^(Bureau|Correspondent)$')
+_READ_LATER_RE = re.compile(r'READ LATER SEE ALL')
+_WS_RE = re.compile(r'\s+')
+# Any dateline/byline-style line that clean_content drops
+_SKIP_LINE_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in (_LOC_RE, _DATE_RE, _TIME_RE, _ATTR_RE, _BUREAU_RE)))
+# Leftover markers and "- The Hindu" suffixes, removed in one pass
+_FRAGMENTS_RE = re.compile(r'READ LATER SEE ALL|READ LATER|SEE ALL|\s+\-\s+The Hindu|The Hindu Bureau')
+# Space before a comma/period, or repeated periods
+_PUNCT_RE = re.compile(r'\s+(?=[,.])|(?<=\.)\.+')
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+# charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+def header_charset(content_type):
+    """Return the charset declared in a Content-Type header, or None if there is none."""
+    match = _CHARSET_RE.search(content_type or '')
+    return match.group(1) if match else None
+
+# Article pages end in .ece; the seed page filter uses this while parsing anchors
+_ARTICLE_HREF_RE = re.compile(r'\.ece$')
+# SVGs and icon/tracking images rejected by quality checks
+_BAD_IMG_RE = re.compile(r'\.svg(?:$|[?#])|icon|logo|spacer|pixel|1x1', re.IGNORECASE)
+
+# Navigation/footer lines to skip, and paywall markers that end the article body
+NAV_WORDS = (
+    'home', 'news', 'sections', 'next story', 'previous story', 
+    'related topics', 'comments', 'share', 'print', 'privacy policy',
+    'terms of use', 'copyright', 'all rights reserved',
+    'advertisement', 'subscribe now', 'sign up', 'login',
+    'read more', 'follow us', 'stay updated'
+)
+PAYWALL_WORDS = (
+    'paywall', 'subscription', 'subscribe', 'sign in', 
+    'register', 'already have an account'
+)
+_NAV_RE = re.compile('|'.join(map(re.escape, NAV_WORDS)), re.IGNORECASE)
+_PAYWALL_RE = re.compile('|'.join(map(re.escape, PAYWALL_WORDS)), re.IGNORECASE)
+
+# CSS selectors used by parse_article, compiled once instead of per article
+_SEL_TITLE = sv.compile('h1.title')
+_SEL_TITLE_FALLBACK = sv.compile('.article-title, .title, h1')
+_SEL_CONTENT = sv.compile('.content, .article p, article p, [itemprop="articleBody"] p')
+_SEL_PARAGRAPHS = sv.compile('p')
+_SEL_DATE_PUBLISHED = sv.compile('meta[itemprop="datePublished"]')
+_SEL_AUTHOR = sv.compile('meta[name="author"]')
+_SEL_BREADCRUMB = sv.compile('.breadcrumb li')
+_SEL_KEYWORDS = sv.compile('meta[name="keywords"]')
+_SEL_TAG_LINKS = sv.compile('.tags a, .article-tags a')
+_SEL_OG_IMAGE = sv.compile('meta[property="og:image"]')
+_SEL_ARTICLE_IMAGES = sv.compile('.article img, article img, [itemprop="articleBody"] img')
+
+# JPEG start-of-frame markers that carry the image dimensions (excludes DHT/JPG/DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def image_header_info(data):
+    """Read (format, width, height) from PNG/JPEG headers without decoding, or None."""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        return 'png', int.from_bytes(data[16:20], 'big'), int.from_bytes(data[20:24], 'big')
+    
+    if data[:2] == b'\xff\xd8':
+        # Walk the marker segments until the first SOF
+        i = 2
+        while i + 9 <= len(data):
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker in _JPEG_SOF_MARKERS:
+                height = int.from_bytes(data[i + 5:i + 7], 'big')
+                width = int.from_bytes(data[i + 7:i + 9], 'big')
+                return 'jpeg', width, height
+            i += 2 + int.from_bytes(data[i + 2:i + 4], 'big')
+    return None
+
+# Raw paragraph text gathered per article; content is stored capped at 5000 chars, and
+# this leaves headroom for what clean_content strips out
+RAW_CONTENT_LIMIT = 20000
+
+def joined_text(elems, limit=RAW_CONTENT_LIMIT):
+    """Join element texts with spaces, stopping once about `limit` characters are collected."""
+    parts = []
+    total = 0
+    for elem in elems:
+        text = elem.get_text().strip()
+        parts.append(text)
+        total += len(text) + 1
+        if total >= limit:
+            break
+    return ' '.join(parts)
+
+def make_article_id(url, headline):
+    """Build the stable 12-character article ID from an article's URL and headline."""
+    return hashlib.md5((url + headline).encode()).hexdigest()[:12]
+
+@functools.lru_cache(maxsize=100_000)
+def is_article_url(url):
+    """Check if a URL is a The Hindu article link; cached since index pages repeat links."""
+    # Cheap string checks first: must be absolute and end with .ece (article indicator)
+    if not url or not url.endswith('.ece') or not url.startswith('http'):
+        return False
+        
+    # Must be from thehindu.com domain
+    netloc = urlparse(url).netloc
+    return 'thehindu.com' in netloc or 'thehindubusinessline.com' in netloc
+
 class LatestNewsExtractor:
     def __init__(self):
         self.article_links = []
         self.visited_urls = set()
         self.browser_config = BrowserConfig(
             headless=True,
-            verbose=True
+            verbose=True,
+            text_mode=True  # Only the HTML is parsed, so skip image/CSS loading in the browser
         )
         self.seed_url = "https://www.thehindu.com/latest-news/"
         self.max_articles = 5  # Limit to 1 article
+        self.max_concurrency = int(os.getenv("EXTRACT_CONCURRENCY", "20"))  # Parallel article page fetches
+        self.max_image_concurrency_per_host = 5  # Stay under image CDN rate limits
+        self.max_page_concurrency_per_host = 10  # Politeness cap for article pages on one domain
+        self.request_jitter = 0.1  # Max random delay (seconds) before each page request
+        # Dedicated pool for HTML parsing so it doesn't queue behind aiofiles in the default executor
+        self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="parse")
         
         # Navigation elements to be removed from content
         self.navigation_text = "Business Agri-Business Economy Industry Markets Budget Children Cities Cities Bengaluru Chennai Coimbatore Delhi Hyderabad Kochi Kolkata Kozhikode Madurai Mangaluru Mumbai Puducherry Thiruvananthapuram Tiruchirapalli Vijayawada Visakhapatnam Data Point Podcast Ebook Education Education Careers Colleges Schools Elections Entertainment Entertainment Art Dance Movies Music Reviews Theatre Environment Food Food Dining Features Guides Recipes Good Health Hunting Monkeypox Life & Style Life & Style Fashion Fitness Homes and gardens Luxury Motoring Travel News News India World States Cities Ground Zero Spotlight Opinion Editorial Cartoon Columns Comment Interview Lead Letters Open Page Corrections & Clarifications Real Estate ISRO Question Corner Society Society Faith History & Culture Sport Cricket Football Hockey Tennis Athletics Motorsport Races Other Sports Between Wickets Specials States States Andhra Pradesh Karnataka Kerala Tamil Nadu Telangana Andaman and Nicobar Islands Arunachal Pradesh Assam Bihar Chandigarh Chhattisgarh Daman, Diu, Dadra and Nagar Haveli Goa Gujarat Haryana Himachal Pradesh Jammu and Kashmir Jharkhand Lakshadweep Ladakh Madhya Pradesh Maharashtra Manipur Meghalaya Mizoram Nagaland Odisha Other States Punjab Rajasthan Sikkim Tripura Uttar Pradesh Uttarakhand West Bengal Decode Karnataka Focus Tamil Nadu Technology Technology Gadgets Internet Visual Story Brandhub"
@@ -272,34 +631,35 @@ class LatestNewsExtractor:
         # Create SSL context for image downloads
         self.ssl_context = ssl._create_unverified_context()
         
+        # Pooled keep-alive session so repeated requests to thehindu.com skip the TCP+TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.verify = False
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Minimum image quality requirements
         self.min_width = 400
         self.min_height = 300
         self.min_file_size = 10 * 1024  # 10 KB
         self.allowed_formats = ['.jpg', '.jpeg', '.png']
+        self.image_accept = {"Accept": "image/jpeg,image/png"}  # Lets servers refuse SVG/other formats up front
         
     def is_article_link(self, url):
         """Check if a URL is an article link."""
-        if not url or not url.startswith('http'):
-            return False
-            
-        # Must be from thehindu.com domain
-        parsed = urlparse(url)
-        if not any(domain in parsed.netloc for domain in ['thehindu.com', 'thehindubusinessline.com']):
-            return False
-            
-        # Must end with .ece (article indicator)
-        if not url.endswith('.ece'):
-            return False
-            
-        return True
+        return is_article_url(url)
     
     def extract_links(self, content, base_url=None):
         """Extract links from page content."""
         links = []
         
         # Extract markdown-style links [text](URL)
-        md_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
+        md_links = _MD_LINK_RE.findall(content)
         for _, url in md_links:
             if url.startswith('http'):
                 links.append(url)
@@ -307,12 +667,12 @@ class LatestNewsExtractor:
                 links.append(urljoin(base_url, url))
         
         # Extract plain URLs
-        url_links = re.findall(r'https?://[^\s\)\]\"\']+', content)
+        url_links = _PLAIN_URL_RE.findall(content)
         links.extend(url_links)
         
         # Extract links from HTML-like anchor tags in markdown
         # This handles cases where the markdown might contain HTML
-        a_tag_links = re.findall(r'<a[^>]+href=[\'"]([^\'"]+)[\'"][^>]*>', content)
+        a_tag_links = _A_TAG_RE.findall(content)
         for url in a_tag_links:
             if url.startswith('http'):
                 links.append(url)
@@ -343,10 +703,10 @@ class LatestNewsExtractor:
                 return content
                 
             # Remove any HTML tags that might remain
-            content = re.sub(r'<[^>]+>', ' ', content)
+            content = _HTML_TAG_RE.sub(' ', content)
             
             # First detect and handle READ LATER SEE ALL markers 
-            read_later_match = re.search(r'READ LATER SEE ALL', content)
+            read_later_match = _READ_LATER_RE.search(content)
             if read_later_match:
                 # If we found the marker, check if there's substantial content after it
                 parts = content.split("READ LATER SEE ALL", 1)
@@ -361,19 +721,16 @@ class LatestNewsExtractor:
                     content = parts[1].strip()
             
             # Remove location markers at the beginning (like CHENNAI, NEW DELHI, etc.)
-            content = re.sub(r'^[A-Z]{3,}[,:]', '', content)
+            content = _LOC_RE.sub('', content)
             
             # Remove date markers at the beginning
-            date_pattern = r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}'
-            content = re.sub(date_pattern, '', content)
+            content = _DATE_RE.sub('', content)
             
             # Remove time markers at the beginning
-            time_pattern = r'^\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)(?:\s*IST)?'
-            content = re.sub(time_pattern, '', content)
+            content = _TIME_RE.sub('', content)
             
             # Remove attribution markers at the beginning (like By John Smith, Special Correspondent)
-            attribution_pattern = r'^By\s+[A-Za-z.\s]+|^(?:Special Correspondent|Staff Reporter)'
-            content = re.sub(attribution_pattern, '', content)
+            content = _ATTR_RE.sub('', content)
             
             # Split into lines for easier cleaning
             lines = content.split('\n')
@@ -392,21 +749,11 @@ class LatestNewsExtractor:
                     continue
                 
                 # Skip common navigation/footer elements
-                if any(nav in line.lower() for nav in [
-                    'home', 'news', 'sections', 'next story', 'previous story', 
-                    'related topics', 'comments', 'share', 'print', 'privacy policy',
-                    'terms of use', 'copyright', 'all rights reserved',
-                    'advertisement', 'subscribe now', 'sign up', 'login',
-                    'read more', 'follow us', 'stay updated'
-                ]):
+                if _NAV_RE.search(line):
                     continue
                 
                 # Skip Date/Location/Bureau lines
-                if (re.match(r'^[A-Z]{3,}[,:]', line) or 
-                    re.match(date_pattern, line) or 
-                    re.match(time_pattern, line) or
-                    re.match(attribution_pattern, line) or
-                    re.match(r'^(Bureau|Correspondent)$', line)):
+                if _SKIP_LINE_RE.match(line):
                     continue
                 
                 # Skip Photographer credit
@@ -426,10 +773,7 @@ class LatestNewsExtractor:
                     continue
                 
                 # If line contains words like 'paywall', 'subscription', etc., stop processing
-                if any(sub in line.lower() for sub in [
-                    'paywall', 'subscription', 'subscribe', 'sign in', 
-                    'register', 'already have an account'
-                ]):
+                if _PAYWALL_RE.search(line):
                     break
                 
                 # Add line to the cleaned content
@@ -439,24 +783,14 @@ class LatestNewsExtractor:
             content = '\n'.join(cleaned_lines)
             
             # Perform additional text cleanups
-            # Remove READ LATER SEE ALL if somehow it remains
-            content = re.sub(r'READ LATER SEE ALL', '', content)
-            content = re.sub(r'READ LATER', '', content)
-            content = re.sub(r'SEE ALL', '', content)
-            
-            # Remove "- The Hindu" suffix from any lines
-            content = re.sub(r'\s+\-\s+The Hindu', '', content)
-            
-            # Remove The Hindu Bureau mentions
-            content = re.sub(r'The Hindu Bureau', '', content)
+            # Remove leftover READ LATER / SEE ALL markers, "- The Hindu" suffixes and The Hindu Bureau mentions
+            content = _FRAGMENTS_RE.sub('', content)
             
             # Normalize whitespace
-            content = re.sub(r'\s+', ' ', content)
+            content = _WS_RE.sub(' ', content)
             
-            # Final clean of formatting artifacts
-            content = re.sub(r'\.{2,}', '.', content)  # Replace multiple periods
-            content = re.sub(r'\s+,', ',', content)    # Fix space before comma
-            content = re.sub(r'\s+\.', '.', content)   # Fix space before period
+            # Final clean of formatting artifacts: multiple periods, space before comma/period
+            content = _PUNCT_RE.sub('', content)
             
             return content.strip()
             
@@ -472,10 +806,15 @@ class LatestNewsExtractor:
                 print(f"Image too small (size): {img_url} - {len(image_content)} bytes")
                 return False
                 
-            # Check image dimensions and format
-            img = Image.open(io.BytesIO(image_content))
-            width, height = img.size
-            format_lower = img.format.lower() if img.format else ""
+            # Check image dimensions and format; PNG/JPEG headers are read directly, others via PIL
+            header = image_header_info(image_content)
+            if header:
+                format_lower, width, height = header
+            else:
+                # Image.open only parses the header; pixel data is never loaded here
+                with Image.open(io.BytesIO(image_content)) as img:
+                    width, height = img.size
+                    format_lower = img.format.lower() if img.format else ""
             
             # Check dimensions
             if width < self.min_width or height < self.min_height:
@@ -487,7 +826,7 @@ class LatestNewsExtractor:
             ext = format_to_ext.get(format_lower, f".{format_lower}")
             
             if ext not in self.allowed_formats:
-                print(f"Image format not allowed: {img_url} - {img.format}")
+                print(f"Image format not allowed: {img_url} - {format_lower}")
                 return False
                 
             return True
@@ -496,37 +835,52 @@ class LatestNewsExtractor:
             print(f"Error checking image quality for {img_url}: {str(e)}")
             return False
     
+    def too_small_by_header(self, content_length, img_url):
+        """Return True when a Content-Length header already fails min_file_size."""
+        try:
+            size = int(content_length or 0)
+        except ValueError:
+            return False
+        if size and size < self.min_file_size:
+            print(f"Image too small (size): {img_url} - {size} bytes")
+            return True
+        return False
+    
+    def image_target(self, img_url, article_title, position, quality_check=True):
+        """Return (filename, filepath) for an image URL, or None if it should be skipped."""
+        # Skip SVG files and small images/icons if doing quality check, before any other work
+        if quality_check:
+            bad = _BAD_IMG_RE.search(img_url)
+            if bad:
+                kind = "SVG" if bad.group().lower().startswith('.svg') else "icon/tracking"
+                print(f"Skipping {kind} image: {img_url}")
+                return None
+        
+        img_ext = os.path.splitext(urlparse(img_url).path)[1].lower()
+        
+        # Generate a safe filename
+        if not img_ext or img_ext not in self.allowed_formats:
+            img_ext = ".jpg"  # Default extension if none is found
+            
+        # Use a hash of the URL to ensure uniqueness
+        url_hash = hashlib.blake2b(img_url.encode(), digest_size=5).hexdigest()
+        
+        # Clean article title for filename
+        safe_title = _UNSAFE_FILENAME_RE.sub('', article_title)
+        safe_title = _WS_RE.sub('_', safe_title)
+        safe_title = safe_title[:30]  # Limit title length
+        
+        # Create filename with position and url hash for uniqueness
+        filename = f"{safe_title}_{position}_{url_hash}{img_ext}"
+        return filename, os.path.join(self.image_dir, filename)
+    
     def download_image(self, img_url, article_title, position, quality_check=True):
         """Download an image and save it to the images directory."""
         try:
-            # Skip SVG files and small images/icons if doing quality check
-            parsed_url = urlparse(img_url)
-            img_ext = os.path.splitext(parsed_url.path)[1].lower()
-            
-            if quality_check:
-                if img_ext == '.svg':
-                    print(f"Skipping SVG image: {img_url}")
-                    return None
-                    
-                if any(x in img_url.lower() for x in ['icon', 'logo', 'spacer', 'pixel', '1x1']):
-                    print(f"Skipping icon/tracking image: {img_url}")
-                    return None
-            
-            # Generate a safe filename
-            if not img_ext or img_ext not in self.allowed_formats:
-                img_ext = ".jpg"  # Default extension if none is found
-                
-            # Use a hash of the URL to ensure uniqueness
-            url_hash = hashlib.md5(img_url.encode()).hexdigest()[:10]
-            
-            # Clean article title for filename
-            safe_title = re.sub(r'[^\w\s-]', '', article_title)
-            safe_title = re.sub(r'\s+', '_', safe_title)
-            safe_title = safe_title[:30]  # Limit title length
-            
-            # Create filename with position and url hash for uniqueness
-            filename = f"{safe_title}_{position}_{url_hash}{img_ext}"
-            filepath = os.path.join(self.image_dir, filename)
+            target = self.image_target(img_url, article_title, position, quality_check)
+            if not target:
+                return None
+            filename, filepath = target
             
             # Check if file already exists
             if os.path.exists(filepath):
@@ -540,13 +894,17 @@ class LatestNewsExtractor:
             
             # Download the image content first to check quality
             try:
-                # Try with requests first (more robust)
-                response = requests.get(img_url, headers=self.headers, verify=False, timeout=10)
-                if response.status_code != 200:
-                    print(f"Failed to download image: {img_url} - Status code: {response.status_code}")
-                    return None
+                # Try with requests first (more robust); stream so undersized images are never read
+                headers = self.image_accept if quality_check else None
+                with self.session.get(img_url, headers=headers, stream=True, timeout=10) as response:
+                    if response.status_code != 200:
+                        print(f"Failed to download image: {img_url} - Status code: {response.status_code}")
+                        return None
                     
-                image_content = response.content
+                    if quality_check and self.too_small_by_header(response.headers.get('Content-Length'), img_url):
+                        return None
+                    
+                    image_content = response.content
                 
                 # Check if the image meets quality criteria
                 if quality_check and not self.is_good_image(image_content, img_url):
@@ -594,37 +952,193 @@ class LatestNewsExtractor:
             print(f"Error downloading image {img_url}: {str(e)}")
             return None
     
+    async def download_image_async(self, session, host_sems, img_url, article_title, position, quality_check=True):
+        """Download an image with aiohttp and write it with aiofiles."""
+        try:
+            target = self.image_target(img_url, article_title, position, quality_check)
+            if not target:
+                return None
+            filename, filepath = target
+            image_info = {
+                'url': img_url,
+                'local_path': filepath,
+                'filename': filename,
+                'position': position
+            }
+            
+            if os.path.exists(filepath):
+                print(f"Image already exists: {filename}")
+                return image_info
+            
+            # Bound concurrent downloads per host
+            async with host_sems[urlparse(img_url).netloc]:
+                headers = self.image_accept if quality_check else None
+                async with session.get(img_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status != 200:
+                        print(f"Failed to download image: {img_url} - Status code: {response.status}")
+                        return None
+                    if quality_check and self.too_small_by_header(response.headers.get('Content-Length'), img_url):
+                        return None
+                    image_content = await response.read()
+            
+            if quality_check and not self.is_good_image(image_content, img_url):
+                return None
+            
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(image_content)
+            print(f"Downloaded image: {filename}")
+            return image_info
+        except Exception as e:
+            print(f"Error downloading image {img_url}: {str(e)}")
+            return None
+    
+    def attach_images(self, article_data, saved_images, main_image_url):
+        """Add saved image info to article_data, picking the main image."""
+        main_image_filename = next((img for img in saved_images if img['url'] == main_image_url), None)
+        
+        # Set main image to first saved image if no main image was found
+        if not main_image_filename and saved_images:
+            main_image_filename = saved_images[0]
+        
+        # Add image information if available
+        if main_image_filename:
+            article_data['main_image'] = main_image_filename
+        
+        if saved_images:
+            article_data['images'] = saved_images
+        
+        return article_data
+    
     def extract_content_from_url(self, url):
         """Extract article content from a given URL."""
         try:
             # Make a request to the article URL
-            response = requests.get(url, headers=self.headers, verify=False, timeout=30)
+            response = self.session.get(url, timeout=30)
             
             if response.status_code != 200:
                 print(f"Failed to fetch article: {url} - Status code: {response.status_code}")
                 return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+        except Exception as e:
+            print(f"Error extracting content from {url}: {str(e)}")
+            return None
+        
+        parsed = self.parse_article(url, response.content, header_charset(response.headers.get('Content-Type')))
+        if not parsed:
+            return None
+        article_data, image_urls, main_image_url = parsed
+        
+        # Download the article's images in parallel over the pooled session
+        with ThreadPoolExecutor(max_workers=self.max_image_concurrency_per_host) as executor:
+            images = executor.map(
+                lambda img_url: self.download_image(img_url, article_data['headline'], 0, quality_check=False),
+                image_urls
+            )
+            saved_images = [image for image in images if image]
+        
+        return self.attach_images(article_data, saved_images, main_image_url)
+    
+    async def extract_content_from_url_async(self, session, host_sems, url):
+        """Fetch an article page with a shared aiohttp session and parse it."""
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    print(f"Failed to fetch article: {url} - Status code: {response.status}")
+                    return None
+                html = await response.read()
+                encoding = response.charset
+        except Exception as e:
+            print(f"Error extracting content from {url}: {str(e)}")
+            return None
+        
+        return await self.build_article_async(session, host_sems, url, html, encoding)
+    
+    async def build_article_async(self, session, host_sems, url, html, encoding=None):
+        """Parse fetched article HTML and download its images concurrently."""
+        # Parsing is CPU-bound, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        parsed = await loop.run_in_executor(self._parse_pool, self.parse_article, url, html, encoding)
+        if not parsed:
+            return None
+        article_data, image_urls, main_image_url = parsed
+        
+        images = await asyncio.gather(*(
+            self.download_image_async(session, host_sems, img_url, article_data['headline'], 0, quality_check=False)
+            for img_url in image_urls
+        ))
+        saved_images = [image for image in images if image]
+        
+        return self.attach_images(article_data, saved_images, main_image_url)
+    
+    async def extract_all(self, urls):
+        """Fetch and parse article URLs concurrently, preserving input order."""
+        sem = asyncio.Semaphore(self.max_concurrency)
+        host_sems = defaultdict(lambda: asyncio.Semaphore(self.max_image_concurrency_per_host))
+        page_host_sems = defaultdict(lambda: asyncio.Semaphore(self.max_page_concurrency_per_host))
+        connector = aiohttp.TCPConnector(ssl=False, limit=self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout) as session:
+            async def one(i, url):
+                async with sem, page_host_sems[urlparse(url).netloc]:
+                    # Stagger request starts so a batch does not hit the site in one burst
+                    await asyncio.sleep(random.uniform(0, self.request_jitter))
+                    print(f"Processing article {i}/{len(urls)}: {url}")
+                    return await self.extract_content_from_url_async(session, host_sems, url)
+            
+            results = await asyncio.gather(*(one(i, url) for i, url in enumerate(urls, 1)))
+            
+            # Pages the direct fetch could not handle get one batched browser crawl
+            failed = [url for url, article in zip(urls, results) if not article]
+            if failed:
+                rendered = await self.crawl_articles(failed)
+                recoverable = [url for url in failed if url in rendered]
+                recovered = await asyncio.gather(*(
+                    self.build_article_async(session, host_sems, url, rendered[url]) for url in recoverable
+                ))
+                recovered = dict(zip(recoverable, recovered))
+                results = [article or recovered.get(url) for url, article in zip(urls, results)]
+            
+            return results
+    
+    async def crawl_articles(self, urls):
+        """Render article pages in a single browser session with arun_many; returns {url: html}."""
+        print(f"Crawling {len(urls)} articles with the browser crawler...")
+        try:
+            async with AsyncWebCrawler(config=self.browser_config) as crawler:
+                results = await crawler.arun_many(urls=urls, bypass_cache=True)
+        except Exception as e:
+            print(f"Error crawling articles: {str(e)}")
+            return {}
+        
+        rendered = {}
+        for url, result in zip(urls, results):
+            if result.success and result.html:
+                rendered[result.url if result.url in urls else url] = result.html
+        return rendered
+    
+    def parse_article(self, url, html, encoding=None):
+        """Parse an article page (raw bytes or str) into (article_data, image_urls, main_image_url)."""
+        try:
+            # Raw bytes go straight to the parser; a charset from the HTTP headers skips encoding detection
+            soup = BeautifulSoup(html, HTML_PARSER, from_encoding=encoding if isinstance(html, bytes) else None)
             
             # Extract the headline
-            headline_elem = soup.select_one('h1.title')
+            headline_elem = _SEL_TITLE.select_one(soup)
             if headline_elem:
                 headline = headline_elem.get_text().strip()
             else:
                 # Fallback to other possible headline elements
-                headline_elem = soup.select_one('.article-title, .title, h1')
+                headline_elem = _SEL_TITLE_FALLBACK.select_one(soup)
                 headline = headline_elem.get_text().strip() if headline_elem else "Unknown Headline"
             
             # Extract the summary/content
-            content_elems = soup.select('.content, .article p, article p, [itemprop="articleBody"] p')
-            content = ' '.join(elem.get_text().strip() for elem in content_elems)
+            content = joined_text(_SEL_CONTENT.iselect(soup))
             content = self.clean_content(content)
             
             # Ensure we have at least some content/summary
             if not content:
                 # Try alternate content selectors
-                content_elems = soup.select('p')
-                content = ' '.join(elem.get_text().strip() for elem in content_elems)
+                content = joined_text(_SEL_PARAGRAPHS.iselect(soup))
                 content = self.clean_content(content)
                 
             # If still no content, use a default summary with the headline
@@ -634,14 +1148,14 @@ class LatestNewsExtractor:
             summary = content[:1000]  # Just use the first 1000 chars as summary
             
             # Extract the date
-            date_elem = soup.select_one('meta[itemprop="datePublished"]')
+            date_elem = _SEL_DATE_PUBLISHED.select_one(soup)
             if date_elem and date_elem.get('content'):
                 date = date_elem['content'].split('T')[0]  # Get just the date part
             else:
                 date = datetime.now().strftime("%Y-%m-%d")
             
-            # Extract the time
-            time_elem = soup.select_one('meta[itemprop="datePublished"]')
+            # Extract the time (from the same datePublished meta tag)
+            time_elem = date_elem
             if time_elem and time_elem.get('content') and 'T' in time_elem['content']:
                 time_str = time_elem['content'].split('T')[1]
                 if '+' in time_str:  # Handle format like "2023-04-03T14:30:00+05:30"
@@ -651,19 +1165,19 @@ class LatestNewsExtractor:
                 time_str = datetime.now().strftime("%H:%M:%S")
             
             # Extract the author
-            author_elem = soup.select_one('meta[name="author"]')
+            author_elem = _SEL_AUTHOR.select_one(soup)
             author = author_elem['content'] if author_elem and author_elem.get('content') else "Unknown Author"
             
             # Extract the source
             source = "The Hindu"
             
             # Extract the category
-            category_elems = soup.select('.breadcrumb li')
+            category_elems = _SEL_BREADCRUMB.select(soup)
             categories = [elem.get_text().strip() for elem in category_elems if elem.get_text().strip()]
             category = categories[-1] if categories else "General"
             
             # Extract tags/keywords
-            tag_elems = soup.select('meta[name="keywords"]')
+            tag_elems = _SEL_KEYWORDS.select(soup)
             tags = []
             for tag_elem in tag_elems:
                 if tag_elem.get('content'):
@@ -672,51 +1186,35 @@ class LatestNewsExtractor:
             
             if not tags:
                 # Try alternate tag locations
-                tag_elems = soup.select('.tags a, .article-tags a')
+                tag_elems = _SEL_TAG_LINKS.select(soup)
                 tags = [tag.get_text().strip() for tag in tag_elems if tag.get_text().strip()]
             
             # Get images
             main_image_url = None
             image_urls = []
+            seen_image_urls = set()  # Same CDN URL often appears more than once per page
             
             # Try to find the main image
-            main_image = soup.select_one('meta[property="og:image"]')
+            main_image = _SEL_OG_IMAGE.select_one(soup)
             if main_image and main_image.get('content'):
                 main_image_url = main_image['content']
                 image_urls.append(main_image_url)
+                seen_image_urls.add(main_image_url)
             
             # Get additional images from the article
-            img_elems = soup.select('.article img, article img, [itemprop="articleBody"] img')
+            img_elems = _SEL_ARTICLE_IMAGES.select(soup)
             for img in img_elems:
                 if img.get('src'):
                     img_url = img['src']
                     # Make sure URL is absolute
                     if not img_url.startswith('http'):
                         img_url = urljoin(url, img_url)
-                    if img_url not in image_urls:
+                    if img_url not in seen_image_urls:
+                        seen_image_urls.add(img_url)
                         image_urls.append(img_url)
             
-            # Download and save images
-            saved_images = []
-            main_image_filename = None
-            
-            # # Download and save images - COMMENTED OUT
-            saved_images = []
-            main_image_filename = None
-            
-            for img_url in image_urls:
-                filename = self.download_image(img_url, headline, 0, quality_check=False)
-                if filename:
-                    saved_images.append(filename)
-                    if img_url == main_image_url:
-                        main_image_filename = filename
-            
-            # Set main image to first saved image if no main image was found
-            if not main_image_filename and saved_images:
-                main_image_filename = saved_images[0]
-            
-            # Generate a unique article ID based on URL and content hash
-            article_id = hashlib.md5((url + headline).encode()).hexdigest()[:12]
+            # Generate a unique article ID based on URL and headline; this is the only place it is assigned
+            article_id = make_article_id(url, headline)
             
             # Create article data structure
             article_data = {
@@ -734,14 +1232,7 @@ class LatestNewsExtractor:
                 'language': 'en'  # Default language is English
             }
             
-            # Add image information if available
-            if main_image_filename:
-                article_data['main_image'] = main_image_filename
-            
-            if saved_images:
-                article_data['images'] = saved_images
-            
-            return article_data
+            return article_data, image_urls, main_image_url
             
         except Exception as e:
             print(f"Error extracting content from {url}: {str(e)}")
@@ -757,32 +1248,30 @@ class LatestNewsExtractor:
             print(f"Found {len(previously_processed)} previously processed articles")
             
             # Get the latest news page
-            response = requests.get(self.seed_url, headers=self.headers, verify=False)
+            response = self.session.get(self.seed_url, timeout=30)
             
             if response.status_code != 200:
                 print(f"Failed to fetch latest news page: {self.seed_url} - Status code: {response.status_code}")
                 return []
                 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=header_charset(response.headers.get('Content-Type')))
             
-            # Extract links from the latest news page
-            raw_links = []
-            for a in soup.find_all('a', href=True):
-                raw_links.append(a['href'])
+            # Extract candidate article links from the latest news page; non-.ece anchors are filtered during the search
+            raw_links = [a['href'] for a in soup.find_all('a', href=_ARTICLE_HREF_RE)]
                 
             # Clean and filter links to get article links
             article_links = []
-            processed_in_batch = set()  # Track URLs we've already added in this batch
+            seen = set(previously_processed)  # Previously processed URLs plus those added in this batch
             
             for link in raw_links:
                 # Make sure URL is absolute
                 if not link.startswith('http'):
                     link = urljoin(self.seed_url, link)
                     
-                # Only add if it's an article link, hasn't been processed before, and not already in our batch
-                if self.is_article_link(link) and link not in previously_processed and link not in processed_in_batch:
+                # Only add if it's an article link that hasn't been processed before or already in our batch
+                if link not in seen and self.is_article_link(link):
                     article_links.append(link)
-                    processed_in_batch.add(link)
+                    seen.add(link)
             
             print(f"Found {len(article_links)} new article links")
             
@@ -790,8 +1279,10 @@ class LatestNewsExtractor:
             all_links = load_article_links_json()
             
             # Add new links to the collection (avoiding duplicates)
+            known_links = set(all_links)
             for link in article_links:
-                if link not in all_links:
+                if link not in known_links:
+                    known_links.add(link)
                     all_links.append(link)
             
             # Save all links back to JSON
@@ -801,9 +1292,11 @@ class LatestNewsExtractor:
             articles = []
             max_articles = min(55, len(article_links)) if self.max_articles == 0 else min(self.max_articles, len(article_links))
             
-            for i, url in enumerate(article_links[:max_articles], 1):
-                print(f"Processing article {i}/{max_articles}: {url}")
-                article = self.extract_content_from_url(url)
+            batch = article_links[:max_articles]
+            print(f"Fetching {len(batch)} articles with up to {self.max_concurrency} concurrent requests")
+            results = asyncio.run(self.extract_all(batch))
+            
+            for i, article in enumerate(results, 1):
                 if article:
                     articles.append(article)
                     print(f"✓ Successfully processed article {i}/{max_articles}")
@@ -817,13 +1310,83 @@ class LatestNewsExtractor:
             print(f"Error extracting latest articles: {str(e)}")
             return []
 
+# Persistent TTS cache: synthesized audio and its Appwrite URL keyed by hash(text + voice)
+TTS_CACHE_DIR = os.path.join("output", "tts_cache")
+TTS_CACHE_INDEX_FILE = os.path.join(TTS_CACHE_DIR, "tts_cache_index.json")
+
+def load_tts_cache_index():
+    """Load the TTS cache index mapping cache keys to Appwrite URLs."""
+    if os.path.exists(TTS_CACHE_INDEX_FILE):
+        try:
+            with open(TTS_CACHE_INDEX_FILE, 'rb') as f:
+                return json_loads(f.read()) or {}
+        except Exception as e:
+            print(f"Error reading {TTS_CACHE_INDEX_FILE}: {e}")
+    return {}
+
+tts_cache_index = load_tts_cache_index()
+
+# TTS request settings shared by every synthesis call
+AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=texttospeech.AudioEncoding.MP3,
+    effects_profile_id=["high-quality-studio"]
+)
+# TTS language codes whose named voice was rejected once; later calls go straight to the generic voice.
+# Only a rejection of the voice itself is remembered; timeouts and quota errors are retried next time.
+_generic_voice_langs = set()
+VOICE_REJECTED_ERRORS = (google_exceptions.InvalidArgument, google_exceptions.NotFound)
+
+# Per-language voice name and VoiceSelectionParams, built once instead of per article
+VOICE_NAMES = {lang: f"{cfg['tts_code']}-Chirp3-HD-Kore" for lang, cfg in INDIAN_LANGUAGES.items()}
+VOICE_PARAMS = {
+    lang: texttospeech.VoiceSelectionParams(language_code=cfg['tts_code'], name=VOICE_NAMES[lang])
+    for lang, cfg in INDIAN_LANGUAGES.items()
+}
+GENERIC_VOICE_PARAMS = {
+    lang: texttospeech.VoiceSelectionParams(language_code=cfg['tts_code'])
+    for lang, cfg in INDIAN_LANGUAGES.items()
+}
+
+def tts_cache_key(text, voice_name):
+    """Build the TTS cache key for a piece of text spoken with a given voice."""
+    return hashlib.blake2b((text + voice_name).encode('utf-8'), digest_size=16).hexdigest()
+
+def article_tts_voice(article_data):
+    """Return (language_code, tts_language_code, voice_name) used to voice an article."""
+    # Use English as default language or get from article if available
+    language_code = article_data.get('language', 'en')
+    
+    # Check if language code has correct format, if not use default
+    if language_code not in INDIAN_LANGUAGES:
+        language_code = 'en'
+        
+    return language_code, INDIAN_LANGUAGES[language_code]['tts_code'], VOICE_NAMES[language_code]
+
+def article_tts_cache_key(article_data):
+    """Return the TTS cache key for an article's summary, or None without a summary."""
+    summary = article_data.get('summary', '')
+    if not summary:
+        return None
+    return tts_cache_key(summary, article_tts_voice(article_data)[2])
+
+def tts_cache_path(key):
+    """Return the path of the cached audio file for a cache key."""
+    return os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+
+def record_tts_url(key, file_url):
+    """Remember the Appwrite URL for cached audio and persist the index."""
+    if not key or not file_url:
+        return
+    tts_cache_index[key] = file_url
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        write_json_file(TTS_CACHE_INDEX_FILE, tts_cache_index)
+    except Exception as e:
+        print(f"Error saving {TTS_CACHE_INDEX_FILE}: {e}")
+
 # Add function to generate voice file for summary
 def generate_voice_file(article_data):
     """Generate a voice file for the article summary and return the file path."""
-    if not credentials:
-        print("Skipping voice generation: No credentials available")
-        return None
-        
     try:
         # Get the summary text
         summary = article_data.get('summary', '')
@@ -831,56 +1394,7 @@ def generate_voice_file(article_data):
             print("Skipping voice generation: No summary available")
             return None
             
-        # Use English as default language or get from article if available
-        language_code = article_data.get('language', 'en')
-        
-        # Check if language code has correct format, if not use default
-        if language_code not in INDIAN_LANGUAGES:
-            language_code = 'en'
-            
-        # Get the TTS language code
-        tts_language_code = INDIAN_LANGUAGES[language_code]['tts_code']
-        
-        # Create TTS client
-        client = texttospeech.TextToSpeechClient(credentials=credentials)
-        
-        # Get the voice name
-        voice_name = f"{tts_language_code}-Chirp3-HD-Kore"
-        
-        # Set up the input
-        synthesis_input = texttospeech.SynthesisInput(text=summary)
-        
-        # Set up the voice
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=tts_language_code,
-            name=voice_name
-        )
-        
-        # Set up the audio config
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            effects_profile_id=["high-quality-studio"]
-        )
-        
-        print(f"Generating speech for article: {article_data.get('headline', '')[:30]}...")
-        try:
-            response = client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
-        except Exception as e:
-            print(f"Error with specific voice {voice_name}, trying generic voice: {e}")
-            # Fallback to generic voice selection
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=tts_language_code
-            )
-            response = client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
-            print(f"Successfully generated speech with generic voice for {tts_language_code}")
+        language_code, tts_language_code, voice_name = article_tts_voice(article_data)
         
         # Create output directory for the language
         lang_dir = INDIAN_LANGUAGES[language_code]['name']
@@ -890,7 +1404,7 @@ def generate_voice_file(article_data):
         # Get article ID from article data or generate a new one if not available
         article_id = article_data.get('article_id')
         if not article_id:
-            article_id = hashlib.md5(article_data.get('url', '').encode()).hexdigest()[:12]
+            article_id = make_article_id(article_data.get('url', ''), article_data.get('headline', ''))
             
         # Get the first two letters of the language code
         lang_prefix = language_code[:2]
@@ -898,9 +1412,53 @@ def generate_voice_file(article_data):
         # Create output path with format: [language_code]_[article_id].mp3
         output_file = os.path.join(voice_dir, f"{lang_prefix}_{article_id}.mp3")
         
-        # Write the audio content
+        # Reuse previously synthesized audio for the same text and voice. A file already at output_file
+        # is not trusted on its own: it may hold audio for an earlier version of the summary.
+        cache_file = tts_cache_path(tts_cache_key(summary, voice_name))
+        if os.path.exists(cache_file):
+            shutil.copyfile(cache_file, output_file)
+            print(f"Using cached audio for article: {article_data.get('headline', '')[:30]}")
+            return os.path.relpath(output_file)
+        
+        client = get_tts_client()
+        if not client:
+            print("Skipping voice generation: No credentials available")
+            return None
+        
+        # Set up the input
+        synthesis_input = texttospeech.SynthesisInput(text=summary)
+        
+        print(f"Generating speech for article: {article_data.get('headline', '')[:30]}...")
+        response = None
+        if tts_language_code not in _generic_voice_langs:
+            try:
+                response = client.synthesize_speech(
+                    input=synthesis_input,
+                    voice=VOICE_PARAMS[language_code],
+                    audio_config=AUDIO_CONFIG
+                )
+            except Exception as e:
+                print(f"Error with specific voice {voice_name}, trying generic voice: {e}")
+                if isinstance(e, VOICE_REJECTED_ERRORS):
+                    _generic_voice_langs.add(tts_language_code)
+        
+        if response is None:
+            # Fallback to generic voice selection
+            response = client.synthesize_speech(
+                input=synthesis_input,
+                voice=GENERIC_VOICE_PARAMS[language_code],
+                audio_config=AUDIO_CONFIG
+            )
+            print(f"Successfully generated speech with generic voice for {tts_language_code}")
+        
+        # Write the audio content, keeping a copy in the TTS cache
         with open(output_file, "wb") as out:
             out.write(response.audio_content)
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        # Renamed into place so an interrupted write never leaves a truncated cache hit
+        with open(cache_file + ".tmp", "wb") as out:
+            out.write(response.audio_content)
+        os.replace(cache_file + ".tmp", cache_file)
         
         print(f"Audio content written to '{output_file}'")
         
@@ -939,29 +1497,50 @@ def main():
         
         # Track which files were successfully uploaded
         successfully_uploaded_files = []
+        pending_uploads = []
+        to_synthesize = []
         
         # Generate voice files for each article
         print("Generating voice files for article summaries...")
         for article in articles:
-            # Ensure the article has an article_id
-            if 'article_id' not in article:
-                # Generate a unique article ID based on URL and headline
-                article['article_id'] = hashlib.md5((article.get('url', '') + article.get('headline', '')).encode()).hexdigest()[:12]
-            
             # Set default language if not present
             if 'language' not in article:
                 article['language'] = 'en'
-                
-            voice_file = generate_voice_file(article)
-            if voice_file:
-                article['voice_file'] = voice_file
-                
-                # If Appwrite is available, upload the file and add URL to article
-                if appwrite_available:
+            
+            # Skip synthesis and upload entirely when this text/voice was uploaded before
+            tts_key = article_tts_cache_key(article)
+            cached_url = tts_cache_index.get(tts_key) if tts_key else None
+            if cached_url:
+                article['voice_file_url'] = cached_url
+                if os.path.exists(tts_cache_path(tts_key)):
+                    article['voice_file'] = os.path.relpath(tts_cache_path(tts_key))
+                print(f"Reused cached Appwrite URL for article: {article.get('headline', '')[:30]}")
+                continue
+            
+            to_synthesize.append((article, tts_key))
+        
+        # Synthesize concurrently on the shared TTS client; results are applied in article order
+        with ThreadPoolExecutor(max_workers=TTS_CONCURRENCY) as executor:
+            voice_files = executor.map(generate_voice_file, [article for article, _ in to_synthesize])
+            for (article, tts_key), voice_file in zip(to_synthesize, voice_files):
+                if voice_file:
+                    article['voice_file'] = voice_file
+                    
+                    # If Appwrite is available, queue the file for upload
+                    if appwrite_available:
+                        pending_uploads.append((article, voice_file, tts_key))
+        
+        # Upload voice files concurrently; the Appwrite SDK is synchronous so use threads
+        if pending_uploads:
+            print(f"Uploading {len(pending_uploads)} voice files to Appwrite...")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(upload_to_appwrite, storage, voice_file) for _, voice_file, _ in pending_uploads]
+                for (article, voice_file, tts_key), future in zip(pending_uploads, futures):
                     try:
-                        file_url = upload_to_appwrite(storage, voice_file)
+                        file_url = future.result()
                         if file_url:
                             article['voice_file_url'] = file_url
+                            record_tts_url(tts_key, file_url)
                             print(f"Added Appwrite URL to article: {article.get('headline', '')[:30]}")
                             # Mark file for deletion after successful upload
                             successfully_uploaded_files.append(voice_file)
@@ -971,8 +1550,7 @@ def main():
         # Save articles to output directory with a fixed filename (replacing previous file)
         output_file = os.path.join(extractor.base_dir, "latest_articles.json")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, indent=2, ensure_ascii=False)
+        write_json_file(output_file, articles)
             
         print(f"Articles saved to {output_file}")
         
@@ -985,10 +1563,10 @@ def main():
                 import uuid
                 
                 # Load credentials from environment
-                appwrite_endpoint = os.getenv('APPWRITE_ENDPOINT')
-                appwrite_project_id = os.getenv('APPWRITE_PROJECT_ID')
-                appwrite_api_key = os.getenv('APPWRITE_API_KEY')
-                bucket_id = os.getenv('APPWRITE_AUDIO_BUCKET_ID', 'tts_files')
+                appwrite_endpoint = APPWRITE_CFG['endpoint']
+                appwrite_project_id = APPWRITE_CFG['project']
+                appwrite_api_key = APPWRITE_CFG['key']
+                bucket_id = APPWRITE_CFG['bucket']
                 
                 if all([appwrite_endpoint, appwrite_project_id, appwrite_api_key]):
                     print("Found Appwrite credentials in environment. Attempting direct HTTP upload...")
@@ -997,80 +1575,73 @@ def main():
                     updated_articles = 0
                     uploaded_files = []
                     
-                    # Process each article with voice file
-                    for article in articles:
-                        if 'voice_file' in article and not article.get('voice_file_url'):
-                            voice_file = article['voice_file']
+                    def upload_one(voice_file):
+                        """Upload one voice file over the pooled Appwrite session; returns (file_name, file_url)."""
+                        file_name = os.path.basename(voice_file)
+                        file_id = str(uuid.uuid4())
+                        url = f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files"
+                        try:
+                            with open(voice_file, 'rb') as file_content:
+                                # Project/key headers are already set on the session
+                                response = get_appwrite_session().post(
+                                    url,
+                                    data={'fileId': file_id},
+                                    files={'file': (file_name, file_content, 'audio/mpeg')},
+                                    timeout=60
+                                )
+                            
+                            # Check response
+                            if response.status_code == 201 or response.status_code == 200:
+                                # Create public URL
+                                file_url = f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files/{file_id}/view?project={appwrite_project_id}"
+                                print(f"Successfully uploaded {file_name}. URL: {file_url}")
+                                return file_name, file_url
+                            
+                            print(f"Error uploading {file_name}. Status code: {response.status_code}")
+                            print(f"Response: {response.text}")
+                        except Exception as e:
+                            print(f"Exception uploading {file_name}: {str(e)}")
+                        return file_name, None
+                    
+                    # Upload every article's voice file that exists and has no URL yet, in parallel
+                    pending = [
+                        article for article in articles
+                        if 'voice_file' in article and not article.get('voice_file_url') and os.path.exists(article['voice_file'])
+                    ]
+                    print(f"Uploading {len(pending)} voice files...")
+                    
+                    # Append each uploaded URL to voice_urls.jsonl as soon as it completes
+                    urls_file = os.path.join(extractor.base_dir, "voice_urls.jsonl")
+                    with ThreadPoolExecutor(max_workers=8) as executor, open(urls_file, 'ab') as urls_log:
+                        results = executor.map(upload_one, [article['voice_file'] for article in pending])
+                        for article, (file_name, file_url) in zip(pending, results):
+                            if not file_url:
+                                continue
+                            
+                            # Update article with URL
+                            article['voice_file_url'] = file_url
+                            record_tts_url(article_tts_cache_key(article), file_url)
+                            updated_articles += 1
                             
-                            # Check if the file exists
-                            if os.path.exists(voice_file):
-                                print(f"Uploading voice file for article: {article.get('headline', '')[:30]}...")
-                                
-                                # Get file name from path
-                                file_name = os.path.basename(voice_file)
-                                file_id = str(uuid.uuid4())
-                                
-                                # Prepare request
-                                url = f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files"
-                                
-                                headers = {
-                                    'X-Appwrite-Project': appwrite_project_id,
-                                    'X-Appwrite-Key': appwrite_api_key
-                                }
-                                
-                                # Upload file
-                                try:
-                                    with open(voice_file, 'rb') as file_content:
-                                        data = {
-                                            'fileId': file_id
-                                        }
-                                        
-                                        files = {
-                                            'file': (file_name, file_content, 'audio/mpeg')
-                                        }
-                                        
-                                        # Make the request
-                                        response = requests.post(url, headers=headers, data=data, files=files)
-                                        
-                                        # Check response
-                                        if response.status_code == 201 or response.status_code == 200:
-                                            # Create public URL
-                                            file_url = f"{appwrite_endpoint}/storage/buckets/{bucket_id}/files/{file_id}/view?project={appwrite_project_id}"
-                                            print(f"Successfully uploaded {file_name}. URL: {file_url}")
-                                            
-                                            # Update article with URL
-                                            article['voice_file_url'] = file_url
-                                            updated_articles += 1
-                                            
-                                            # Track successful uploads
-                                            uploaded_files.append({
-                                                'article_id': article.get('article_id', ''),
-                                                'filename': file_name,
-                                                'url': file_url
-                                            })
-                                            
-                                            # Mark file for deletion after successful upload
-                                            successfully_uploaded_files.append(voice_file)
-                                        else:
-                                            print(f"Error uploading {file_name}. Status code: {response.status_code}")
-                                            print(f"Response: {response.text}")
-                                
-                                except Exception as e:
-                                    print(f"Exception uploading {file_name}: {str(e)}")
+                            # Track successful uploads
+                            entry = {
+                                'article_id': article.get('article_id', ''),
+                                'filename': file_name,
+                                'url': file_url
+                            }
+                            uploaded_files.append(entry)
+                            urls_log.write(json_line(entry))
+                            urls_log.flush()
+                            
+                            # Mark file for deletion after successful upload
+                            successfully_uploaded_files.append(article['voice_file'])
                     
                     # If any articles were updated, save the file again
                     if updated_articles > 0:
                         # Save updated articles
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(articles, f, indent=2, ensure_ascii=False)
+                        write_json_file(output_file, articles)
                         print(f"Updated {updated_articles} articles with voice file URLs.")
-                        
-                        # Save a separate file with just the uploaded URLs
-                        if uploaded_files:
-                            urls_file = os.path.join(extractor.base_dir, "voice_urls.json")
-                            with open(urls_file, 'w', encoding='utf-8') as f:
-                                json.dump(uploaded_files, f, indent=2, ensure_ascii=False)
-                            print(f"Saved {len(uploaded_files)} voice file URLs to {urls_file}")
+                        print(f"Appended {len(uploaded_files)} voice file URLs to {urls_file}")
                 else:
                     print("Missing required Appwrite credentials in environment variables.")
             except ImportError:
@@ -1081,16 +1652,24 @@ def main():
         # Delete successfully uploaded audio files to save space
         if successfully_uploaded_files:
             print(f"Cleaning up {len(successfully_uploaded_files)} successfully uploaded audio files...")
-            for file_path in successfully_uploaded_files:
+            
+            def remove_file(file_path):
+                # EAFP: one unlink syscall instead of stat + unlink
                 try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                        print(f"Deleted: {file_path}")
-                except Exception as e:
+                    os.remove(file_path)
+                    print(f"Deleted: {file_path}")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
                     print(f"Error deleting file {file_path}: {e}")
+            
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(remove_file, successfully_uploaded_files))
             print("Cleanup completed.")
     else:
         print("No articles were extracted")
+    
+    return articles
 
 if __name__ == "__main__":
     main()
@@ -1,24 +1,61 @@
 #!/usr/bin/env python
 import os
 import sys
-import glob
 import time
 import json
+import hashlib
+import atexit
+import types
+import functools
 import logging
+import logging.handlers
 import subprocess
+import threading
+import collections
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+from translation_files import (
+    TRANSLATION_SUFFIXES, latest_translation_file, read_translation_manifest, translation_manifest, write_atomic
 )
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging: records are buffered and written in batches, errors flush immediately
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+))
+_memory_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_stream_handler)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(_memory_handler)
+atexit.register(_memory_handler.flush)
 logger = logging.getLogger("news_pipeline")
 
+# A quiet stretch would otherwise leave INFO records sitting in the buffer, so flush on a timer too
+LOG_FLUSH_SECONDS = float(os.getenv("PIPELINE_LOG_FLUSH_SECONDS", "2"))
+
+def _flush_logs_periodically():
+    """Flush the log buffer every LOG_FLUSH_SECONDS for the life of the process"""
+    while True:
+        time.sleep(LOG_FLUSH_SECONDS)
+        _memory_handler.flush()
+
+threading.Thread(target=_flush_logs_periodically, name="log-flush", daemon=True).start()
+
+# Child process output is live progress, so it skips the buffer and goes straight to the stream
+child_logger = logging.getLogger("news_pipeline.child")
+child_logger.propagate = False
+child_logger.addHandler(_stream_handler)
+
 # All supported languages for translation with their names
-ALL_LANGUAGES = {
+_LANGUAGES = {
     'as': 'Assamese',
     'bn': 'Bengali',
     'bho': 'Bhojpuri',
@@ -38,105 +75,366 @@ ALL_LANGUAGES = {
     'te': 'Telugu',
     'ur': 'Urdu',
 }
+# Read-only view of the languages, and their codes in order
+ALL_LANGUAGES = types.MappingProxyType(_LANGUAGES)
+ALL_LANGUAGE_CODES = tuple(_LANGUAGES)
+ALL_LANGUAGE_SET = frozenset(_LANGUAGES)
+
+def parse_language_codes(value):
+    """argparse type: split a comma-separated list of language codes into a tuple"""
+    return tuple(code.strip() for code in value.split(",") if code.strip())
+
+@functools.lru_cache(maxsize=None)
+def format_language(code):
+    """Return 'code (Name)' for a language code"""
+    return f"{code} ({ALL_LANGUAGES.get(code, 'Unknown')})"
+
+# Hashes of the translated fields of each article, written by --incremental runs
+ARTICLE_HASHES_FILE = os.path.join("output", ".article_hashes.json")
+INCREMENTAL_HASH_FIELDS = ("headline", "summary", "author", "source", "category", "tags")
+
+# Per-run copies of the extracted articles that --async hands to translate.py
+RUN_SNAPSHOT_DIR = os.path.join("output", "runs")
+
+# Lines of child output kept for the return value; everything is logged as it arrives
+COMMAND_OUTPUT_TAIL = 200
 
 def run_command(command, timeout=None):
-    """Run a command and return its output with optional timeout"""
-    logger.info(f"Running command: {' '.join(command)}")
+    """Run a command, streaming its output to the log, and return the last lines of output with optional timeout"""
+    logger.info("Running command: %s", ' '.join(command))
+    # Write out buffered records first so they stay ahead of the unbuffered child output
+    _memory_handler.flush()
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    
+    # Forward child output line by line so memory stays bounded and progress is visible
+    tail = collections.deque(maxlen=COMMAND_OUTPUT_TAIL)
+    def forward_output():
+        for line in process.stdout:
+            line = line.rstrip()
+            tail.append(line)
+            child_logger.info("[child] %s", line)
+    reader = threading.Thread(target=forward_output, daemon=True)
+    reader.start()
+    
     try:
-        result = subprocess.run(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True,
-            timeout=timeout
-        )
-        logger.info(f"Command completed with exit code {result.returncode}")
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed with exit code {e.returncode}")
-        logger.error(f"Error output: {e.stderr}")
-        return False, e.stderr
-    except subprocess.TimeoutExpired as e:
-        logger.error(f"Command timed out after {timeout} seconds")
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        reader.join()
+        logger.error("Command timed out after %s seconds", timeout)
         return False, f"Timeout after {timeout} seconds"
+    reader.join()
+    
+    output = "\n".join(tail)
+    if returncode != 0:
+        logger.error("Command failed with exit code %s", returncode)
+        return False, output
+    logger.info("Command completed with exit code %s", returncode)
+    return True, output
+
+async def run_command_async(command, timeout=None):
+    """Run a command without blocking the event loop and return (success, output)"""
+    logger.info("Running command: %s", ' '.join(command))
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        logger.error("Command timed out after %s seconds", timeout)
+        return False, f"Timeout after {timeout} seconds"
+    
+    if process.returncode != 0:
+        logger.error("Command failed with exit code %s", process.returncode)
+        logger.error("Error output: %s", stderr.decode('utf-8', errors='replace'))
+        return False, stderr.decode('utf-8', errors='replace')
+    logger.info("Command completed with exit code %s", process.returncode)
+    return True, stdout.decode('utf-8', errors='replace')
+
+def newest_file(directory, prefix, suffix=".json"):
+    """Return the most recently modified file in directory matching prefix/suffix (str or tuple), or None"""
+    # A single scandir pass replaces glob plus a separate getmtime per match
+    best = None
+    best_mtime = -1
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                    mtime = entry.stat().st_mtime
+                    if mtime > best_mtime:
+                        best_mtime = mtime
+                        best = entry.path
+    except FileNotFoundError:
+        return None
+    return best
 
 def get_latest_articles_file():
     """Find the latest articles JSON file in the output directory"""
     # First check for the fixed latest_articles.json file
     fixed_path = "output/latest_articles.json"
     if os.path.exists(fixed_path):
-        logger.info(f"Found latest articles file: {fixed_path}")
+        logger.info("Found latest articles file: %s", fixed_path)
         return fixed_path
     
-    # If not found, look for timestamped files
-    files = glob.glob("output/latest_articles_*.json")
-    if not files:
+    # If not found, look for the newest timestamped file
+    latest_file = newest_file("output", "latest_articles_")
+    if not latest_file:
         logger.error("No latest_articles JSON files found in output directory")
         return None
     
-    # Sort by modification time (newest first)
-    latest_file = max(files, key=os.path.getmtime)
-    logger.info(f"Found latest articles file: {latest_file}")
+    logger.info("Found latest articles file: %s", latest_file)
     return latest_file
 
-def extract_latest_articles():
-    """Run latest_extractor.py to extract the latest articles"""
-    logger.info("Extracting latest articles...")
-    
-    # Run the latest_extractor.py script
-    success, output = run_command(["python", "latest_extractor.py"], timeout=300)  # 5 minute timeout
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=2)
+def iso_for_second(second):
+    """Return the local ISO timestamp for a whole Unix second"""
+    return datetime.fromtimestamp(second).isoformat()
+
+def now_iso():
+    """Return the current local time as an ISO timestamp, formatted at most once per second"""
+    return iso_for_second(int(time.time()))
+
+def json_dumps(obj):
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib fallback, which coerces int/float keys to strings
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def article_id_of(article):
+    """Return an article's ID the same way translate.py derives it"""
+    return article.get('article_id') or hashlib.md5(article.get('url', '').encode()).hexdigest()[:10]
+
+def article_hash(article):
+    """Hash the article fields that translate.py translates"""
+    digest = hashlib.sha1()
+    for field in INCREMENTAL_HASH_FIELDS:
+        digest.update(json.dumps(article.get(field), ensure_ascii=False).encode('utf-8'))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+def load_article_hashes():
+    """Load the article hashes saved by the previous --incremental run"""
+    try:
+        with open(ARTICLE_HASHES_FILE, 'rb') as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error("Error reading %s: %s", ARTICLE_HASHES_FILE, e)
+        return {}
+
+def save_article_hashes(hashes):
+    """Persist article hashes for the next --incremental run"""
+    try:
+        write_atomic(ARTICLE_HASHES_FILE, json_dumps(hashes))
+    except Exception as e:
+        logger.error("Error saving %s: %s", ARTICLE_HASHES_FILE, e)
+
+def split_changed_articles(articles, previous_hashes):
+    """
+    Select the articles that are new or changed since the previous run
     
-    if not success:
-        logger.error("Failed to extract latest articles")
+    Returns:
+        Tuple of (articles to translate, IDs of changed articles to translate again, current hashes)
+    """
+    changed = []
+    retranslate_ids = set()
+    hashes = {}
+    for article in articles:
+        article_id = article_id_of(article)
+        hashes[article_id] = article_hash(article)
+        previous = previous_hashes.get(article_id)
+        if previous == hashes[article_id]:
+            continue
+        changed.append(article)
+        if previous is not None:
+            retranslate_ids.add(article_id)
+    return changed, retranslate_ids, hashes
+
+def translated_ids_by_language(translations, language_codes, retranslate_ids):
+    """
+    Return {lang: IDs of articles now translated to it}: the IDs in this run's manifest plus the ones
+    already in the language's index.txt. Changed articles count only when this run translated them again.
+    """
+    import translate
+    done = {}
+    for lang in language_codes:
+        fresh = set(translations[lang][1]["ids"]) if lang in translations else set()
+        done[lang] = fresh | (translate.get_previously_translated_articles(lang) - retranslate_ids)
+    return done
+
+def translated_article_hashes(article_hashes, done_by_language):
+    """
+    Split the current article hashes into those of articles translated to every requested language
+    and the IDs of the rest (cut by --max or lost with a failed language), which must be retried
+    """
+    done = set.intersection(*done_by_language.values()) if done_by_language else set()
+    translated = {article_id: h for article_id, h in article_hashes.items() if article_id in done}
+    pending = set(article_hashes) - done
+    if pending:
+        logger.warning("%s articles are not translated to every language yet; they will be retried", len(pending))
+    return translated, pending
+
+def merge_previous_translations(translations, done_by_language, articles):
+    """
+    Describe every current article translated to each language, not just this run's new ones:
+    articles skipped as unchanged are counted from the language's earlier translation files
+    """
+    current_ids = [article_id_of(article) for article in articles]
+    merged = {}
+    for lang, done in done_by_language.items():
+        file_path, manifest = translations.get(lang) or (None, {"count": 0, "voice_count": 0, "ids": []})
+        fresh = set(manifest["ids"])
+        reused = [article_id for article_id in current_ids if article_id in done and article_id not in fresh]
+        if file_path is None:
+            file_path = latest_translation_file(f"output/translations/{lang}")
+        if file_path is None:
+            continue
+        merged[lang] = (file_path, {
+            **manifest,
+            "count": manifest["count"] + len(reused),
+            "ids": manifest["ids"] + reused,
+            "reused": len(reused)
+        })
+    return merged
+
+def preload_translate():
+    """Import translate.py (Google client libraries and clients) on a background thread"""
+    def load():
+        try:
+            import translate  # noqa: F401
+        except Exception as e:
+            # translate_articles imports it again and reports the error there
+            logger.warning("Could not preload translate module: %s", e)
+    thread = threading.Thread(target=load, name="preload-translate", daemon=True)
+    thread.start()
+    return thread
+
+def load_articles(latest_file):
+    """Load the articles list from a latest articles file"""
+    try:
+        with open(latest_file, 'rb') as f:
+            return json_loads(f.read())
+    except Exception as e:
+        logger.error("Error reading articles file: %s", e)
         return None
+
+def extract_latest_articles(legacy_subprocess=False):
+    """
+    Extract the latest articles
+    
+    Args:
+        legacy_subprocess: Run latest_extractor.py as a child process instead of in-process
+    
+    Returns:
+        Tuple of (latest articles file, parsed articles), or (None, None) on failure
+    """
+    logger.info("Extracting latest articles...")
+    
+    if legacy_subprocess:
+        # Run the latest_extractor.py script
+        success, output = run_command(["python", "latest_extractor.py"], timeout=300)  # 5 minute timeout
+        
+        if not success:
+            logger.error("Failed to extract latest articles")
+            return None, None
+    else:
+        # Imported here so the legacy path does not pay for the extractor's imports
+        import latest_extractor
+        try:
+            articles = latest_extractor.main()
+        except Exception as e:
+            logger.error("Failed to extract latest articles: %s", e)
+            return None, None
     
     # Get the latest articles file
     latest_file = get_latest_articles_file()
     
     if not latest_file:
         logger.error("Could not find the latest articles file after extraction")
-        return None
+        return None, None
     
-    # Check if the file contains valid JSON and has articles
-    try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            articles = json.load(f)
-        
-        if not articles:
-            logger.error("No articles found in the latest articles file")
-            return None
-            
-        logger.info(f"Successfully extracted {len(articles)} articles")
-        return latest_file
-    except Exception as e:
-        logger.error(f"Error reading articles file: {e}")
-        return None
+    # The child process only hands its articles back through the file
+    if legacy_subprocess:
+        articles = load_articles(latest_file)
+    
+    if not articles:
+        logger.error("No articles found in the latest articles file")
+        return None, None
+    
+    logger.info("Successfully extracted %s articles", len(articles))
+    return latest_file, articles
 
-def translate_articles(latest_file, languages=None, max_articles=None):
+def translate_articles(articles, languages=None, max_articles=None, legacy_subprocess=False, no_cache=False, retranslate_ids=None):
     """
     Translate the articles to selected languages
     
     Args:
-        latest_file: Path to the latest articles file
-        languages: List of language codes to translate to (None for all)
+        articles: List of articles to translate
+        languages: Tuple of language codes to translate to (None for all)
         max_articles: Maximum number of articles to translate (None for all)
+        legacy_subprocess: Run translate.py as a child process instead of in-process
+        no_cache: Pass --no-cache to the translate.py child process
+        retranslate_ids: IDs of changed articles to translate again (in-process only)
+    
+    Returns:
+        Dictionary of language codes mapped to (translated file, manifest of counts and IDs)
     """
     # Determine which languages to process
     if languages:
-        language_codes = languages.split(',')
-        languages_str = ", ".join([f"{code} ({ALL_LANGUAGES.get(code, 'Unknown')})" for code in language_codes])
-        logger.info(f"Translating articles to selected languages: {languages_str}")
+        language_codes = languages
+        languages_str = ", ".join(map(format_language, language_codes))
+        logger.info("Translating articles to selected languages: %s", languages_str)
+    else:
+        language_codes = ALL_LANGUAGE_CODES
+        logger.info("Translating articles to ALL supported languages (%s languages)", len(language_codes))
+    
+    start_time = time.time()
+    
+    if legacy_subprocess:
+        translations = translate_articles_subprocess(language_codes, languages, max_articles, no_cache)
     else:
-        language_codes = list(ALL_LANGUAGES.keys())
-        logger.info(f"Translating articles to ALL supported languages ({len(language_codes)} languages)")
+        # Imported here so the legacy path does not create translation clients
+        import translate
+        logger.info("Starting in-process translation")
+        results = translate.translate_all(articles, language_codes, max_articles, retranslate_ids)
+        translations = {}
+        for lang, (translated_file, translated) in results.items():
+            logger.info("Translation to %s (%s) saved to %s", lang, ALL_LANGUAGES.get(lang, 'Unknown'), translated_file)
+            translations[lang] = (translated_file, translation_manifest(translated))
+    
+    # Calculate total time
+    total_time = time.time() - start_time
+    logger.info("Translation process completed in %.1f seconds (%.1f minutes)", total_time, total_time/60)
     
+    return translations
+
+def translate_command(languages=None, max_articles=None, no_cache=False, input_file=None):
+    """Build the translate.py command line for the selected options"""
     # Prepare command
     translate_cmd = ["python", "translate.py"]
     
     # Add languages parameter
     if languages:
-        translate_cmd.append(languages)
+        translate_cmd.append(",".join(languages))
     else:
         translate_cmd.append("all")
         
@@ -144,114 +442,209 @@ def translate_articles(latest_file, languages=None, max_articles=None):
     if max_articles:
         translate_cmd.extend(["--max", str(max_articles)])
     
-    translated_files = []
-    start_time = time.time()
+    # Pass the cache setting through to the child process
+    if no_cache:
+        translate_cmd.append("--no-cache")
+    
+    # Translate a fixed snapshot rather than whatever latest_articles.json holds when the child starts
+    if input_file:
+        translate_cmd.extend(["--input", input_file])
+    
+    return translate_cmd
+
+def translate_articles_subprocess(language_codes, languages=None, max_articles=None, no_cache=False):
+    """Run translate.py as a child process and load the translation files it wrote"""
+    translate_cmd = translate_command(languages, max_articles, no_cache)
     
     # Run translate.py with selected parameters
-    logger.info(f"Starting translation process with command: {' '.join(translate_cmd)}")
+    logger.info("Starting translation process with command: %s", ' '.join(translate_cmd))
     success, output = run_command(translate_cmd, timeout=3600)  # 1 hour timeout
     
-    if success:
-        # Find all translation files
-        for lang in language_codes:
-            lang_files = glob.glob(f"output/translations/{lang}/articles_{lang}_*.json")
-            if lang_files:
-                translated_file = max(lang_files, key=os.path.getmtime)
-                logger.info(f"Translation to {lang} ({ALL_LANGUAGES.get(lang, 'Unknown')}) saved to {translated_file}")
-                translated_files.append(translated_file)
-            else:
-                logger.warning(f"Could not find translated file for language {lang} ({ALL_LANGUAGES.get(lang, 'Unknown')})")
-    else:
+    if not success:
         logger.error("Translation process failed")
+        return {}
+    return load_translations(language_codes)
+
+def load_translations(language_codes):
+    """Load the manifest of each language's newest translation file into {lang: (file, manifest)}"""
+    translations = {}
+    # Find and read all translation files; the reads are I/O-bound so overlap them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for lang, loaded in zip(language_codes, executor.map(load_translation, language_codes)):
+            if loaded:
+                translations[lang] = loaded
+    return translations
+
+def load_translation(lang):
+    """Return (file, manifest) for the newest translation file of a language, or None"""
+    # translate.py keeps a stable 'latest' link per language; scan only for runs that predate it
+    lang_dir = f"output/translations/{lang}"
+    translated_file = latest_translation_file(lang_dir) or newest_file(lang_dir, f"articles_{lang}_", TRANSLATION_SUFFIXES)
+    if not translated_file:
+        logger.warning("Could not find translated file for language %s (%s)", lang, ALL_LANGUAGES.get(lang, 'Unknown'))
+        return None
     
-    # Calculate total time
-    total_time = time.time() - start_time
-    logger.info(f"Translation process completed in {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
-    
-    return translated_files
+    logger.info("Translation to %s (%s) saved to %s", lang, ALL_LANGUAGES.get(lang, 'Unknown'), translated_file)
+    try:
+        # The manifest avoids parsing every translated article just to count them
+        return translated_file, read_translation_manifest(translated_file)
+    except Exception as e:
+        logger.error("Error reading translation file %s: %s", translated_file, e)
+        return None
 
-def create_translation_summary(latest_file, translated_files):
+def create_translation_summary(latest_file, article_count, translations):
     """Create a summary of the translation process"""
     summary = {
         "original_file": latest_file,
-        "timestamp": datetime.now().isoformat(),
-        "languages_processed": len(translated_files),
+        "timestamp": now_iso(),
+        "languages_processed": len(translations),
+        "original_article_count": article_count,
         "translations": []
     }
     
-    # Get original article count
-    try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            articles = json.load(f)
-            summary["original_article_count"] = len(articles)
-    except Exception as e:
-        logger.error(f"Error reading original articles: {e}")
-        summary["original_article_count"] = 0
-    
     # Get information about each translation
-    for file_path in translated_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Extract language code from filename
-                lang_code = os.path.basename(file_path).split('_')[1]
-                
-                # Count articles with voice files
-                voice_count = sum(1 for article in data if 'voice_file' in article)
-                
-                translation_info = {
-                    "language_code": lang_code,
-                    "language_name": ALL_LANGUAGES.get(lang_code, "Unknown"),
-                    "file_path": file_path,
-                    "article_count": len(data),
-                    "voice_files_count": voice_count
-                }
-                
-                summary["translations"].append(translation_info)
-        except Exception as e:
-            logger.error(f"Error processing translation file {file_path}: {e}")
+    for lang_code, (file_path, manifest) in translations.items():
+        translation_info = {
+            "language_code": lang_code,
+            "language_name": ALL_LANGUAGES.get(lang_code, "Unknown"),
+            "file_path": file_path,
+            "article_count": manifest["count"],
+            "voice_files_count": manifest["voice_count"]
+        }
+        # --incremental counts unchanged articles translated by earlier runs; their voice files are not recounted
+        if "reused" in manifest:
+            translation_info["reused_article_count"] = manifest["reused"]
+        
+        summary["translations"].append(translation_info)
     
     # Save summary
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     summary_file = f"output/translation_summary_{timestamp}.json"
     
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    # Written via a temp file and rename so readers never see a partial summary
+    write_atomic(summary_file, json_dumps(summary))
     
-    logger.info(f"Translation summary saved to {summary_file}")
+    logger.info("Translation summary saved to %s", summary_file)
     return summary_file
 
+def write_run_snapshot(run, articles):
+    """Write one --async run's articles to a file of their own and return its path"""
+    os.makedirs(RUN_SNAPSHOT_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    snapshot_file = os.path.join(RUN_SNAPSHOT_DIR, f"articles_{timestamp}_run{run}.json")
+    write_atomic(snapshot_file, json_dumps(articles))
+    return snapshot_file
+
+async def pipeline_main(args):
+    """
+    Run extraction and translation as a two-stage pipeline of child processes
+    
+    Each extraction run queues its articles; translation of one run overlaps extraction of the next.
+    
+    Returns:
+        Number of runs that produced a translation summary
+    """
+    language_codes = args.languages or ALL_LANGUAGE_CODES
+    queue = asyncio.Queue()
+    
+    async def produce():
+        for run in range(1, args.runs + 1):
+            logger.info("Extraction run %s/%s", run, args.runs)
+            success, output = await run_command_async(["python", "latest_extractor.py"], timeout=300)  # 5 minute timeout
+            latest_file = get_latest_articles_file() if success else None
+            articles = load_articles(latest_file) if latest_file else None
+            if articles:
+                logger.info("Extraction run %s produced %s articles", run, len(articles))
+                # The next extraction rewrites latest_articles.json while this run is translated,
+                # so the translator gets its own copy
+                snapshot_file = write_run_snapshot(run, articles)
+                await queue.put((snapshot_file, articles))
+            else:
+                logger.error("Extraction run %s failed", run)
+        await queue.put(None)
+    
+    async def consume():
+        completed = 0
+        while True:
+            item = await queue.get()
+            if item is None:
+                return completed
+            latest_file, articles = item
+            translate_cmd = translate_command(args.languages, args.max, args.no_cache, latest_file)
+            success, output = await run_command_async(translate_cmd, timeout=3600)  # 1 hour timeout
+            if not success:
+                logger.error("Translation process failed")
+                continue
+            translations = await asyncio.to_thread(load_translations, language_codes)
+            if translations:
+                summary_file = create_translation_summary(latest_file, len(articles), translations)
+                logger.info("Translated to %s languages, summary: %s", len(translations), summary_file)
+                completed += 1
+    
+    _, completed = await asyncio.gather(produce(), consume())
+    return completed
+
 def main():
     """Main function to run the complete news pipeline"""
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="News Pipeline: Extract and translate articles")
-    parser.add_argument("--languages", "-l", type=str, help="Comma-separated list of language codes (default: all languages)", default=None)
+    parser.add_argument("--languages", "-l", type=parse_language_codes, help="Comma-separated list of language codes (default: all languages)", default=None)
     parser.add_argument("--max", "-m", type=int, help="Maximum number of articles to translate (default: all)", default=None)
     parser.add_argument("--skip-extract", "-s", action="store_true", help="Skip article extraction step")
+    parser.add_argument("--legacy-subprocess", action="store_true", help="Run latest_extractor.py and translate.py as child processes")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the translation cache")
+    parser.add_argument("--async", dest="async_pipeline", action="store_true", help="Overlap translation of one extraction run with the next extraction (child processes)")
+    parser.add_argument("--incremental", action="store_true", help="Only translate articles that are new or changed since the last --incremental run")
+    parser.add_argument("--runs", type=int, default=1, help="Number of extraction runs in --async mode (default: 1)")
     args = parser.parse_args()
     
+    # Fail fast on unknown language codes before any extraction work
+    unknown = set(args.languages or ()) - ALL_LANGUAGE_SET
+    if unknown:
+        parser.error(f"unknown language codes: {', '.join(sorted(unknown))}")
+    if args.incremental and (args.legacy_subprocess or args.async_pipeline):
+        parser.error("--incremental runs translation in-process; it cannot be combined with --legacy-subprocess or --async")
+    
+    if args.no_cache:
+        import translation_cache
+        translation_cache.disable()
+    
     logger.info("=== STARTING NEWS PIPELINE ===")
     
     # Log pipeline configuration
     if args.languages:
-        logger.info(f"Translation languages: {args.languages}")
+        logger.info("Translation languages: %s", ", ".join(args.languages))
     else:
-        logger.info(f"Translation languages: ALL ({len(ALL_LANGUAGES)} languages)")
+        logger.info("Translation languages: ALL (%s languages)", len(ALL_LANGUAGES))
         
     if args.max:
-        logger.info(f"Maximum articles to translate: {args.max}")
+        logger.info("Maximum articles to translate: %s", args.max)
     else:
         logger.info("Maximum articles to translate: ALL")
         
     if args.skip_extract:
         logger.info("Skipping article extraction step")
     
+    if args.async_pipeline and not args.skip_extract:
+        logger.info("Running asynchronous pipeline with %s extraction runs", args.runs)
+        completed = asyncio.run(pipeline_main(args))
+        if not completed:
+            logger.error("No translations were generated. Aborting pipeline.")
+            return 1
+        logger.info("=== PIPELINE COMPLETED SUCCESSFULLY ===")
+        logger.info("Completed %s/%s runs", completed, args.runs)
+        return 0
+    
+    # Load the translation stack while extraction runs so its import cost is off the critical path
+    if not args.legacy_subprocess:
+        preload_translate()
+    
     # Step 1: Extract latest articles (unless skipped)
     latest_file = None
+    articles = None
     if not args.skip_extract:
         logger.info("STEP 1: Extracting latest articles")
-        latest_file = extract_latest_articles()
+        latest_file, articles = extract_latest_articles(args.legacy_subprocess)
         if not latest_file:
             logger.error("Article extraction failed. Aborting pipeline.")
             return 1
@@ -261,24 +654,46 @@ def main():
         if not latest_file:
             logger.error("No latest articles file found. Cannot proceed with translation.")
             return 1
+        articles = load_articles(latest_file)
+        if not articles:
+            logger.error("No articles found in the latest articles file")
+            return 1
         
+    # Skip articles whose translated fields are unchanged since the last incremental run
+    translate_input, retranslate_ids, article_hashes = articles, None, None
+    if args.incremental:
+        previous_hashes = load_article_hashes()
+        translate_input, retranslate_ids, article_hashes = split_changed_articles(articles, previous_hashes)
+        logger.info("Incremental mode: %s of %s articles are new or changed (%s changed)", len(translate_input), len(articles), len(retranslate_ids))
+        if not translate_input:
+            logger.info("=== PIPELINE COMPLETED: NO CHANGED ARTICLES ===")
+            return 0
+    
     # Step 2: Translate to specified languages
     logger.info("STEP 2: Translating articles")
-    translated_files = translate_articles(latest_file, args.languages, args.max)
+    translations = translate_articles(translate_input, args.languages, args.max, args.legacy_subprocess, args.no_cache, retranslate_ids)
+    
+    if article_hashes is not None:
+        done_by_language = translated_ids_by_language(translations, args.languages or ALL_LANGUAGE_CODES, retranslate_ids)
+        translated_hashes, pending = translated_article_hashes(article_hashes, done_by_language)
+        # Forget the hashes of unfinished articles so the next run offers them again
+        saved = {article_id: h for article_id, h in previous_hashes.items() if article_id not in pending}
+        save_article_hashes({**saved, **translated_hashes})
+        translations = merge_previous_translations(translations, done_by_language, articles)
     
-    if not translated_files:
+    if not translations:
         logger.error("No translations were generated. Aborting pipeline.")
         return 1
     
     # Step 3: Create summary
     logger.info("STEP 3: Creating translation summary")
-    summary_file = create_translation_summary(latest_file, translated_files)
+    summary_file = create_translation_summary(latest_file, len(articles), translations)
     
     # Report results
     logger.info("=== PIPELINE COMPLETED SUCCESSFULLY ===")
-    logger.info(f"Original articles: {latest_file}")
-    logger.info(f"Translated to {len(translated_files)} languages")
-    logger.info(f"Summary: {summary_file}")
+    logger.info("Original articles: %s", latest_file)
+    logger.info("Translated to %s languages", len(translations))
+    logger.info("Summary: %s", summary_file)
     
     return 0
 
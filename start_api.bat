@@ -13,7 +13,7 @@ echo Press Ctrl+C to stop the server
 REM Check if gunicorn is available
 where gunicorn >nul 2>nul
 if %ERRORLEVEL% EQU 0 (
-    gunicorn --bind 0.0.0.0:5000 api:app
+    gunicorn --workers 4 --worker-class gthread --threads 8 --bind 0.0.0.0:5000 wsgi:application
 ) else (
     REM Fallback to Flask's built-in server for development
     python api.py
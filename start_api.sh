@@ -12,7 +12,8 @@ echo "Press Ctrl+C to stop the server"
 
 # Use gunicorn in production for better performance
 if command -v gunicorn &> /dev/null; then
-    gunicorn --bind 0.0.0.0:5000 api:app
+    # Threaded workers; no --preload, since the gRPC TTS client must be created after fork
+    gunicorn --workers "${WEB_CONCURRENCY:-4}" --worker-class gthread --threads 8 --bind 0.0.0.0:5000 wsgi:application
 else
     # Fallback to Flask's built-in server for development
     python api.py
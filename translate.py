@@ -1,15 +1,28 @@
-from google.cloud import translate_v2 as translate
+from google.cloud import translate_v3 as translate
 from google.cloud import texttospeech
+from google.cloud.texttospeech_v1.services.text_to_speech.transports import (
+    TextToSpeechGrpcAsyncIOTransport, TextToSpeechGrpcTransport
+)
 from google.oauth2 import service_account
+from google.api_core import retry as retries
 import os
-import json
+import re
 import sys
 import glob
 import hashlib
+import functools
+import shutil
 import time
 import argparse
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
+import translation_cache
+from translation_files import (
+    TRANSLATION_SUFFIX, TRANSLATION_SUFFIXES, iter_translation_file, read_json_file, update_latest_link, write_translation_file
+)
 
 # Configure more detailed logging
 import logging
@@ -33,8 +46,31 @@ else:
     logger.warning(f"Warning: TTS credentials file not found at  {credentials_path}")
     tts_credentials = None
 
-# Initialize the Google Translate client
-translate_client = translate.Client()
+# Initialize the Google Translate (v3) client; requests are billed to the project of the
+# credentials unless GOOGLE_CLOUD_PROJECT says otherwise
+translate_client = translate.TranslationServiceClient(credentials=tts_credentials)
+translate_project_id = os.getenv("GOOGLE_CLOUD_PROJECT") or getattr(tts_credentials, "project_id", None)
+if not translate_project_id:
+    logger.warning("No Google Cloud project found for translation; set GOOGLE_CLOUD_PROJECT")
+translate_parent = f"projects/{translate_project_id}/locations/global"
+
+# gRPC channel settings for the TTS clients: long summaries can produce MP3 responses above the
+# 4 MiB default receive limit, and keepalives stop idle channels being dropped between batches
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", 30 * 1024 * 1024),
+    ("grpc.max_send_message_length", 30 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30000),
+]
+
+def create_tts_client(use_async=False):
+    """Create a TTS client on a channel configured with GRPC_CHANNEL_OPTIONS (async clients need a running loop)"""
+    transport_class = TextToSpeechGrpcAsyncIOTransport if use_async else TextToSpeechGrpcTransport
+    client_class = texttospeech.TextToSpeechAsyncClient if use_async else texttospeech.TextToSpeechClient
+    channel = transport_class.create_channel(credentials=tts_credentials, options=GRPC_CHANNEL_OPTIONS)
+    return client_class(transport=transport_class(channel=channel))
+
+# One TTS client for the process: gRPC clients are thread-safe and reusing one keeps its channel warm
+tts_client = create_tts_client() if tts_credentials else None
 logger.info("Initialized Google Translate client")
 
 # Indian languages supported by Google Translate with their TTS language codes
@@ -61,155 +97,440 @@ target_languages = {
 
 logger.info(f"Supported languages: {', '.join(target_languages.keys())}")
 
-def generate_voice_file(article_data, lang_code):
-    """Generate a voice file for the translated article summary and return the file path."""
-    # Ensure article has an ID
-    if 'article_id' in article_data:
-        article_id = article_data['article_id']
-    elif 'url' in article_data:
-        article_id = hashlib.md5(article_data.get('url', '').encode()).hexdigest()[:10]
-    else:
-        # Generate a random ID if neither is available
-        article_id = hashlib.md5(str(time.time()).encode()).hexdigest()[:10]
-        
-    headline = article_data.get('headline', 'Unknown Title')[:30]
+# Article fields that are translated (tags are handled separately)
+TRANSLATED_FIELDS = ("headline", "summary", "author", "source", "category")
+
+# Keep each Translate v3 request to a bounded number of segments and under its 30K code point limit
+TRANSLATE_BATCH_SEGMENTS = 128
+TRANSLATE_BATCH_CHARS = 30_000
+
+class RateLimiter:
+    """Token bucket shared by every thread that calls the Translate API"""
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
     
-    if not tts_credentials:
-        logger.warning(f"Skipping voice generation for article {article_id} ({headline}): No credentials available")
-        return None
-        
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Translate requests per second across all threads
+translate_rate_limiter = RateLimiter(float(os.getenv("TRANSLATE_REQUESTS_PER_SECOND", "5")))
+
+def log_translate_retry(error):
+    """Log a transient Translate error before the request is retried"""
+    logger.warning(f"Batch translation attempt failed, retrying: {error}")
+
+# Transient Translate errors (429, 5xx, connection resets) are retried with jittered exponential
+# backoff; anything else, like a bad request, fails straight away
+TRANSLATE_RETRY = retries.Retry(
+    predicate=retries.if_transient_error, initial=1.0, maximum=8.0, multiplier=2.0, deadline=30.0,
+    on_error=log_translate_retry
+)
+
+# Articles translated at the same time within one language
+TRANSLATE_CONCURRENCY = int(os.getenv("TRANSLATE_CONCURRENCY", "8"))
+
+# Synthesize requests in flight across the whole process, whichever language or thread sends them
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "8"))
+tts_slots = threading.BoundedSemaphore(TTS_CONCURRENCY)
+
+# Audio settings shared by every synthesis request
+AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=texttospeech.AudioEncoding.MP3,
+    effects_profile_id=["high-quality-studio"]
+)
+
+# Characters replaced in filenames built from headlines: \w matches exactly what str.isalnum()
+# accepts plus "_", so translated (non-ASCII) headlines keep their letters
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Cloud TTS accepts at most 5000 bytes of input per request; longer summaries are split below that
+TTS_MAX_INPUT_BYTES = 4500
+
+# Sentence ends in Latin and Indic scripts (., !, ?, danda and double danda)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?\u0964\u0965])\s+")
+
+# Content-addressed store of synthesized audio, shared across runs and languages
+TTS_CACHE_DIR = os.path.join("output", "cache", "tts")
+
+# Number of languages translated at the same time (0: every selected language at once). The work is
+# network-bound, so this is sized for the Translate quota rather than the CPU count: all running
+# languages share translate_rate_limiter and, for voice generation, the TTS_CONCURRENCY slots.
+LANGUAGE_CONCURRENCY = int(os.getenv("TRANSLATE_LANGUAGE_CONCURRENCY", "4"))
+
+@functools.lru_cache(maxsize=None)
+def ensure_dir(path):
+    """Create a directory (and its parents) once per process; later calls for the same path do no syscalls"""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def tts_cache_path(key_material):
+    """Return the content-addressed cache path for synthesized audio"""
+    digest = hashlib.sha256(key_material).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, digest[:2], digest[2:4], f"{digest}.mp3")
+
+def unique_tmp_path(path):
+    """Return a temp path next to path that no other process or thread writes to"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+def replace_file(path, data):
+    """
+    Write bytes to a temp file and rename it over path. Voice files may be hard links to TTS cache
+    entries, so they are always replaced, never opened for writing in place.
+    """
+    tmp_file = unique_tmp_path(path)
+    with open(tmp_file, "wb") as out:
+        out.write(data)
+    os.replace(tmp_file, path)
+
+def write_tts_cache(cache_file, audio_content):
+    """Store audio in the TTS cache via a temp file and rename, so concurrent writers never expose a partial file"""
+    ensure_dir(os.path.dirname(cache_file))
+    replace_file(cache_file, audio_content)
+
+def link_or_copy(source, destination):
+    """Hard-link (or copy) source to a temp name and rename it over destination"""
+    tmp_file = unique_tmp_path(destination)
     try:
-        # Get the summary text - try multiple fields if summary is not available
-        summary = article_data.get('summary', '')
-        
-        # If summary is empty, try content field
-        if not summary and 'content' in article_data:
-            logger.warning(f"No summary found for article {article_id}, using content instead")
-            content = article_data.get('content', '')
-            # Limit content to first 1000 characters if it exists
-            summary = content[:1000] if content else ''
-            
-        # If still no content, use headline as fallback
-        if not summary:
-            logger.warning(f"No content found for article {article_id}, using headline as fallback")
-            summary = f"Article titled: {headline}"
-            
-        # Final check - if we still don't have anything to speak, skip this article
-        if not summary or len(summary.strip()) < 10:  # Require at least 10 chars of text
-            logger.warning(f"Skipping voice generation for article {article_id} ({headline}): Insufficient text content")
-            return None
-            
-        # Check if language is supported for TTS
-        if lang_code not in target_languages:
-            logger.warning(f"Skipping voice generation for article {article_id} ({headline}): Language {lang_code} not supported")
-            return None
-            
-        # Get the TTS language code
-        tts_language_code = target_languages[lang_code]['tts_code']
-        
-        # Create TTS client
-        client = texttospeech.TextToSpeechClient(credentials=tts_credentials)
-        
-        # Get the voice name - Chirp3 HD or Kore voices are high quality
-        voice_name = f"{tts_language_code}-Chirp3-HD-Kore"
-        
-        # Set up the input
-        synthesis_input = texttospeech.SynthesisInput(text=summary)
+        os.link(source, tmp_file)
+    except OSError:
+        shutil.copyfile(source, tmp_file)
+    os.replace(tmp_file, destination)
+
+def prepare_voice_job(article_data, lang_code):
+    """
+    Work out what to synthesize for an article and where to write it.
+    
+    Returns:
+        Tuple of (voice_file, job): job is None when no synthesis is needed, in which case voice_file
+        is the cached audio path or None when the article is skipped
+    """
+    article_id = get_article_id(article_data)
+    headline = article_data.get('headline', 'Unknown Title')[:30]
+    
+    # Get the summary text - try multiple fields if summary is not available
+    summary = article_data.get('summary', '')
+    
+    # If summary is empty, try content field
+    if not summary and 'content' in article_data:
+        logger.warning(f"No summary found for article {article_id}, using content instead")
+        content = article_data.get('content', '')
+        # Limit content to first 1000 characters if it exists
+        summary = content[:1000] if content else ''
         
-        # Set up the voice
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=tts_language_code,
-            name=voice_name
-        )
+    # If still no content, use headline as fallback
+    if not summary:
+        logger.warning(f"No content found for article {article_id}, using headline as fallback")
+        summary = f"Article titled: {headline}"
         
-        # Set up the audio config
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            effects_profile_id=["high-quality-studio"]
-        )
+    # Final check - if we still don't have anything to speak, skip this article
+    if not summary or len(summary.strip()) < 10:  # Require at least 10 chars of text
+        logger.warning(f"Skipping voice generation for article {article_id} ({headline}): Insufficient text content")
+        return None, None
         
-        logger.info(f"Generating speech for article {article_id} ({headline})")
+    # Check if language is supported for TTS
+    if lang_code not in target_languages:
+        logger.warning(f"Skipping voice generation for article {article_id} ({headline}): Language {lang_code} not supported")
+        return None, None
         
-        # Try with specific voice, with fallback options
+    # Get the TTS language code
+    tts_language_code = target_languages[lang_code]['tts_code']
+    
+    # Get the voice name - Chirp3 HD or Kore voices are high quality
+    voice_name = f"{tts_language_code}-Chirp3-HD-Kore"
+    
+    # Create output directory for translations
+    voice_dir = os.path.join("output", "translations", lang_code, "voice")
+    ensure_dir(voice_dir)
+    
+    # Include language code in filename for clarity
+    filename_prefix = f"{lang_code}_{article_id}"
+    
+    # Create a safe filename from the headline
+    safe_text = UNSAFE_FILENAME_CHARS.sub("_", headline).strip().replace(" ", "_")
+    
+    # Create output path
+    output_file = os.path.join(voice_dir, f"{filename_prefix}_{safe_text}.mp3")
+    
+    # Reuse audio previously synthesized for the same text, voice and audio settings
+    cache_file = tts_cache_path(f"{tts_language_code}|{voice_name}|MP3|high-quality-studio|{summary}".encode('utf-8'))
+    if os.path.exists(cache_file):
+        link_or_copy(cache_file, output_file)
+        logger.info(f"Using cached audio for article {article_id} ({headline})")
+        return os.path.relpath(output_file), None
+    
+    if not tts_credentials:
+        logger.warning(f"Skipping voice generation for article {article_id} ({headline}): No credentials available")
+        return None, None
+    
+    job = {
+        "article_id": article_id,
+        "headline": headline,
+        "summary": summary,
+        "chunks": split_tts_text(summary),
+        "tts_language_code": tts_language_code,
+        "voice_name": voice_name,
+        "voice_dir": voice_dir,
+        "filename_prefix": filename_prefix,
+        "output_file": output_file,
+        "cache_file": cache_file,
+    }
+    return None, job
+
+# Voice names by language code, filled by the first successful list_voices call
+_available_voices = None
+_available_voices_lock = threading.Lock()
+
+def available_voices():
+    """
+    Ask TTS once which voices exist.
+    
+    Returns:
+        Dictionary mapping each language code to the set of its voice names, or None if the list could not be
+        fetched (a failure is not remembered, so the next call asks again)
+    """
+    global _available_voices
+    if _available_voices is not None:
+        return _available_voices
+    with _available_voices_lock:
+        if _available_voices is not None:
+            return _available_voices
         try:
-            response = client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
-            logger.info(f"Successfully generated speech with voice {voice_name}")
+            voices = tts_client.list_voices().voices
         except Exception as e:
-            logger.warning(f"Error with specific voice {voice_name}, trying generic voice: {e}")
-            try:
-                # Fallback to generic voice selection
-                voice = texttospeech.VoiceSelectionParams(
-                    language_code=tts_language_code
-                )
-                response = client.synthesize_speech(
-                    input=synthesis_input,
-                    voice=voice,
-                    audio_config=audio_config
-                )
-                logger.info(f"Successfully generated speech with generic voice for {tts_language_code}")
-            except Exception as e2:
-                logger.error(f"Error generating speech with generic voice: {e2}")
-                # Last resort: try English voice if this isn't already English
-                if tts_language_code != 'en-IN':
-                    try:
-                        logger.warning(f"Trying English voice as last resort for {article_id}")
-                        voice = texttospeech.VoiceSelectionParams(
-                            language_code='en-IN'
-                        )
-                        response = client.synthesize_speech(
-                            input=synthesis_input,
-                            voice=voice,
-                            audio_config=audio_config
-                        )
-                        logger.info(f"Successfully generated speech with English fallback voice")
-                    except Exception as e3:
-                        logger.error(f"All voice generation attempts failed for {article_id}: {e3}")
-                        return None
-                else:
-                    return None
-        
-        # Create output directory for translations
-        voice_dir = os.path.join("output", "translations", lang_code, "voice")
-        os.makedirs(voice_dir, exist_ok=True)
-        
-        # Include language code in filename for clarity
-        filename_prefix = f"{lang_code}_{article_id}"
+            logger.warning(f"Could not list TTS voices, falling back per article: {e}")
+            return None
+        by_language = {}
+        for voice in voices:
+            for language_code in voice.language_codes:
+                by_language.setdefault(language_code, set()).add(voice.name)
+        logger.info(f"Found {len(voices)} TTS voices in {len(by_language)} languages")
+        _available_voices = by_language
+        return by_language
+
+def split_tts_text(text, max_bytes=None):
+    """Split text into pieces under the TTS request limit, at sentence boundaries where possible"""
+    max_bytes = max_bytes or TTS_MAX_INPUT_BYTES
+    if len(text.encode('utf-8')) <= max_bytes:
+        return [text]
+    
+    chunks = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY.split(text):
+        candidate = f"{current} {sentence}" if current else sentence
+        if len(candidate.encode('utf-8')) <= max_bytes:
+            current = candidate
+            continue
+        if current:
+            chunks.append(current)
+        # A single sentence over the limit is cut between words, or between characters as a last resort
+        current = ""
+        for word in sentence.split(" "):
+            candidate = f"{current} {word}" if current else word
+            if len(candidate.encode('utf-8')) <= max_bytes:
+                current = candidate
+                continue
+            if current:
+                chunks.append(current)
+            while len(word.encode('utf-8')) > max_bytes:
+                cut = len(word.encode('utf-8')[:max_bytes].decode('utf-8', 'ignore'))
+                chunks.append(word[:cut])
+                word = word[cut:]
+            current = word
+    if current:
+        chunks.append(current)
+    return chunks
+
+def voice_candidates(job):
+    """Return (description, VoiceSelectionParams) to try in order: named voice, generic voice, English"""
+    tts_language_code = job["tts_language_code"]
+    
+    # With the voice list known, go straight to the best voice that exists
+    voices = available_voices()
+    if voices is not None:
+        if job["voice_name"] in voices.get(tts_language_code, ()):
+            return [(f"voice {job['voice_name']}", texttospeech.VoiceSelectionParams(language_code=tts_language_code, name=job["voice_name"]))]
+        if tts_language_code in voices:
+            return [(f"generic voice for {tts_language_code}", texttospeech.VoiceSelectionParams(language_code=tts_language_code))]
+        return [("English fallback voice", texttospeech.VoiceSelectionParams(language_code='en-IN'))]
+    
+    candidates = [
+        (f"voice {job['voice_name']}", texttospeech.VoiceSelectionParams(language_code=tts_language_code, name=job["voice_name"])),
+        (f"generic voice for {tts_language_code}", texttospeech.VoiceSelectionParams(language_code=tts_language_code)),
+    ]
+    # Last resort: try English voice if this isn't already English
+    if tts_language_code != 'en-IN':
+        candidates.append(("English fallback voice", texttospeech.VoiceSelectionParams(language_code='en-IN')))
+    return candidates
+
+def synthesize_job(client, job):
+    """Synthesize a voice job, falling back through the voice candidates; returns audio bytes or None"""
+    chunks = job["chunks"]
+    logger.info(f"Generating speech for article {job['article_id']} ({job['headline']})")
+    if len(chunks) > 1:
+        logger.debug(f"Summary of article {job['article_id']} split into {len(chunks)} TTS requests")
+    
+    for description, voice in voice_candidates(job):
+        try:
+            # MP3 frames from the same voice and audio config can be concatenated as-is
+            audio_parts = []
+            for chunk in chunks:
+                with tts_slots:
+                    response = client.synthesize_speech(input=texttospeech.SynthesisInput(text=chunk), voice=voice, audio_config=AUDIO_CONFIG)
+                audio_parts.append(response.audio_content)
+            audio_content = b"".join(audio_parts)
+            logger.info(f"Successfully generated speech with {description}")
+            return audio_content
+        except Exception as e:
+            logger.warning(f"Error generating speech with {description}: {e}")
+    logger.error(f"All voice generation attempts failed for {job['article_id']}")
+    return None
+
+async def synthesize_job_async(client, job):
+    """Async counterpart of synthesize_job for TextToSpeechAsyncClient"""
+    chunks = job["chunks"]
+    logger.info(f"Generating speech for article {job['article_id']} ({job['headline']})")
+    if len(chunks) > 1:
+        logger.debug(f"Summary of article {job['article_id']} split into {len(chunks)} TTS requests")
+    
+    for description, voice in voice_candidates(job):
+        try:
+            # MP3 frames from the same voice and audio config can be concatenated as-is
+            audio_parts = []
+            for chunk in chunks:
+                # The slot is shared with other languages' event loops, so wait for it off this loop
+                await asyncio.to_thread(tts_slots.acquire)
+                try:
+                    response = await client.synthesize_speech(input=texttospeech.SynthesisInput(text=chunk), voice=voice, audio_config=AUDIO_CONFIG)
+                finally:
+                    tts_slots.release()
+                audio_parts.append(response.audio_content)
+            audio_content = b"".join(audio_parts)
+            logger.info(f"Successfully generated speech with {description}")
+            return audio_content
+        except Exception as e:
+            logger.warning(f"Error generating speech with {description}: {e}")
+    logger.error(f"All voice generation attempts failed for {job['article_id']}")
+    return None
+
+def finish_voice_job(job, audio_content):
+    """Cache synthesized audio and write the article's voice file; returns its relative path or None"""
+    # Keep a copy in the TTS cache for later runs
+    try:
+        write_tts_cache(job["cache_file"], audio_content)
+    except OSError as e:
+        logger.warning(f"Could not cache audio for article {job['article_id']}: {e}")
+    
+    # Write the audio content (replaced, not truncated: the old file may be linked to a cache entry)
+    output_file = job["output_file"]
+    try:
+        replace_file(output_file, audio_content)
         
-        # Create a safe filename from the headline
-        safe_text = "".join(c if c.isalnum() or c in " _-" else "_" for c in headline)
-        safe_text = safe_text.strip().replace(" ", "_")
+        logger.info(f"Audio content written to '{output_file}'")
         
-        # Create output path
-        output_file = os.path.join(voice_dir, f"{filename_prefix}_{safe_text}.mp3")
+        # Return the relative path for storage in JSON
+        return os.path.relpath(output_file)
+    except Exception as e:
+        logger.error(f"Error writing audio file {output_file}: {e}")
+        # Try to write to a simpler filename as fallback
+        try:
+            simple_output_file = os.path.join(job["voice_dir"], f"{job['filename_prefix']}.mp3")
+            replace_file(simple_output_file, audio_content)
+            logger.info(f"Audio content written to simplified path '{simple_output_file}'")
+            return os.path.relpath(simple_output_file)
+        except Exception as e2:
+            logger.error(f"Failed to write audio file even with simplified path: {e2}")
+            return None
+
+def generate_voice_file(article_data, lang_code):
+    """Generate a voice file for the translated article summary and return the file path."""
+    try:
+        voice_file, job = prepare_voice_job(article_data, lang_code)
+        if job is None:
+            return voice_file
         
-        # Write the audio content
+        audio_content = synthesize_job(tts_client, job)
+        if audio_content is None:
+            return None
+        return finish_voice_job(job, audio_content)
+    except Exception as e:
+        logger.error(f"Error generating voice file for article {article_data.get('article_id', '')} ({article_data.get('headline', 'Unknown Title')[:30]}): {e}")
+        return None
+
+async def generate_voice_files_async(articles, lang_code):
+    """
+    Generate voice files for many articles with all TTS requests in flight on one event loop.
+    
+    Returns:
+        List of voice file paths (or None) in the same order as articles
+    """
+    voice_files = [None] * len(articles)
+    # Jobs grouped by their TTS cache key: identical summaries in the batch are synthesized once
+    jobs = {}
+    for i, article in enumerate(articles):
         try:
-            with open(output_file, "wb") as out:
-                out.write(response.audio_content)
-            
-            logger.info(f"Audio content written to '{output_file}'")
-            
-            # Return the relative path for storage in JSON
-            return os.path.relpath(output_file)
+            voice_files[i], job = prepare_voice_job(article, lang_code)
         except Exception as e:
-            logger.error(f"Error writing audio file {output_file}: {e}")
-            # Try to write to a simpler filename as fallback
+            logger.error(f"Error preparing voice file for article {article.get('article_id', '')}: {e}")
+            continue
+        if job is not None:
+            jobs.setdefault(job["cache_file"], []).append((i, job))
+    if not jobs:
+        return voice_files
+    
+    # Fetch the voice list (once per process) before the requests fan out
+    available_voices()
+    
+    # The async client is bound to the running loop, so each asyncio.run gets its own
+    client = create_tts_client(use_async=True)
+    # Bounds this loop's tasks; tts_slots bounds the requests across all languages
+    semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+    
+    async def run(group):
+        i, job = group[0]
+        async with semaphore:
             try:
-                simple_output_file = os.path.join(voice_dir, f"{filename_prefix}.mp3")
-                with open(simple_output_file, "wb") as out:
-                    out.write(response.audio_content)
-                logger.info(f"Audio content written to simplified path '{simple_output_file}'")
-                return os.path.relpath(simple_output_file)
-            except Exception as e2:
-                logger.error(f"Failed to write audio file even with simplified path: {e2}")
-                return None
-    except Exception as e:
-        logger.error(f"Error generating voice file for article {article_id} ({headline}): {e}")
-        return None
+                audio_content = await synthesize_job_async(client, job)
+            except Exception as e:
+                logger.error(f"Error generating voice file for article {job['article_id']} ({job['headline']}): {e}")
+                return
+        if audio_content is None:
+            return
+        voice_files[i] = finish_voice_job(job, audio_content)
+        
+        # Articles with the same summary share the audio just written, linked from the cache entry
+        # (or written afresh if caching failed); link_or_copy and finish_voice_job both replace
+        # the destination rather than writing into it
+        for duplicate_index, duplicate in group[1:]:
+            if os.path.exists(job["cache_file"]):
+                try:
+                    link_or_copy(job["cache_file"], duplicate["output_file"])
+                    voice_files[duplicate_index] = os.path.relpath(duplicate["output_file"])
+                    logger.info(f"Reusing audio of article {job['article_id']} for article {duplicate['article_id']}")
+                    continue
+                except OSError as e:
+                    logger.error(f"Error linking audio file {duplicate['output_file']}: {e}")
+            voice_files[duplicate_index] = finish_voice_job(duplicate, audio_content)
+    
+    try:
+        await asyncio.gather(*(run(group) for group in jobs.values()))
+    finally:
+        # Close the channel before asyncio.run tears the loop down
+        await client.transport.close()
+    return voice_files
 
 def get_latest_articles_file():
     """Find the latest articles JSON file in the output directory"""
@@ -229,76 +550,126 @@ def get_latest_articles_file():
     logger.info(f"Found latest articles file: {latest_file}")
     return latest_file
 
-def translate_article(article, lang_code):
-    """Translate specific fields of an article"""
-    # Make a copy of the article to preserve original structure
+def article_texts(article):
+    """Return the texts of an article that get translated (fields, then tags)"""
+    texts = [article[field] for field in TRANSLATED_FIELDS if field in article and article[field]]
+    texts.extend(article.get("tags") or [])
+    return texts
+
+def chunk_by_chars(payload, max_chars=None, max_segments=None):
+    """Yield sub-lists of payload that stay under the request size and segment limits"""
+    max_chars = max_chars or TRANSLATE_BATCH_CHARS
+    max_segments = max_segments or TRANSLATE_BATCH_SEGMENTS
+    batch, batch_chars = [], 0
+    for text in payload:
+        size = len(text)
+        if batch and (len(batch) >= max_segments or batch_chars + size > max_chars):
+            yield batch
+            batch, batch_chars = [], 0
+        batch.append(text)
+        batch_chars += size
+    if batch:
+        yield batch
+
+@TRANSLATE_RETRY
+def translate_request(batch, lang_code):
+    """Send one Translate request, retried with jittered backoff on transient errors"""
+    # Shared limiter keeps all threads together under the API quota, retries included
+    translate_rate_limiter.acquire()
+    response = translate_client.translate_text(request={
+        "parent": translate_parent,
+        "contents": batch,
+        "mime_type": "text/plain",
+        "target_language_code": lang_code,
+    })
+    return [translation.translated_text for translation in response.translations]
+
+def translate_batch(texts, lang_code, source_lang='auto'):
+    """
+    Translate many texts with as few Translate requests as possible.
+    
+    Args:
+        texts: Texts to translate (duplicates are translated once)
+        lang_code: Language code to translate to
+        source_lang: Source language code used for the cache key
+    
+    Returns:
+        Dictionary mapping each translated text to its translation; texts whose batch failed are left out
+    """
+    results = translation_cache.get_many(source_lang, lang_code, texts)
+    # Length-sorted so each request carries texts of similar size
+    pending = sorted({text for text in texts if text not in results}, key=len)
+    if not pending:
+        return results
+    
+    start_time = time.time()
+    translated_count = 0
+    request_count = 0
+    for batch in chunk_by_chars(pending):
+        request_count += 1
+        
+        try:
+            translations = translate_request(batch, lang_code)
+        except Exception as e:
+            logger.error(f"Error translating batch of {len(batch)} texts: {e}")
+            continue
+        
+        pairs = list(zip(batch, translations))
+        results.update(pairs)
+        translation_cache.put_many(source_lang, lang_code, pairs)
+        translated_count += len(pairs)
+    
+    elapsed = time.time() - start_time
+    logger.info(f"Batch translated {translated_count} texts to {lang_code} in {request_count} requests ({translated_count / elapsed if elapsed else 0:.1f} texts/s)")
+    return results
+
+def translate_article(article, lang_code, prefetched=None, translated_at=None):
+    """Translate specific fields of an article in one batched request, using prefetched translations when given"""
+    # Shallow copy: the same source article is shared by every language being translated,
+    # so it must not be mutated, but untouched fields like content are not duplicated
     translated_article = article.copy()
-    article_id = hashlib.md5(article.get('url', '').encode()).hexdigest()[:10]
+    article_id = get_article_id(article)
     headline = article.get('headline', '')[:30]
     
-    # Fields to translate
-    fields = ["headline", "summary", "author", "source", "category"]
+    # Every field and tag not already prefetched goes out in a single batch
+    source_lang = article.get('language') or 'auto'
+    texts = article_texts(article)
+    prefetched = prefetched if prefetched is not None else {}
+    missing = [text for text in texts if text not in prefetched]
+    fetched = {}
+    if missing:
+        logger.info(f"Translating {len(missing)} texts for article {article_id} ({headline})")
+        fetched = translate_batch(missing, lang_code, source_lang)
+        failed = sum(1 for text in missing if text not in fetched)
+        if failed:
+            # Use original text if translation fails
+            logger.error(f"Error translating {failed} texts for article {article_id} ({headline}), keeping original text")
+    
+    def translated_text(text):
+        if text in prefetched:
+            return prefetched[text]
+        return fetched.get(text, text)
     
     # Translate each field if it exists
-    for field in fields:
+    for field in TRANSLATED_FIELDS:
         if field in article and article[field]:
-            try:
-                logger.info(f"Translating {field} for article {article_id} ({headline})")
-                
-                # Rate limiting to avoid quota issues (2 requests per second)
-                time.sleep(0.5)
-                
-                # Retry mechanism for translation
-                max_retries = 3
-                retry_delay = 2
-                
-                for retry in range(max_retries):
-                    try:
-                        translated_article[field] = translate_client.translate(
-                            article[field], target_language=lang_code
-                        )["translatedText"]
-                        logger.info(f"Successfully translated {field}")
-                        break
-                    except Exception as e:
-                        if retry < max_retries - 1:
-                            logger.warning(f"Translation attempt {retry+1} failed, retrying in {retry_delay} seconds: {e}")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                        else:
-                            logger.error(f"Error translating {field} after {max_retries} attempts: {e}")
-                            raise
-            except Exception as e:
-                logger.error(f"Error translating {field} for article {article_id} ({headline}): {e}")
-                # Use original text if translation fails
-                translated_article[field] = article[field]
+            translated_article[field] = translated_text(article[field])
     
     # Handle tags separately (they're a list)
     if "tags" in article and article["tags"]:
-        translated_tags = []
-        logger.info(f"Translating {len(article['tags'])} tags for article {article_id} ({headline})")
-        for tag in article["tags"]:
-            try:
-                # Rate limiting to avoid quota issues (5 tags per second)
-                time.sleep(0.2)
-                
-                translated_tag = translate_client.translate(
-                    tag, target_language=lang_code
-                )["translatedText"]
-                translated_tags.append(translated_tag)
-            except Exception as e:
-                logger.error(f"Error translating tag '{tag}' for article {article_id} ({headline}): {e}")
-                translated_tags.append(tag)  # Keep original if translation fails
-        
-        translated_article["tags"] = translated_tags
-        logger.info(f"Successfully translated {len(translated_tags)} tags")
+        translated_article["tags"] = [translated_text(tag) for tag in article["tags"]]
     
     # Add translation metadata
     translated_article["translated"] = True
-    translated_article["translated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    translated_article["translated_at"] = translated_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     translated_article["language"] = lang_code
     
     return translated_article
 
+def translated_index_path(lang_code):
+    """Return the path of the append-only index of article IDs translated to a language"""
+    return os.path.join("output", "translations", lang_code, "index.txt")
+
 def get_previously_translated_articles(lang_code):
     """
     Get a set of article IDs that have already been translated to the specified language.
@@ -309,6 +680,41 @@ def get_previously_translated_articles(lang_code):
     Returns:
         Set of article IDs that have already been translated
     """
+    index_path = translated_index_path(lang_code)
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return set(f.read().split())
+    except FileNotFoundError:
+        pass
+    
+    # No index yet: build it once from the translation files written so far
+    translated_ids = scan_translated_article_ids(lang_code)
+    if translated_ids:
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write("".join(f"{article_id}\n" for article_id in sorted(translated_ids)))
+        logger.info(f"Built translated article index {index_path} with {len(translated_ids)} IDs")
+    return translated_ids
+
+def record_translated_articles(lang_code, articles):
+    """Append the IDs of newly translated articles to the language's index"""
+    index_path = translated_index_path(lang_code)
+    with open(index_path, 'a', encoding='utf-8') as f:
+        f.write("".join(f"{get_article_id(article)}\n" for article in articles))
+
+def get_article_id(article):
+    """Return an article's ID, derived from its URL when not present"""
+    if 'article_id' in article:
+        return article['article_id']
+    return hashlib.md5(article.get('url', '').encode()).hexdigest()[:10]
+
+def assign_article_ids(articles):
+    """Store each article's ID on it in place so later steps only do a dict lookup"""
+    for article in articles:
+        if 'article_id' not in article:
+            article['article_id'] = get_article_id(article)
+
+def scan_translated_article_ids(lang_code):
+    """Collect the article IDs stored in every translation file of a language"""
     translated_ids = set()
     
     # Check if translations directory exists
@@ -318,7 +724,11 @@ def get_previously_translated_articles(lang_code):
         return translated_ids
     
     # Find all translation files for this language
-    translation_files = glob.glob(f"{translation_dir}/articles_{lang_code}_*.json")
+    prefix = f"articles_{lang_code}_"
+    translation_files = [
+        os.path.join(translation_dir, name) for name in os.listdir(translation_dir)
+        if name.startswith(prefix) and name.endswith(TRANSLATION_SUFFIXES)
+    ]
     if not translation_files:
         logger.info(f"No translation files found for {lang_code}")
         return translated_ids
@@ -326,169 +736,234 @@ def get_previously_translated_articles(lang_code):
     # Process each translation file
     for file_path in translation_files:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                translated_articles = json.load(f)
-                
-                # Extract article IDs
-                for article in translated_articles:
-                    if 'article_id' in article:
-                        translated_ids.add(article['article_id'])
-                    elif 'url' in article:
-                        # Generate ID from URL if article_id not present
-                        article_id = hashlib.md5(article['url'].encode()).hexdigest()[:10]
-                        translated_ids.add(article_id)
-                
+            # Extract article IDs
+            for article in iter_translation_file(file_path):
+                if 'article_id' in article or 'url' in article:
+                    translated_ids.add(get_article_id(article))
+            
             logger.info(f"Found {len(translated_ids)} previously translated articles in {file_path}")
         except Exception as e:
             logger.error(f"Error reading translation file {file_path}: {e}")
     
     return translated_ids
 
-def process_all_languages(articles, selected_languages=None):
+def translate_language(articles, lang_code, retranslate_ids=None):
     """
-    Process all supported languages or selected languages.
+    Translate articles to one language, generate their voice files and save the result.
+    
+    Args:
+        articles: List of articles to translate
+        lang_code: Language code to translate to
+        retranslate_ids: IDs of articles to translate again even if already translated (their content changed)
+    
+    Returns:
+        Tuple of (output file, translated articles, voice stats); the file is None when nothing new was translated
+    """
+    logger.info(f"Starting processing for language: {lang_code} ({target_languages[lang_code]['name']})")
+    
+    # Get previously translated articles
+    previously_translated = get_previously_translated_articles(lang_code)
+    if retranslate_ids:
+        previously_translated -= set(retranslate_ids)
+    logger.info(f"Found {len(previously_translated)} previously translated articles for {lang_code}")
+    
+    # Create output directories
+    ensure_dir(os.path.join("output", "translations", lang_code, "voice"))
+    
+    # Filter articles that need translation
+    articles_to_translate = [article for article in articles if get_article_id(article) not in previously_translated]
+    skipped = len(articles) - len(articles_to_translate)
+    if skipped:
+        logger.info(f"Skipping {skipped} already translated articles for {lang_code}")
+    
+    # Check if there are any new articles to translate
+    if not articles_to_translate:
+        logger.info(f"No new articles to translate for {lang_code}")
+        return None, [], None
+        
+    logger.info(f"Found {len(articles_to_translate)} new articles to translate for {lang_code}")
+    
+    # Translate every text of every article up front in a few batched requests
+    prefetched = {}
+    sources = {}
+    for article in articles_to_translate:
+        sources.setdefault(article.get('language') or 'auto', []).extend(article_texts(article))
+    for source_lang, texts in sources.items():
+        # Identical texts (repeated tags, bylines, sources) are looked up and translated once
+        prefetched.update(translate_batch(list(dict.fromkeys(texts)), lang_code, source_lang))
+    
+    # Translate articles and generate voice files
+    total = len(articles_to_translate)
+    translated_articles = [None] * total
+    start_time = time.time()
+    voice_success_count = 0
+    voice_failure_count = 0
+    
+    # Articles fully covered by the prefetch are plain dict lookups; only those whose
+    # batch failed go back to the API, on a thread pool
+    translated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    retry_indexes = []
+    for i, article in enumerate(articles_to_translate):
+        if all(text in prefetched for text in article_texts(article)):
+            translated_articles[i] = translate_article(article, lang_code, prefetched, translated_at)
+        else:
+            retry_indexes.append(i)
+    if retry_indexes:
+        logger.info(f"Retrying translation of {len(retry_indexes)} articles for {lang_code}")
+        with ThreadPoolExecutor(max_workers=TRANSLATE_CONCURRENCY, thread_name_prefix=f"translate-{lang_code}") as translate_pool:
+            translate_futures = {
+                translate_pool.submit(translate_article, articles_to_translate[i], lang_code, prefetched, translated_at): i
+                for i in retry_indexes
+            }
+            for future in as_completed(translate_futures):
+                translated_articles[translate_futures[future]] = future.result()
+    logger.info(f"Translated {total} articles for {lang_code} in {time.time() - start_time:.1f}s")
+    
+    # Generate voice files for the translated summaries with the async TTS client
+    voice_files = asyncio.run(generate_voice_files_async(translated_articles, lang_code))
+    for i, voice_file in enumerate(voice_files):
+        if voice_file:
+            translated_articles[i]['voice_file'] = voice_file
+            voice_success_count += 1
+        else:
+            voice_failure_count += 1
+            logger.warning(f"Failed to generate voice file for article {i+1}/{total}")
+    elapsed = time.time() - start_time
+    logger.info(f"Processed {total} articles for {lang_code} in {elapsed:.1f}s ({elapsed/60:.1f}min)")
+    
+    # Voice generation statistics
+    voice_stats = {
+        "total_articles": len(articles_to_translate),
+        "voice_success": voice_success_count,
+        "voice_failure": voice_failure_count,
+        "success_rate": f"{(voice_success_count / len(articles_to_translate) * 100):.1f}%" if articles_to_translate else "N/A"
+    }
+    
+    # Only save if there are translated articles
+    if not translated_articles:
+        logger.info(f"No new articles translated for {lang_code}")
+        return None, [], voice_stats
+    
+    # Save translated articles
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = f"output/translations/{lang_code}/articles_{lang_code}_{timestamp}{TRANSLATION_SUFFIX}"
+    write_translation_file(output_file, translated_articles)
+    update_latest_link(output_file)
+    record_translated_articles(lang_code, translated_articles)
+    
+    logger.info(f"Saved {len(translated_articles)} translated articles to {output_file}")
+    logger.info(f"Voice generation: {voice_success_count} successful, {voice_failure_count} failed")
+    
+    # Total processing time
+    total_time = time.time() - start_time
+    logger.info(f"Finished processing {lang_code} in {total_time:.1f}s ({total_time/60:.1f}min)")
+    
+    return output_file, translated_articles, voice_stats
+
+def log_voice_generation_stats(voice_generation_stats):
+    """Log per-language voice generation statistics"""
+    if voice_generation_stats:
+        logger.info("\n=== VOICE GENERATION STATISTICS ===")
+        for lang, stats in voice_generation_stats.items():
+            logger.info(f"{lang} ({target_languages[lang]['name']}): {stats['voice_success']}/{stats['total_articles']} successful ({stats['success_rate']})")
+
+def translate_all(articles, selected_languages=None, max_articles=None, retranslate_ids=None):
+    """
+    Translate articles in-process and return the results without re-reading them from disk.
     
     Args:
         articles: List of articles to translate
         selected_languages: List of language codes to process (if None, all languages)
+        max_articles: Maximum number of articles to translate (None for all)
+        retranslate_ids: IDs of articles to translate again even if already translated
     
     Returns:
-        Dictionary of language codes mapped to output files
+        Dictionary of language codes mapped to (output file, translated articles)
     """
-    result_files = {}
+    if max_articles and 0 < max_articles < len(articles):
+        logger.info(f"Limiting to {max_articles} articles")
+        articles = articles[:max_articles]
+    
+    # Hash each article's URL once here rather than in every language
+    assign_article_ids(articles)
+    
+    results = {}
     voice_generation_stats = {}
     
     # Determine which languages to process
     languages_to_process = selected_languages if selected_languages else target_languages.keys()
     logger.info(f"Processing {len(languages_to_process)} languages: {', '.join(languages_to_process)}")
     
+    supported = []
     for lang_code in languages_to_process:
         if lang_code not in target_languages:
             logger.warning(f"Skipping unsupported language: {lang_code}")
             continue
-            
-        logger.info(f"Starting processing for language: {lang_code} ({target_languages[lang_code]['name']})")
-        
-        # Get previously translated articles
-        previously_translated = get_previously_translated_articles(lang_code)
-        logger.info(f"Found {len(previously_translated)} previously translated articles for {lang_code}")
-        
-        # Create output directories
-        os.makedirs("output/translations", exist_ok=True)
-        os.makedirs(f"output/translations/{lang_code}", exist_ok=True)
-        os.makedirs(f"output/translations/{lang_code}/voice", exist_ok=True)
-        
-        # Filter articles that need translation
-        articles_to_translate = []
-        for article in articles:
-            # Generate article ID if not present
-            if 'article_id' not in article:
-                article_id = hashlib.md5(article.get('url', '').encode()).hexdigest()[:10]
-            else:
-                article_id = article['article_id']
-                
-            # Check if article has already been translated
-            if article_id in previously_translated:
-                logger.info(f"Skipping article {article_id} ({article.get('headline', '')[:30]}) - already translated")
+        supported.append(lang_code)
+    if not supported:
+        return results
+    
+    # Languages are independent and network-bound, so translate them concurrently
+    max_workers = min(len(supported), LANGUAGE_CONCURRENCY) if LANGUAGE_CONCURRENCY > 0 else len(supported)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translate") as executor:
+        futures = {executor.submit(translate_language, articles, lang_code, retranslate_ids): lang_code for lang_code in supported}
+        for done, future in enumerate(as_completed(futures), 1):
+            lang_code = futures[future]
+            try:
+                output_file, translated_articles, voice_stats = future.result()
+            except Exception as e:
+                logger.error(f"Error processing language {lang_code}: {e}")
                 continue
-                
-            articles_to_translate.append(article)
-        
-        # Check if there are any new articles to translate
-        if not articles_to_translate:
-            logger.info(f"No new articles to translate for {lang_code}")
-            continue
-            
-        logger.info(f"Found {len(articles_to_translate)} new articles to translate for {lang_code}")
-        
-        # Translate articles and generate voice files
-        translated_articles = []
-        start_time = time.time()
-        voice_success_count = 0
-        voice_failure_count = 0
-        
-        for i, article in enumerate(articles_to_translate):
-            logger.info(f"Processing article {i+1}/{len(articles_to_translate)} for {lang_code}")
-            
-            # Translate the article
-            translated_article = translate_article(article, lang_code)
-            
-            # Generate voice file for the translated summary
-            voice_file = generate_voice_file(translated_article, lang_code)
-            if voice_file:
-                translated_article['voice_file'] = voice_file
-                voice_success_count += 1
-            else:
-                voice_failure_count += 1
-                logger.warning(f"Failed to generate voice file for article {i+1}/{len(articles_to_translate)}")
-            
-            translated_articles.append(translated_article)
-            
-            # Log progress periodically
-            if (i+1) % 5 == 0:
-                elapsed = time.time() - start_time
-                avg_time = elapsed / (i+1)
-                remaining = avg_time * (len(articles_to_translate) - (i+1))
-                logger.info(f"Progress: {i+1}/{len(articles_to_translate)} articles processed for {lang_code}")
-                logger.info(f"Elapsed time: {elapsed:.1f}s, Avg per article: {avg_time:.1f}s")
-                logger.info(f"Estimated remaining time: {remaining:.1f}s ({remaining/60:.1f}min)")
-        
-        # Save voice generation statistics
-        voice_generation_stats[lang_code] = {
-            "total_articles": len(articles_to_translate),
-            "voice_success": voice_success_count,
-            "voice_failure": voice_failure_count,
-            "success_rate": f"{(voice_success_count / len(articles_to_translate) * 100):.1f}%" if articles_to_translate else "N/A"
-        }
-        
-        # Only save if there are translated articles
-        if translated_articles:
-            # Save translated articles
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"output/translations/{lang_code}/articles_{lang_code}_{timestamp}.json"
-            
-            with open(output_file, "w", encoding="utf-8") as file:
-                json.dump(translated_articles, file, ensure_ascii=False, indent=2)
-            
-            logger.info(f"Saved {len(translated_articles)} translated articles to {output_file}")
-            logger.info(f"Voice generation: {voice_success_count} successful, {voice_failure_count} failed")
-            result_files[lang_code] = output_file
-            
-            # Total processing time
-            total_time = time.time() - start_time
-            logger.info(f"Finished processing {lang_code} in {total_time:.1f}s ({total_time/60:.1f}min)")
-        else:
-            logger.info(f"No new articles translated for {lang_code}")
+            logger.info(f"Completed {lang_code} ({done}/{len(supported)} languages)")
+            if voice_stats:
+                voice_generation_stats[lang_code] = voice_stats
+            if output_file:
+                results[lang_code] = (output_file, translated_articles)
     
-    # Log voice generation statistics
-    if voice_generation_stats:
-        logger.info("\n=== VOICE GENERATION STATISTICS ===")
-        for lang, stats in voice_generation_stats.items():
-            logger.info(f"{lang} ({target_languages[lang]['name']}): {stats['voice_success']}/{stats['total_articles']} successful ({stats['success_rate']})")
+    log_voice_generation_stats(voice_generation_stats)
+    return results
+
+def process_all_languages(articles, selected_languages=None):
+    """
+    Process all supported languages or selected languages.
+    
+    Args:
+        articles: List of articles to translate
+        selected_languages: List of language codes to process (if None, all languages)
     
-    return result_files
+    Returns:
+        Dictionary of language codes mapped to output files
+    """
+    results = translate_all(articles, selected_languages)
+    return {lang: output_file for lang, (output_file, _) in results.items()}
 
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Translate articles to Indian languages')
     parser.add_argument('languages', help='Language codes to translate to (comma-separated) or "all" for all languages')
     parser.add_argument('--max', '-m', type=int, help='Maximum number of articles to translate', default=None)
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the translation cache')
+    parser.add_argument('--input', '-i', help='Articles file to translate (default: the latest articles file)', default=None)
     args = parser.parse_args()
     
+    if args.no_cache:
+        translation_cache.disable()
+    
     # Parse language input
     lang_input = args.languages.strip().lower()
     
-    # Find latest articles file
-    try:
-        input_file = get_latest_articles_file()
-    except FileNotFoundError as e:
-        logger.error(f"Error: {e}")
-        sys.exit(1)
+    # Find latest articles file unless one was given
+    input_file = args.input
+    if not input_file:
+        try:
+            input_file = get_latest_articles_file()
+        except FileNotFoundError as e:
+            logger.error(f"Error: {e}")
+            sys.exit(1)
     
     # Read latest articles file
     try:
-        with open(input_file, "r", encoding="utf-8") as file:
-            articles = json.load(file)
+        articles = read_json_file(input_file)
         logger.info(f"Loaded {len(articles)} articles from {input_file}")
         
         # Limit articles if max is specified
@@ -0,0 +1,127 @@
+"""
+Persistent translation cache.
+
+Google Translate results are stored in SQLite keyed by (source language, target language,
+sha1(text)) so repeated headlines, tags and re-runs over the same articles skip the API call.
+"""
+import os
+import hashlib
+import functools
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger("translation_cache")
+
+# Versioned by API: Translate v2 returned HTML-escaped text, v3 plain text, so v2 entries are not reused
+CACHE_FILE = os.path.join("output", "translation_cache_v3.sqlite3")
+
+# SQLite allows 999 bound parameters per statement in older builds
+MAX_LOOKUP_BATCH = 900
+
+# In-memory LRU in front of SQLite so same-run repeats skip the database too
+MEMORY_CACHE_SIZE = 50_000
+
+_lock = threading.Lock()
+_conn = None
+_enabled = True
+_memory = OrderedDict()
+
+def _remember(key, translated):
+    """Add a translation to the in-memory LRU (caller holds _lock)"""
+    _memory[key] = translated
+    _memory.move_to_end(key)
+    if len(_memory) > MEMORY_CACHE_SIZE:
+        _memory.popitem(last=False)
+
+def disable():
+    """Turn the cache off for this process (used by --no-cache)"""
+    global _enabled
+    _enabled = False
+    logger.info("Translation cache disabled")
+
+@functools.lru_cache(maxsize=65536)
+def text_hash(text):
+    """Return the cache hash for a piece of source text (memoized: the same texts are looked up for every language)"""
+    return hashlib.sha1(text.encode('utf-8')).digest()
+
+def get_connection():
+    """Open the cache database once and share it between threads"""
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        conn = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "src TEXT NOT NULL, tgt TEXT NOT NULL, hash BLOB NOT NULL, translated TEXT NOT NULL, "
+            "UNIQUE (src, tgt, hash))"
+        )
+        conn.commit()
+        _conn = conn
+    return _conn
+
+def get_many(src, tgt, texts):
+    """Return a dict mapping each cached text in texts to its translation"""
+    if not _enabled or not texts:
+        return {}
+    hashes = {}
+    for text in texts:
+        hashes.setdefault(text_hash(text), text)
+
+    found = {}
+    keys = []
+    try:
+        with _lock:
+            for h, text in hashes.items():
+                translated = _memory.get((src, tgt, h))
+                if translated is None:
+                    keys.append(h)
+                else:
+                    _memory.move_to_end((src, tgt, h))
+                    found[text] = translated
+            if not keys:
+                return found
+            
+            conn = get_connection()
+            for i in range(0, len(keys), MAX_LOOKUP_BATCH):
+                batch = keys[i:i + MAX_LOOKUP_BATCH]
+                rows = conn.execute(
+                    "SELECT hash, translated FROM translations WHERE src = ? AND tgt = ? "
+                    f"AND hash IN ({','.join('?' * len(batch))})",
+                    (src, tgt, *batch)
+                ).fetchall()
+                for h, translated in rows:
+                    found[hashes[h]] = translated
+                    _remember((src, tgt, h), translated)
+    except sqlite3.Error as e:
+        logger.error(f"Error reading translation cache: {e}")
+    return found
+
+def get(src, tgt, text):
+    """Return the cached translation of text, or None"""
+    return get_many(src, tgt, [text]).get(text)
+
+def put_many(src, tgt, pairs):
+    """Store (text, translated) pairs in the cache"""
+    if not _enabled or not pairs:
+        return
+    rows = [(src, tgt, text_hash(text), translated) for text, translated in pairs]
+    try:
+        with _lock:
+            for row in rows:
+                _remember(row[:3], row[3])
+            conn = get_connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations (src, tgt, hash, translated) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Error writing translation cache: {e}")
+
+def put(src, tgt, text, translated):
+    """Store one translation in the cache"""
+    put_many(src, tgt, [(text, translated)])
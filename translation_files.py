@@ -0,0 +1,160 @@
+"""
+Reading and writing per-language translation files.
+
+Translations are stored one article per line (.jsonl), zstd-compressed (.jsonl.zst) when the
+zstandard package is installed. Older .json array files are still readable.
+"""
+import io
+import os
+import mmap
+import shutil
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Suffix used for newly written files, and every suffix the readers understand
+TRANSLATION_SUFFIX = ".jsonl.zst" if zstandard is not None else ".jsonl"
+TRANSLATION_SUFFIXES = (".jsonl.zst", ".jsonl", ".json")
+
+def dumps_line(obj):
+    """Serialize obj as one newline-terminated UTF-8 JSON line"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+def loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Files at least this large are parsed from a memory map instead of a read() buffer
+JSON_MMAP_THRESHOLD = 50 * 1024 * 1024
+
+def read_json_file(path):
+    """Parse a whole JSON file, memory-mapping it when it is large and orjson is available"""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is None or size < JSON_MMAP_THRESHOLD:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def manifest_path(path):
+    """Return the path of the small manifest describing a translation file"""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, "manifests", f"{name}.json")
+
+def article_manifest_entry(manifest, article):
+    """Add one article to a manifest being built"""
+    manifest["count"] += 1
+    if "voice_file" in article:
+        manifest["voice_count"] += 1
+    if "article_id" in article:
+        manifest["ids"].append(article["article_id"])
+
+def translation_manifest(articles):
+    """Return the manifest (article count, voice file count, article IDs) for a list of articles"""
+    manifest = {"count": 0, "voice_count": 0, "ids": []}
+    for article in articles:
+        article_manifest_entry(manifest, article)
+    return manifest
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file and rename so readers never see a partial file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def write_translation_file(path, articles):
+    """Write articles to path, one JSON line each (compressed when path ends in .zst), plus its manifest"""
+    manifest = {"count": 0, "voice_count": 0, "ids": []}
+    
+    # Write to a temp file and rename so readers never see a partial file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb", buffering=1 << 20) as raw:
+        if path.endswith(".zst"):
+            with zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False) as writer:
+                for article in articles:
+                    writer.write(dumps_line(article))
+                    article_manifest_entry(manifest, article)
+        else:
+            for article in articles:
+                raw.write(dumps_line(article))
+                article_manifest_entry(manifest, article)
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(tmp_path, path)
+    
+    # Counts computed in the same pass, so readers can summarize without parsing the articles
+    manifest_file = manifest_path(path)
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+    write_atomic(manifest_file, json.dumps(manifest).encode("utf-8"))
+    return manifest
+
+def read_translation_manifest(path):
+    """Return the manifest for a translation file, building it from the articles when none was written"""
+    try:
+        with open(manifest_path(path), "rb") as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        return translation_manifest(iter_translation_file(path))
+
+def latest_link_path(directory, suffix=TRANSLATION_SUFFIX):
+    """Return the path of the stable 'latest' link for a language directory"""
+    return os.path.join(directory, f"latest{suffix}")
+
+def update_latest_link(path):
+    """Atomically point the directory's 'latest' link at a freshly written translation file"""
+    directory, name = os.path.split(path)
+    suffix = next(s for s in TRANSLATION_SUFFIXES if name.endswith(s))
+    link = latest_link_path(directory, suffix)
+    tmp_link = os.path.join(directory, f".latest{suffix}.tmp")
+    try:
+        if os.path.lexists(tmp_link):
+            os.remove(tmp_link)
+        os.symlink(name, tmp_link)
+    except OSError:
+        # Symlinks may be unavailable (e.g. Windows without privileges); fall back to a copy
+        shutil.copyfile(path, tmp_link)
+    os.replace(tmp_link, link)
+
+def latest_translation_file(directory):
+    """Return the translation file the directory's 'latest' link points at, or None"""
+    for suffix in TRANSLATION_SUFFIXES:
+        link = latest_link_path(directory, suffix)
+        if os.path.exists(link):
+            return os.path.relpath(os.path.realpath(link))
+    return None
+
+def iter_translation_file(path):
+    """Yield the articles stored in a translation file without loading the whole list"""
+    if path.endswith(".json"):
+        # Legacy format: a single JSON array
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+        return
+
+    with open(path, "rb") as raw:
+        if path.endswith(".zst"):
+            stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+        else:
+            stream = raw
+        for line in stream:
+            if line.strip():
+                yield loads(line)
+
+def read_translation_file(path):
+    """Return the list of articles stored in a translation file"""
+    return list(iter_translation_file(path))
@@ -0,0 +1,7 @@
+"""WSGI entry point for production servers, e.g.:
+
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:$PORT wsgi:application
+"""
+from api import app
+
+application = app